@@ -155,7 +155,7 @@ def delete_audio_file_endpoint(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    if not delete_audio_file(db, audio_id):
+    if not delete_audio_file(db, audio_id, current_user.id):
         raise HTTPException(status_code=404, detail=MessageConstants.AUDIO_NOT_FOUND)
 
     return ApiResponse(success=True, message=MessageConstants.AUDIO_DELETED_SUCCESS, data={})
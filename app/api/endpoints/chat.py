@@ -20,6 +20,7 @@ from app.schemas.chat import (
 from app.schemas.common import ApiResponse
 from app.services import chat as chat_service
 from app.services.conversation import check_conversation_active, get_conversation
+from app.services.sse_hub import sse_hub
 from app.utils.auth import get_current_user
 from app.utils.logging import logger
 
@@ -99,47 +100,20 @@ async def chat_sse_endpoint(
         # Send initial connection event
         yield f"data: {json.dumps({'type': 'connected', 'conversation_id': str(conversation_id)})}\n\n"
 
-        # Subscribe to Redis channel for this conversation
-        redis_client = await chat_service.get_async_redis_client()
-        # For now, we'll use a general channel - in production you'd want user-specific channels
+        # Attach to the shared SSE hub instead of opening a pubsub connection per client
         channel = f"conversation:{conversation_id}:messages"
+        queue = await sse_hub.subscribe(channel)
 
         try:
-            # Subscribe to Redis channel
-            pubsub = redis_client.pubsub()
-            await pubsub.subscribe(channel)
-
-            # Keep connection alive and listen for messages
+            # Frames (including heartbeats) are pre-formatted by the hub
             while True:
-                try:
-                    # Wait for message from Redis
-                    message = await pubsub.get_message(timeout=30.0)
-
-                    if message and message["type"] == "message":
-                        # Parse and forward the message
-                        data = json.loads(message["data"])
-                        yield f"data: {json.dumps(data)}\n\n"
-                    else:
-                        # Send heartbeat if no message received
-                        yield f"data: {json.dumps({'type': 'heartbeat'})}\n\n"
-
-                except asyncio.TimeoutError:
-                    # Send heartbeat on timeout
-                    yield f"data: {json.dumps({'type': 'heartbeat'})}\n\n"
-                except Exception as e:
-                    logger.error(f"SSE error: {e}")
-                    break
+                yield await queue.get()
 
         except asyncio.CancelledError:
             # Client disconnected
             pass
         finally:
-            # Cleanup Redis subscription
-            try:
-                await pubsub.unsubscribe(channel)
-                await pubsub.close()
-            except Exception:
-                pass
+            await sse_hub.unsubscribe(channel, queue)
 
     return StreamingResponse(
         event_generator(),
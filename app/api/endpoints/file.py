@@ -20,6 +20,8 @@ from app.schemas.file import (
     FilesWithMeetingPaginatedResponse,
     FilesWithProjectPaginatedResponse,
     FileUpdate,
+    FileUploadUrlApiResponse,
+    FileUploadUrlRequest,
     FileWithMeeting,
     FileWithProject,
 )
@@ -35,11 +37,34 @@ from app.services.file import (
     update_file,
     validate_file,
 )
+from app.services.upload import complete_file_upload, create_file_upload_slot
 from app.utils.auth import get_current_user
 from app.utils.logging import logger
+from app.utils.minio import UploadRejectedError
+from app.utils.pagination import next_cursor
 
 router = APIRouter(prefix=settings.API_V1_STR, tags=["File"])
 
+INDEXABLE_MIME_TYPES = [
+    "text/plain",
+    "application/pdf",
+    "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+]
+
+
+def _queue_file_indexing(file, user_id: uuid.UUID) -> bool:
+    """Trigger background indexing for supported file types."""
+    if file.mime_type not in INDEXABLE_MIME_TYPES:
+        logger.warning(f"Skipping indexing for unsupported file type: {file.mime_type}")
+        return False
+    logger.info(f"Queuing indexing task for file {file.id} ({file.filename})")
+    try:
+        index_file_task.delay(str(file.id), str(user_id))
+        logger.info("Indexing task queued successfully")
+    except Exception as e:
+        logger.error(f"Failed to queue indexing task: {e}")
+    return True
+
 
 @router.post("/files/upload", response_model=FileApiResponse)
 def upload_file_endpoint(
@@ -50,40 +75,27 @@ def upload_file_endpoint(
     current_user: User = Depends(get_current_user),
 ):
     try:
-        file_content = file.file.read()
-        file_size = len(file_content)
-
-        if not validate_file(file.filename, file.content_type, file_size):
+        # The size cap is enforced again while streaming; size is unknown for chunked request bodies
+        if not validate_file(file.filename, file.content_type, file.size or 0):
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=MessageConstants.VALIDATION_ERROR)
 
         file_data = FileCreate(
             filename=file.filename,
             mime_type=file.content_type,
-            size_bytes=file_size,
+            size_bytes=file.size,
             file_type="project" if project_id else "meeting",
             project_id=project_id,
             meeting_id=meeting_id,
         )
 
-        new_file = create_file(db, file_data, current_user.id, file_content)
+        try:
+            new_file = create_file(db, file_data, current_user.id, file.file)
+        except UploadRejectedError:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=MessageConstants.VALIDATION_ERROR)
         if not new_file:
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=MessageConstants.OPERATION_FAILED)
 
-        # Trigger background indexing for supported file types
-        supported_mimes = [
-            "text/plain",
-            "application/pdf",
-            "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-        ]
-        if file.content_type in supported_mimes:
-            logger.info(f"Queuing indexing task for file {new_file.id} ({new_file.filename})")
-            try:
-                index_file_task.delay(str(new_file.id), str(current_user.id))
-                logger.info("Indexing task queued successfully")
-            except Exception as e:
-                logger.error(f"Failed to queue indexing task: {e}")
-        else:
-            logger.warning(f"Skipping indexing for unsupported file type: {file.content_type}")
+        indexing_queued = _queue_file_indexing(new_file, current_user.id)
 
         return ApiResponse(
             success=True,
@@ -99,7 +111,80 @@ def upload_file_endpoint(
                 "uploaded_by": new_file.uploaded_by,
                 "created_at": new_file.created_at.isoformat(),
                 "storage_url": new_file.storage_url,
-                "indexing_queued": file.content_type in supported_mimes,
+                "indexing_queued": indexing_queued,
+            },
+        )
+    except HTTPException:
+        raise
+    except Exception:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=MessageConstants.OPERATION_FAILED)
+
+
+@router.post("/files/upload-url", response_model=FileUploadUrlApiResponse)
+def create_file_upload_url_endpoint(
+    request: FileUploadUrlRequest,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Reserve a file and return a presigned URL to upload its content straight to storage."""
+    try:
+        # The size cap is enforced again on completion against the stored object
+        if not validate_file(request.filename, request.content_type, request.size_bytes or 0):
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=MessageConstants.VALIDATION_ERROR)
+
+        file_data = FileCreate(
+            filename=request.filename,
+            mime_type=request.content_type,
+            size_bytes=request.size_bytes,
+            file_type="project" if request.project_id else "meeting",
+            project_id=request.project_id,
+            meeting_id=request.meeting_id,
+        )
+        new_file, upload_url = create_file_upload_slot(db, file_data, current_user.id)
+
+        return ApiResponse(
+            success=True,
+            message=MessageConstants.OPERATION_SUCCESSFUL,
+            data={
+                "id": new_file.id,
+                "upload_url": upload_url,
+                "method": "PUT",
+                "headers": {"Content-Type": request.content_type},
+                "expires_in": settings.MINIO_UPLOAD_URL_EXPIRE_SECONDS,
+            },
+        )
+    except HTTPException:
+        raise
+    except Exception:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=MessageConstants.OPERATION_FAILED)
+
+
+@router.post("/files/{file_id}/complete", response_model=FileApiResponse)
+def complete_file_upload_endpoint(
+    file_id: uuid.UUID,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Confirm a direct upload once the client has finished its PUT to storage."""
+    try:
+        file = complete_file_upload(db, file_id, current_user.id)
+        indexing_queued = _queue_file_indexing(file, current_user.id)
+
+        return ApiResponse(
+            success=True,
+            message=MessageConstants.FILE_UPLOADED_SUCCESS,
+            data={
+                "id": file.id,
+                "filename": file.filename,
+                "mime_type": file.mime_type,
+                "size_bytes": file.size_bytes,
+                "file_type": file.file_type,
+                "project_id": file.project_id,
+                "meeting_id": file.meeting_id,
+                "uploaded_by": file.uploaded_by,
+                "created_at": file.created_at.isoformat(),
+                "storage_url": file.storage_url,
+                "indexing_queued": indexing_queued,
             },
         )
     except HTTPException:
@@ -118,6 +203,8 @@ def get_files_endpoint(
     file_type: Optional[str] = None,
     project_id: Optional[uuid.UUID] = None,
     meeting_id: Optional[uuid.UUID] = None,
+    cursor: Optional[str] = None,
+    include_total: bool = False,
 ):
     try:
         filters = FileFilter(
@@ -127,9 +214,9 @@ def get_files_endpoint(
             meeting_id=meeting_id,
         )
 
-        files, total = get_files(db, filters, page, limit, current_user.id)
+        files, total = get_files(db, filters, page, limit, current_user.id, cursor=cursor, include_total=include_total)
 
-        pagination_meta = create_pagination_meta(page, limit, total)
+        pagination_meta = create_pagination_meta(page, limit, total, next_cursor(files, limit), cursor)
 
         return PaginatedResponse(
             success=True,
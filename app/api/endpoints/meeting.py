@@ -12,6 +12,7 @@ from app.models.user import User
 from app.schemas.common import ApiResponse, PaginatedResponse, create_pagination_meta
 from app.schemas.meeting import (
     AudioFileItem,
+    AudioUploadUrlRequest,
     MeetingApiResponse,
     MeetingAudioFilesPaginatedResponse,
     MeetingCreate,
@@ -39,12 +40,25 @@ from app.services.meeting import (
 )
 from app.services.meeting_note import get_meeting_note
 from app.services.transcript import get_transcript_by_meeting
+from app.services.upload import complete_audio_upload, create_audio_upload_slot
 from app.utils.auth import get_current_user
 from app.utils.logging import logger
 from app.utils.meeting import get_meeting_projects
+from app.utils.minio import UploadRejectedError, UploadTooLargeError
+from app.utils.pagination import next_cursor
 
 router = APIRouter(prefix=settings.API_V1_STR, tags=["Meeting"])
 
+MEETING_AUDIO_MAX_BYTES = 100 * 1024 * 1024
+MEETING_AUDIO_TYPES = {
+    "audio/mpeg",
+    "audio/wav",
+    "audio/mp3",
+    "audio/mp4",
+    "audio/x-m4a",
+    "audio/m4a",
+}
+
 
 @router.post("/meetings", response_model=MeetingApiResponse)
 def create_meeting_endpoint(
@@ -79,6 +93,8 @@ def get_meetings_endpoint(
     created_by: Optional[str] = Query(None),
     project_id: Optional[uuid.UUID] = Query(None),
     tag_ids: str = Query("", description="Comma-separated tag IDs"),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from pagination.next_cursor; overrides page"),
+    include_total: bool = Query(False, description="Also count all matches when paging by cursor"),
 ):
     """Get meetings with filtering and pagination"""
 
@@ -105,12 +121,12 @@ def get_meetings_endpoint(
             tag_ids=tag_id_list,
             project_id=project_id,
         )
-        meetings, total = get_meetings(db=db, user_id=current_user.id, filters=filters, page=page, limit=limit)
+        meetings, total = get_meetings(db=db, user_id=current_user.id, filters=filters, page=page, limit=limit, cursor=cursor, include_total=include_total)
 
         # Format response data
         meetings_data = [serialize_meeting(meeting) for meeting in meetings]
 
-        pagination_meta = create_pagination_meta(page, limit, total)
+        pagination_meta = create_pagination_meta(page, limit, total, next_cursor(meetings, limit), cursor)
 
         return PaginatedResponse(
             success=True,
@@ -281,37 +297,105 @@ def upload_meeting_audio_endpoint(
         # Validate meeting and access control
         validate_meeting_for_audio_operations(db, meeting_id, current_user.id)
 
-        # Validate file size and content type (≤ 100MB)
-        content = file.file.read()
-        size_bytes = len(content)
-        if size_bytes > 100 * 1024 * 1024:
+        # Validate file size and content type (≤ 100MB); the cap is enforced again while streaming
+        if file.size is not None and file.size > MEETING_AUDIO_MAX_BYTES:
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=MessageConstants.MEETING_FILE_TOO_LARGE)
 
-        allowed_types = {
-            "audio/mpeg",
-            "audio/wav",
-            "audio/mp3",
-            "audio/mp4",
-            "audio/x-m4a",
-            "audio/m4a",
-        }
-        if file.content_type not in allowed_types:
+        if file.content_type not in MEETING_AUDIO_TYPES:
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=MessageConstants.MEETING_UNSUPPORTED_AUDIO_TYPE)
 
         # Create and upload
-        audio = create_audio_file(
+        try:
+            audio = create_audio_file(
+                db,
+                meeting_id=meeting_id,
+                uploaded_by=current_user.id,
+                filename=file.filename,
+                content_type=file.content_type,
+                file_obj=file.file,
+                seq_order=seq_order,
+                max_size=MEETING_AUDIO_MAX_BYTES,
+            )
+        except UploadTooLargeError:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=MessageConstants.MEETING_FILE_TOO_LARGE)
+        except UploadRejectedError:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=MessageConstants.MEETING_UNSUPPORTED_AUDIO_TYPE)
+        if not audio:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=MessageConstants.MEETING_AUDIO_UPLOAD_FAILED)
+
+        # Enqueue Celery task (mock ASR)
+        async_result = process_audio_task.delay(str(audio.id), str(current_user.id))
+
+        return ApiResponse(
+            success=True,
+            message=MessageConstants.MEETING_AUDIO_UPLOADED_SUCCESS,
+            data={
+                "audio_file_id": str(audio.id),
+                "storage_url": audio.file_url,
+                "task_id": async_result.id if async_result else None,
+            },
+        )
+    except HTTPException:
+        raise
+    except Exception:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=MessageConstants.OPERATION_FAILED)
+
+
+@router.post("/meetings/{meeting_id}/audio-files/upload-url", response_model=ApiResponse[dict])
+def create_meeting_audio_upload_url_endpoint(
+    meeting_id: uuid.UUID,
+    request: AudioUploadUrlRequest,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Reserve an audio file and return a presigned URL to upload the recording straight to storage."""
+    try:
+        validate_meeting_for_audio_operations(db, meeting_id, current_user.id)
+
+        if request.size_bytes is not None and request.size_bytes > MEETING_AUDIO_MAX_BYTES:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=MessageConstants.MEETING_FILE_TOO_LARGE)
+        if request.content_type not in MEETING_AUDIO_TYPES:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=MessageConstants.MEETING_UNSUPPORTED_AUDIO_TYPE)
+
+        audio, upload_url = create_audio_upload_slot(
             db,
             meeting_id=meeting_id,
             uploaded_by=current_user.id,
-            filename=file.filename,
-            content_type=file.content_type,
-            file_bytes=content,
-            seq_order=seq_order,
+            filename=request.filename,
+            content_type=request.content_type,
+            max_size=MEETING_AUDIO_MAX_BYTES,
+            seq_order=request.seq_order,
         )
-        if not audio:
-            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=MessageConstants.MEETING_AUDIO_UPLOAD_FAILED)
 
-        # Enqueue Celery task (mock ASR)
+        return ApiResponse(
+            success=True,
+            message=MessageConstants.OPERATION_SUCCESSFUL,
+            data={
+                "audio_file_id": str(audio.id),
+                "upload_url": upload_url,
+                "method": "PUT",
+                "headers": {"Content-Type": request.content_type},
+                "expires_in": settings.MINIO_UPLOAD_URL_EXPIRE_SECONDS,
+            },
+        )
+    except HTTPException:
+        raise
+    except Exception:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=MessageConstants.OPERATION_FAILED)
+
+
+@router.post("/meetings/{meeting_id}/audio-files/{audio_file_id}/complete", response_model=ApiResponse[dict])
+def complete_meeting_audio_upload_endpoint(
+    meeting_id: uuid.UUID,
+    audio_file_id: uuid.UUID,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Confirm a direct audio upload and enqueue ASR (mock) processing."""
+    try:
+        validate_meeting_for_audio_operations(db, meeting_id, current_user.id)
+
+        audio = complete_audio_upload(db, meeting_id, audio_file_id, current_user.id)
         async_result = process_audio_task.delay(str(audio.id), str(current_user.id))
 
         return ApiResponse(
@@ -353,6 +437,8 @@ def list_meeting_audio_endpoint(
                 file_url=r.file_url,
                 seq_order=r.seq_order,
                 duration_seconds=r.duration_seconds,
+                sample_rate=r.sample_rate,
+                channels=r.channels,
                 uploaded_by=r.uploaded_by,
                 created_at=r.created_at,
                 can_access=True,
@@ -400,6 +400,7 @@ def bot_webhook_recording_endpoint(
     actual_end_time: Optional[str] = Form(None),
     db: Session = Depends(get_db),
     authorization: Optional[str] = Header(None),
+    idempotency_key: Optional[str] = Header(None),
     current_user: User = Depends(get_current_user),
 ):
     """Webhook endpoint to receive bot recording and update bot status"""
@@ -436,31 +437,34 @@ def bot_webhook_recording_endpoint(
 
             logger.info(f"[WEBHOOK_RECORDING] Meeting found: {meeting.id}")
 
-            logger.debug("[WEBHOOK_RECORDING] Step 2.2: Reading recording file bytes")
-            file_bytes = recording.file.read()
-            file_size = len(file_bytes)
-            logger.info(f"[WEBHOOK_RECORDING] File read successfully: {file_size} bytes")
+            logger.debug("[WEBHOOK_RECORDING] Step 2.2: Checking recording file")
+            # The spooled upload is streamed to storage; only peek to reject empty recordings
+            has_content = bool(recording.file.read(1))
+            recording.file.seek(0)
 
-            if file_bytes:
+            if has_content:
                 logger.debug("[WEBHOOK_RECORDING] Step 2.3: Processing bot webhook recording")
+                # Repeated deliveries for the same bot are ignored unless the caller sends its own key
                 result = process_bot_webhook_recording(
                     db=db,
                     meeting_id=meeting.id,
                     user_id=current_user.id,
-                    file_bytes=file_bytes,
+                    file_obj=recording.file,
+                    idempotency_key=idempotency_key or botId,
                 )
-                logger.info(f"[WEBHOOK_RECORDING] Recording processed successfully, audio_file_id: {result.get('audio_file_id')}")
+                logger.info(f"[WEBHOOK_RECORDING] Recording processed successfully, audio_file_id: {result.get('audio_file_id')}, duplicate: {result.get('duplicate')}")
 
-                logger.debug("[WEBHOOK_RECORDING] Step 2.4: Queueing audio processing task")
-                # Queue audio processing task
-                from app.jobs.celery_worker import celery_app
+                if not result.get("duplicate"):
+                    logger.debug("[WEBHOOK_RECORDING] Step 2.4: Queueing audio processing task")
+                    # Queue audio processing task
+                    from app.jobs.celery_worker import celery_app
 
-                task = celery_app.send_task(
-                    "app.jobs.tasks.process_audio_task",
-                    args=[result["audio_file_id"], str(current_user.id)],
-                )
-                result["task_id"] = task.id
-                logger.info(f"[WEBHOOK_RECORDING] Audio processing task queued: {task.id}")
+                    task = celery_app.send_task(
+                        "app.jobs.tasks.process_audio_task",
+                        args=[result["audio_file_id"], str(current_user.id)],
+                    )
+                    result["task_id"] = task.id
+                    logger.info(f"[WEBHOOK_RECORDING] Audio processing task queued: {task.id}")
             else:
                 logger.warning("[WEBHOOK_RECORDING] WARNING: Recording file is empty")
         else:
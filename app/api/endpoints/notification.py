@@ -5,7 +5,7 @@ from typing import List, Optional
 from uuid import UUID
 
 # Third-party imports
-from fastapi import APIRouter, Depends, Query, WebSocket
+from fastapi import APIRouter, Depends, HTTPException, Query, WebSocket, status
 from sqlalchemy.orm import Session
 
 # Local imports
@@ -36,6 +36,7 @@ from app.services.user import get_user_by_id
 from app.services.websocket_manager import websocket_manager
 from app.utils.auth import get_current_user, get_current_user_from_token
 from app.utils.logging import logger
+from app.utils.pagination import next_cursor
 
 router = APIRouter(prefix=settings.API_V1_STR, tags=["Notification"])
 
@@ -49,17 +50,25 @@ def get_notifications_endpoint(
     order_by: str = Query("created_at"),
     dir: str = Query("desc"),
     is_read: Optional[bool] = Query(None),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from pagination.next_cursor; overrides page"),
+    include_total: bool = Query(False, description="Also count all matches when paging by cursor"),
 ):
+    if cursor and order_by != "created_at":
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Cursor pagination requires order_by=created_at")
+
     kwargs = {
         "page": page,
         "limit": limit,
         "order_by": order_by,
         "dir": dir,
         "is_read": is_read,
+        "cursor": cursor,
+        "include_total": include_total,
     }
     notifications, total = get_notifications(db, current_user.id, **kwargs)
 
-    pagination_meta = create_pagination_meta(page, limit, total)
+    cursor_enabled = order_by == "created_at"
+    pagination_meta = create_pagination_meta(page, limit, total, next_cursor(notifications, limit) if cursor_enabled else None, cursor)
 
     return PaginatedResponse(
         success=True,
@@ -221,6 +230,7 @@ async def websocket_endpoint(
     authorization: str = Query(None, description="Bearer token in format: Bearer <token>"),
     token: str = Query(None, description="JWT token (legacy support)"),
     sec_websocket_protocol: str = Query(None, description="WebSocket subprotocols", alias="sec-websocket-protocol"),
+    last_event_id: str = Query(None, description="Last received stream_id, replays messages missed while disconnected"),
 ):
     """
     WebSocket endpoint for real-time notifications and task progress updates.
@@ -230,6 +240,7 @@ async def websocket_endpoint(
     Query Parameters:
     - authorization: Bearer token (format: "Bearer <jwt_token>") - RECOMMENDED
     - token: JWT token (legacy support)
+    - last_event_id: stream_id of the last message received before reconnecting
     """
     user_id = None
     user_id_str = None
@@ -296,6 +307,10 @@ async def websocket_endpoint(
         }
         await websocket.send_json(capabilities_message)
 
+        # Replay messages missed while the client was disconnected
+        if last_event_id:
+            await websocket_manager.replay_recent_messages(user_id_str, websocket, last_event_id)
+
         # Main message loop
         while True:
             try:
@@ -31,6 +31,7 @@ from app.services.project import (
     create_project,
     delete_project,
     get_project,
+    get_project_member_counts,
     get_project_members,
     get_projects,
     get_user_role_in_project,
@@ -136,7 +137,8 @@ def get_projects_endpoint(
         )
 
         # Format response data
-        projects_data = [format_project_response(project) for project in projects]
+        member_counts = get_project_member_counts(db, [project.id for project in projects])
+        projects_data = [format_project_response(project, member_counts.get(project.id, 0)) for project in projects]
 
         pagination_meta = create_pagination_meta(page, limit, total)
 
@@ -337,7 +339,7 @@ def bulk_remove_members_endpoint(
             if admin_count == 0:
                 raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=MessageConstants.PROJECT_CANNOT_REMOVE_ALL_ADMINS)
 
-        results = bulk_remove_users_from_project(db, project_id, user_id_list)
+        results = bulk_remove_users_from_project(db, project_id, user_id_list, current_user.id)
 
         total_processed = len(results)
         total_success = sum(1 for r in results if r["success"])
@@ -25,6 +25,7 @@ from app.services.task import (
     update_task,
 )
 from app.utils.auth import get_current_user
+from app.utils.pagination import next_cursor
 
 router = APIRouter(prefix=settings.API_V1_STR, tags=["Task"])
 
@@ -44,6 +45,8 @@ def get_tasks_endpoint(
     meeting_id: Optional[uuid.UUID] = Query(None),
     created_at_gte: Optional[str] = Query(None),
     created_at_lte: Optional[str] = Query(None),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from pagination.next_cursor; overrides page"),
+    include_total: bool = Query(False, description="Also count all matches when paging by cursor"),
 ):
     tasks, total = get_tasks(
         db=db,
@@ -59,9 +62,11 @@ def get_tasks_endpoint(
         meeting_id=meeting_id,
         page=page,
         limit=limit,
+        cursor=cursor,
+        include_total=include_total,
     )
 
-    pagination_meta = create_pagination_meta(page, limit, total)
+    pagination_meta = create_pagination_meta(page, limit, total, next_cursor(tasks, limit), cursor)
 
     return PaginatedResponse(
         success=True,
@@ -74,7 +74,15 @@ def transcribe_audio_endpoint(audio_id: uuid.UUID, db: Session = Depends(get_db)
 def get_transcripts_endpoint(db: Session = Depends(get_db), current_user: User = Depends(get_current_user), page: int = Query(1, ge=1), limit: int = Query(20, ge=1, le=100), content_search: Optional[str] = Query(None), meeting_id: Optional[uuid.UUID] = Query(None)):
     transcripts, total = get_transcripts(db=db, user_id=current_user.id, content_search=content_search, meeting_id=meeting_id, page=page, limit=limit)
     pagination_meta = create_pagination_meta(page, limit, total)
-    return TranscriptsPaginatedResponse(success=True, message=MessageConstants.TRANSCRIPT_RETRIEVED_SUCCESS, data=[TranscriptResponse.model_validate(t) for t in transcripts], pagination=pagination_meta)
+    return TranscriptsPaginatedResponse(success=True, message=MessageConstants.TRANSCRIPT_RETRIEVED_SUCCESS, data=[_transcript_list_item(t, snippet) for t, snippet in transcripts], pagination=pagination_meta)
+
+
+def _transcript_list_item(transcript, snippet: Optional[str]) -> TranscriptResponse:
+    if snippet is None:
+        return TranscriptResponse.model_validate(transcript)
+    # Search hits carry the highlighted excerpt instead of the (deferred) full text
+    fields = {name: getattr(transcript, name) for name in TranscriptResponse.model_fields if name not in ("content", "extracted_text_for_search", "snippet")}
+    return TranscriptResponse(**fields, content=None, extracted_text_for_search=None, snippet=snippet)
 
 
 @router.get("/transcripts/{transcript_id}", response_model=TranscriptApiResponse)
@@ -1,56 +1,58 @@
+import hashlib
 import logging
 import uuid
+from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, Header, HTTPException, status
 from sqlalchemy.orm import Session
 
 from app.constants.messages import MessageConstants
 from app.core.config import settings
 from app.db import get_db
+from app.jobs.tasks import ingest_remote_audio_task
 from app.models.user import User
-from app.schemas.audio_file import AudioFileApiResponse, AudioFileCreate
+from app.schemas.common import ApiResponse
 from app.schemas.webhook import WebhookAudioRequest
-from app.services.audio_file import create_audio_file
+from app.services.meeting import validate_meeting_for_audio_operations
 from app.utils.auth import get_current_user
-from app.utils.http import download_file_from_url
+from app.utils.idempotency import claim_idempotency_key, release_idempotency_key
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix=settings.API_V1_STR, tags=["Webhook"])
 
 
-@router.post("/webhook/audio", response_model=AudioFileApiResponse)
+@router.post("/webhook/audio", response_model=ApiResponse[dict], status_code=status.HTTP_202_ACCEPTED)
 def webhook_audio_upload(
     request: WebhookAudioRequest,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
+    idempotency_key: Optional[str] = Header(None),
 ):
+    """Queue a remote audio file to be streamed into storage; repeated deliveries return the original task."""
     logger.info(f"Webhook audio upload request: meeting_id={request.meeting_id}, url={request.file_url}")
 
     try:
-        file_content, content_type = download_file_from_url(str(request.file_url))
-        logger.info(f"Downloaded {len(file_content)} bytes, content_type={content_type}")
-
-        audio_data = AudioFileCreate(meeting_id=request.meeting_id, uploaded_by=current_user.id)
-        audio_file = create_audio_file(db, audio_data, file_content, content_type)
-
-        if not audio_file:
-            logger.error("Failed to create audio file record")
-            raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=MessageConstants.OPERATION_FAILED)
-
-        logger.info(f"Successfully created audio file: id={audio_file.id}")
-        return {
-            "success": True,
-            "message": MessageConstants.AUDIO_UPLOADED_SUCCESS,
-            "data": audio_file,
-        }
-
-    except requests.RequestException as e:
-        logger.error(f"Failed to download file from {request.file_url}: {e}")
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=MessageConstants.OPERATION_FAILED)
-    except ValueError as e:
-        logger.error(f"File validation error: {e}")
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=MessageConstants.VALIDATION_ERROR)
+        validate_meeting_for_audio_operations(db, request.meeting_id, current_user.id)
+
+        # Without an explicit key, the same user posting the same file for the same meeting is a redelivery
+        key = idempotency_key or hashlib.sha256(f"{request.meeting_id}:{request.file_url}".encode()).hexdigest()
+        scope = f"webhook_audio:{current_user.id}"
+        task_id = str(uuid.uuid4())
+        existing_task_id = claim_idempotency_key(scope, key, task_id)
+        if existing_task_id:
+            logger.info(f"Duplicate webhook audio delivery, returning task {existing_task_id}")
+            return ApiResponse(success=True, message=MessageConstants.AUDIO_UPLOAD_QUEUED, data={"task_id": existing_task_id, "duplicate": True})
+
+        try:
+            ingest_remote_audio_task.apply_async(args=[str(request.meeting_id), str(current_user.id), str(request.file_url), key], task_id=task_id)
+        except Exception:
+            release_idempotency_key(scope, key)
+            raise
+
+        return ApiResponse(success=True, message=MessageConstants.AUDIO_UPLOAD_QUEUED, data={"task_id": task_id, "duplicate": False})
+    except HTTPException:
+        raise
     except Exception as e:
-        logger.error(f"Error processing webhook audio upload: {e}")
+        logger.error(f"Error queueing webhook audio upload: {e}")
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=MessageConstants.INTERNAL_SERVER_ERROR)
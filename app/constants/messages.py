@@ -9,6 +9,7 @@ class MessageConstants:
     AUDIO_NOT_FOUND = "AUDIO_NOT_FOUND"
     AUDIO_UPLOAD_FAILED = "AUDIO_UPLOAD_FAILED"
     AUDIO_DELETED_SUCCESS = "AUDIO_DELETED_SUCCESS"
+    AUDIO_UPLOAD_QUEUED = "AUDIO_UPLOAD_QUEUED"
 
     # Transcript Messages
     TRANSCRIPT_CREATED_SUCCESS = "TRANSCRIPT_CREATED_SUCCESS"
@@ -177,6 +178,7 @@ class MessageDescriptions:
     AUDIO_NOT_FOUND = "Audio file not found"
     AUDIO_UPLOAD_FAILED = "Audio file upload failed"
     AUDIO_DELETED_SUCCESS = "Audio file deleted successfully"
+    AUDIO_UPLOAD_QUEUED = "Audio file download queued"
 
     # Transcript Messages
     TRANSCRIPT_CREATED_SUCCESS = "Transcript created successfully"
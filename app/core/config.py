@@ -26,6 +26,9 @@ class Settings(BaseSettings):
     SECRET_KEY: str = secrets.token_urlsafe(32)
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60 * 24 * 8  # 8 days
     REFRESH_TOKEN_EXPIRE_MINUTES: int = 60 * 24 * 30  # 30 days
+    AUTH_USER_CACHE_TTL_SECONDS: int = 30  # Authenticated user cache lifetime, 0 disables it
+    AUTH_USER_CACHE_MAX_SIZE: int = 10000  # Maximum cached users per process
+    ACCESS_CACHE_TTL_SECONDS: int = 300  # Cached project membership used for access checks
 
     # Server Configuration
     SERVER_NAME: str = "SecureScribeBE"
@@ -50,6 +53,8 @@ class Settings(BaseSettings):
 
     # Firebase Configuration
     FIREBASE_SERVICE_ACCOUNT_KEY_PATH: str = '{"type": "service_account", "project_id": ""}'
+    FIREBASE_CLOCK_SKEW_SECONDS: int = 5  # Tolerated clock skew when verifying ID tokens (max 60)
+    FIREBASE_TOKEN_CACHE_MAX_SIZE: int = 1024  # Verified ID tokens cached until expiry
 
     # Redis Configuration
     REDIS_HOST: str = "redis"
@@ -63,6 +68,9 @@ class Settings(BaseSettings):
     WEBSOCKET_MESSAGE_SIZE_LIMIT: int = 65536  # 64KB message limit
     WEBSOCKET_CONNECTION_TIMEOUT: int = 300  # 5 minutes inactive timeout
     WEBSOCKET_CLEANUP_INTERVAL: int = 60  # 1 minute cleanup interval
+    WEBSOCKET_STREAM_MAXLEN: int = 1000  # Messages retained per user stream for replay
+    WEBSOCKET_STREAM_TTL_SECONDS: int = 60 * 60 * 24 * 7  # Drop idle user streams after 7 days
+    WEBSOCKET_REPLAY_LIMIT: int = 500  # Maximum messages replayed on reconnect
 
     # Throttling Configuration
     THROTTLING_ENABLED: bool = True
@@ -81,6 +89,8 @@ class Settings(BaseSettings):
     MINIO_BUCKET_NAME: str = "securescribe-files"
     MINIO_PUBLIC_BUCKET_NAME: str = "securescribe-public"
     MINIO_PUBLIC_URL: str = "http://localhost:9000"  # Public URL for permanent links (internal Docker network)
+    MINIO_UPLOAD_PART_SIZE_MB: int = 10  # Multipart chunk size for streamed uploads (min 5)
+    MINIO_UPLOAD_URL_EXPIRE_SECONDS: int = 60 * 15  # Lifetime of presigned direct-upload URLs and their pending rows
     LOG_LEVEL: str = "DEBUG"
     # File Configuration
     MAX_FILE_SIZE_MB: int = 100
@@ -104,6 +114,11 @@ class Settings(BaseSettings):
     # Bot Service Configuration
     BOT_SERVICE_URL: str = "http://bot:3000"
     BOT_WEBHOOK_URL: str = "http://nginx/be/api/v1/bot/webhook/recording"
+    WEBHOOK_IDEMPOTENCY_TTL_SECONDS: int = 60 * 60 * 24  # Window in which repeated webhook deliveries are ignored
+    WEBHOOK_AUDIO_MAX_SIZE_MB: int = 100
+
+    # Statistics Configuration
+    DASHBOARD_CACHE_TTL_SECONDS: int = 300  # Cached dashboard payload lifetime
 
     # Indexing Configuration
     CHUNK_SIZE: int = 1000
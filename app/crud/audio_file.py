@@ -1,5 +1,5 @@
 import uuid
-from typing import List, Optional
+from typing import BinaryIO, List, Optional
 
 from sqlalchemy.orm import Session
 
@@ -10,6 +10,7 @@ from app.utils.minio import (
     file_exists_in_minio,
     generate_presigned_url,
     upload_bytes_to_minio,
+    upload_stream_to_minio,
 )
 
 
@@ -51,6 +52,39 @@ def crud_create_audio_file(
     return None
 
 
+def crud_create_audio_file_from_stream(
+    db: Session,
+    audio_data: AudioFileCreate,
+    file_obj: BinaryIO,
+    content_type: str = "audio/webm",
+    max_size: Optional[int] = None,
+) -> Optional[AudioFile]:
+    audio_file = AudioFile(**audio_data.model_dump())
+    db.add(audio_file)
+    db.commit()
+    db.refresh(audio_file)
+
+    bucket_name = "audio-files"
+    object_name = f"{audio_file.id}{get_file_extension(content_type)}"
+
+    try:
+        uploaded = upload_stream_to_minio(file_obj, bucket_name, object_name, content_type, max_size=max_size)
+    except Exception:
+        db.delete(audio_file)
+        db.commit()
+        raise
+
+    if uploaded:
+        audio_file.file_url = generate_presigned_url(bucket_name, object_name)
+        db.commit()
+        db.refresh(audio_file)
+        return audio_file
+
+    db.delete(audio_file)
+    db.commit()
+    return None
+
+
 def crud_get_audio_file(db: Session, audio_id: uuid.UUID) -> Optional[AudioFile]:
     return db.query(AudioFile).filter(AudioFile.id == audio_id, AudioFile.is_deleted == False).first()
 
@@ -5,7 +5,9 @@ from sqlalchemy.orm import Session
 
 from app.models.file import File
 from app.models.meeting import Meeting, ProjectMeeting
-from app.models.project import Project, UserProject
+from app.models.project import UserProject
+from app.utils.access import get_user_project_ids
+from app.utils.pagination import apply_cursor, order_by_position
 
 
 def crud_create_file(db: Session, **file_data) -> File:
@@ -21,7 +23,7 @@ def crud_get_file(db: Session, file_id: uuid.UUID) -> Optional[File]:
 
 
 def crud_get_files(db: Session, filters: dict = None, **kwargs) -> Tuple[List[File], int]:
-    query = db.query(File)
+    query = db.query(File).filter(File.upload_expires_at.is_(None))
     if filters:
         if "filename" in filters and filters["filename"]:
             query = query.filter(File.filename.ilike(f"%{filters['filename']}%"))
@@ -37,13 +39,17 @@ def crud_get_files(db: Session, filters: dict = None, **kwargs) -> Tuple[List[Fi
             query = query.filter(File.uploaded_by == filters["uploaded_by"])
     user_id = kwargs.get("user_id")
     if user_id:
-        user_projects = db.query(Project.id).join(Project.users).filter(Project.users.any(user_id=user_id)).subquery()
-        user_meetings = db.query(Meeting.id).join(ProjectMeeting, Meeting.id == ProjectMeeting.meeting_id).join(Project, ProjectMeeting.project_id == Project.id).join(Project.users).filter(Project.users.any(user_id=user_id), Meeting.is_deleted == False).subquery()
+        user_projects = list(get_user_project_ids(db, user_id))
+        user_meetings = db.query(Meeting.id).join(ProjectMeeting, Meeting.id == ProjectMeeting.meeting_id).filter(ProjectMeeting.project_id.in_(user_projects), Meeting.is_deleted == False).subquery()
         query = query.filter((File.uploaded_by == user_id) | (File.project_id.in_(user_projects)) | (File.meeting_id.in_(user_meetings)))
-    total = query.count()
+    cursor = kwargs.get("cursor")
+    total = query.count() if cursor is None or kwargs.get("include_total", True) else None
     page = int(kwargs.get("page", 1))
     limit = int(kwargs.get("limit", 20))
-    files = query.offset((page - 1) * limit).limit(limit).all()
+    if cursor:
+        files = order_by_position(apply_cursor(query, File, cursor), File).limit(limit).all()
+    else:
+        files = order_by_position(query, File).offset((page - 1) * limit).limit(limit).all()
     return files, total
 
 
@@ -59,6 +65,24 @@ def crud_update_file(db: Session, file_id: uuid.UUID, **updates) -> Optional[Fil
     return file
 
 
+def crud_is_file_pending(db: Session, file_id: uuid.UUID) -> bool:
+    return db.query(File.id).filter(File.id == file_id, File.upload_expires_at.isnot(None)).first() is not None
+
+
+def crud_complete_pending_file(db: Session, file_id: uuid.UUID, size_bytes: int, storage_url: str) -> Optional[File]:
+    """Mark a pending direct upload as stored; returns None if it is no longer pending."""
+    # Conditional on the marker so a concurrent cleanup and completion cannot both act on the row
+    count = db.query(File).filter(File.id == file_id, File.upload_expires_at.isnot(None)).update({File.size_bytes: size_bytes, File.storage_url: storage_url, File.upload_expires_at: None}, synchronize_session=False)
+    db.commit()
+    return crud_get_file(db, file_id) if count else None
+
+
+def crud_delete_pending_file(db: Session, file_id: uuid.UUID) -> bool:
+    count = db.query(File).filter(File.id == file_id, File.upload_expires_at.isnot(None)).delete(synchronize_session=False)
+    db.commit()
+    return count > 0
+
+
 def crud_delete_file(db: Session, file_id: uuid.UUID) -> bool:
     file = crud_get_file(db, file_id)
     if not file:
@@ -69,10 +93,12 @@ def crud_delete_file(db: Session, file_id: uuid.UUID) -> bool:
 
 
 def crud_check_file_access(db: Session, file: File, user_id: uuid.UUID) -> bool:
+    if file.upload_expires_at is not None:
+        return False
     if file.uploaded_by == user_id:
         return True
     if file.project_id:
-        return db.query(Project).join(Project.users).filter(Project.id == file.project_id, Project.users.any(user_id=user_id)).first() is not None
+        return file.project_id in get_user_project_ids(db, user_id)
     return False
 
 
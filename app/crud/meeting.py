@@ -1,4 +1,5 @@
 import uuid
+from datetime import datetime
 from typing import List, Optional, Tuple
 
 from sqlalchemy import and_, or_
@@ -6,6 +7,7 @@ from sqlalchemy.orm import Session, joinedload
 
 from app.models.meeting import AudioFile, Meeting, ProjectMeeting
 from app.models.project import Project, UserProject
+from app.utils.pagination import apply_cursor, order_by_position
 
 
 def crud_create_meeting(db: Session, **meeting_data) -> Meeting:
@@ -42,7 +44,9 @@ def crud_get_meetings(
     tag_ids: Optional[List[uuid.UUID]] = None,
     page: int = 1,
     limit: int = 20,
-) -> Tuple[List[Meeting], int]:
+    cursor: Optional[str] = None,
+    include_total: bool = True,
+) -> Tuple[List[Meeting], Optional[int]]:
     base_query = (
         db.query(Meeting)
         .options(
@@ -83,8 +87,11 @@ def crud_get_meetings(
 
         query = query.join(MeetingTag).filter(MeetingTag.tag_id.in_(tag_ids))
 
-    total = query.count()
-    meetings = query.order_by(Meeting.created_at.desc()).offset((page - 1) * limit).limit(limit).all()
+    total = query.count() if cursor is None or include_total else None
+    if cursor:
+        meetings = order_by_position(apply_cursor(query, Meeting, cursor), Meeting).limit(limit).all()
+    else:
+        meetings = order_by_position(query, Meeting).offset((page - 1) * limit).limit(limit).all()
     return meetings, total
 
 
@@ -141,8 +148,8 @@ def crud_get_next_audio_file_seq_order(db: Session, meeting_id: uuid.UUID) -> in
     return int(last.seq_order) + 1
 
 
-def crud_create_audio_file(db: Session, meeting_id: uuid.UUID, uploaded_by: uuid.UUID, seq_order: int) -> AudioFile:
-    audio = AudioFile(meeting_id=meeting_id, uploaded_by=uploaded_by, seq_order=seq_order)
+def crud_create_audio_file(db: Session, meeting_id: uuid.UUID, uploaded_by: uuid.UUID, seq_order: int, upload_expires_at: Optional[datetime] = None) -> AudioFile:
+    audio = AudioFile(meeting_id=meeting_id, uploaded_by=uploaded_by, seq_order=seq_order, upload_expires_at=upload_expires_at)
     db.add(audio)
     db.commit()
     db.refresh(audio)
@@ -159,6 +166,19 @@ def crud_update_audio_file_url(db: Session, audio_id: uuid.UUID, file_url: str)
     return audio
 
 
+def crud_complete_pending_audio_file(db: Session, audio_id: uuid.UUID, file_url: str) -> Optional[AudioFile]:
+    """Attach the URL of a pending direct upload; returns None if it is no longer pending."""
+    count = db.query(AudioFile).filter(AudioFile.id == audio_id, AudioFile.upload_expires_at.isnot(None)).update({AudioFile.file_url: file_url, AudioFile.upload_expires_at: None}, synchronize_session=False)
+    db.commit()
+    return db.query(AudioFile).filter(AudioFile.id == audio_id).first() if count else None
+
+
+def crud_delete_pending_audio_file(db: Session, audio_id: uuid.UUID) -> bool:
+    count = db.query(AudioFile).filter(AudioFile.id == audio_id, AudioFile.upload_expires_at.isnot(None)).delete(synchronize_session=False)
+    db.commit()
+    return count > 0
+
+
 def crud_delete_audio_file(db: Session, audio_id: uuid.UUID) -> bool:
     audio = db.query(AudioFile).filter(AudioFile.id == audio_id).first()
     if not audio:
@@ -169,7 +189,7 @@ def crud_delete_audio_file(db: Session, audio_id: uuid.UUID) -> bool:
 
 
 def crud_get_meeting_audio_files(db: Session, meeting_id: uuid.UUID, page: int = 1, limit: int = 20) -> Tuple[List[AudioFile], int]:
-    q = db.query(AudioFile).filter(AudioFile.meeting_id == meeting_id, AudioFile.is_deleted == False)
+    q = db.query(AudioFile).filter(AudioFile.meeting_id == meeting_id, AudioFile.is_deleted == False, AudioFile.upload_expires_at.is_(None))
     q = q.order_by(AudioFile.seq_order.asc().nullslast(), AudioFile.created_at.asc())
     total = q.count()
     rows = q.offset((page - 1) * limit).limit(limit).all()
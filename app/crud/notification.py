@@ -2,24 +2,35 @@ import uuid
 from datetime import datetime, timezone
 from typing import List, Optional
 
+from sqlalchemy import false, func, insert, literal, select
 from sqlalchemy.orm import Session
 
 from app.models.notification import Notification
 from app.models.user import User, UserDevice
+from app.utils.pagination import apply_cursor, order_by_position
 
+GLOBAL_NOTIFICATION_CHUNK_SIZE = 5000
 
-def crud_get_notification(db: Session, notification_id: uuid.UUID = None, user_id: uuid.UUID = None, is_read: Optional[bool] = None, order_by: str = "created_at", direction: str = "desc", page: int = 1, limit: int = 20):
+
+def crud_get_notification(db: Session, notification_id: uuid.UUID = None, user_id: uuid.UUID = None, is_read: Optional[bool] = None, order_by: str = "created_at", direction: str = "desc", page: int = 1, limit: int = 20, cursor: Optional[str] = None, include_total: bool = True):
     if notification_id and user_id:
         return db.query(Notification).filter(Notification.id == notification_id, Notification.user_id == user_id).first()
     if user_id:
         query = db.query(Notification).filter(Notification.user_id == user_id)
         if is_read is not None:
             query = query.filter(Notification.is_read == is_read)
-        total = query.count()
-        if direction == "asc":
+        total = query.count() if cursor is None or include_total else None
+        if order_by == "created_at":
+            # Keyset order; cursors are only meaningful for this ordering
+            if cursor:
+                query = apply_cursor(query, Notification, cursor, descending=direction != "asc")
+            query = order_by_position(query, Notification, descending=direction != "asc")
+        elif direction == "asc":
             query = query.order_by(getattr(Notification, order_by).asc())
         else:
             query = query.order_by(getattr(Notification, order_by).desc())
+        if cursor:
+            return query.limit(limit).all(), total
         notifications = query.offset((page - 1) * limit).limit(limit).all()
         return notifications, total
     return None
@@ -34,21 +45,32 @@ def crud_create_notification(db: Session, user_id: uuid.UUID, **kwargs) -> Notif
 
 
 def crud_create_notifications_bulk(db: Session, user_ids: List[uuid.UUID], **kwargs) -> List[Notification]:
-    notifications = []
-    for user_id in user_ids:
-        notification = Notification(user_id=user_id, **kwargs)
-        db.add(notification)
-        notifications.append(notification)
+    if not user_ids:
+        return []
+    rows = [{"id": uuid.uuid4(), "user_id": user_id, "is_read": False, **kwargs} for user_id in user_ids]
+    notifications = db.scalars(insert(Notification).returning(Notification), rows).all()
     db.commit()
-    for notification in notifications:
-        db.refresh(notification)
-    return notifications
+    return list(notifications)
 
 
-def crud_create_global_notification(db: Session, **kwargs) -> List[Notification]:
-    users = db.query(User).all()
-    user_ids = [user.id for user in users]
-    return crud_create_notifications_bulk(db, user_ids, **kwargs)
+def crud_create_global_notification(db: Session, chunk_size: int = GLOBAL_NOTIFICATION_CHUNK_SIZE, **kwargs) -> List[Notification]:
+    columns = ["id", "user_id", "is_read", *kwargs.keys()]
+    values = [literal(value, type_=Notification.__table__.c[key].type) for key, value in kwargs.items()]
+    notifications = []
+    last_user_id = None
+    while True:
+        user_query = select(User.id).order_by(User.id).limit(chunk_size)
+        if last_user_id is not None:
+            user_query = user_query.where(User.id > last_user_id)
+        users = user_query.subquery()
+        source = select(func.gen_random_uuid(), users.c.id, false(), *values)
+        chunk = db.scalars(insert(Notification).from_select(columns, source).returning(Notification)).all()
+        notifications.extend(chunk)
+        if len(chunk) < chunk_size:
+            break
+        last_user_id = max(notification.user_id for notification in chunk)
+    db.commit()
+    return notifications
 
 
 def crud_update_notification(db: Session, notification_id: uuid.UUID, user_id: uuid.UUID, **kwargs) -> Optional[Notification]:
@@ -74,9 +96,15 @@ def crud_delete_notification(db: Session, notification_id: uuid.UUID, user_id: u
 
 
 def crud_get_user_fcm_tokens(db: Session, user_ids: List[uuid.UUID]) -> List[str]:
-    tokens = []
-    for user_id in user_ids:
-        devices = db.query(UserDevice).filter(UserDevice.user_id == user_id, UserDevice.is_active == True).all()
-        user_tokens = [device.fcm_token for device in devices if device.fcm_token and device.fcm_token.strip()]
-        tokens.extend(user_tokens)
-    return tokens
+    if not user_ids:
+        return []
+    rows = db.query(UserDevice.fcm_token).filter(UserDevice.user_id.in_(user_ids), UserDevice.is_active == True).distinct().all()
+    return [token for (token,) in rows if token and token.strip()]
+
+
+def crud_deactivate_fcm_tokens(db: Session, tokens: List[str]) -> int:
+    if not tokens:
+        return 0
+    count = db.query(UserDevice).filter(UserDevice.fcm_token.in_(tokens)).update({UserDevice.is_active: False}, synchronize_session=False)
+    db.commit()
+    return count
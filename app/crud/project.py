@@ -1,11 +1,16 @@
 import uuid
+from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional, Tuple
 
+from sqlalchemy import delete, func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session, joinedload
 
 from app.models.file import File
 from app.models.meeting import ProjectMeeting
 from app.models.project import Project, UserProject
+from app.models.user import User
+from app.utils.access import invalidate_user_access
 
 
 def crud_create_project(db: Session, name: str, description: str, created_by: uuid.UUID) -> Project:
@@ -35,10 +40,8 @@ def crud_get_project(db: Session, project_id: uuid.UUID, include_members: bool =
 
 
 def crud_get_projects(db: Session, filters: Dict[str, Any] = None, **kwargs) -> Tuple[List[Project], int]:
-    query = db.query(Project).options(
-        joinedload(Project.created_by_user),
-        joinedload(Project.users).joinedload(UserProject.user),
-    )
+    # Members are not loaded for list views; use crud_get_project_member_counts for their counts
+    query = db.query(Project)
 
     if filters:
         if "name" in filters and filters["name"]:
@@ -51,10 +54,11 @@ def crud_get_projects(db: Session, filters: Dict[str, Any] = None, **kwargs) ->
             query = query.filter(Project.created_at >= filters["created_at_gte"])
         if "created_at_lte" in filters and filters["created_at_lte"]:
             query = query.filter(Project.created_at <= filters["created_at_lte"])
+        # Membership filters are semi-joins so they never duplicate project rows
         if "member_id" in filters and filters["member_id"]:
-            query = query.join(UserProject).filter(UserProject.user_id == filters["member_id"])
+            query = query.filter(Project.id.in_(select(UserProject.project_id).where(UserProject.user_id == filters["member_id"])))
         if "user_id" in filters and filters["user_id"]:
-            query = query.join(UserProject).filter(UserProject.user_id == filters["user_id"])
+            query = query.filter(Project.id.in_(select(UserProject.project_id).where(UserProject.user_id == filters["user_id"])))
 
     total = query.count()
     order_by = kwargs.get("order_by", "created_at")
@@ -75,6 +79,13 @@ def crud_get_projects(db: Session, filters: Dict[str, Any] = None, **kwargs) ->
     return projects, total
 
 
+def crud_get_project_member_counts(db: Session, project_ids: List[uuid.UUID]) -> Dict[uuid.UUID, int]:
+    if not project_ids:
+        return {}
+    rows = db.query(UserProject.project_id, func.count()).filter(UserProject.project_id.in_(project_ids)).group_by(UserProject.project_id).all()
+    return {project_id: count for project_id, count in rows}
+
+
 def crud_update_project(db: Session, project_id: uuid.UUID, **updates) -> Optional[Project]:
     project = db.query(Project).filter(Project.id == project_id).first()
     if not project:
@@ -93,6 +104,7 @@ def crud_delete_project_with_cascade(db: Session, project_id: uuid.UUID) -> bool
         return False
 
     # Delete UserProject relationships
+    member_ids = [user_id for (user_id,) in db.query(UserProject.user_id).filter(UserProject.project_id == project_id).all()]
     db.query(UserProject).filter(UserProject.project_id == project_id).delete()
 
     # Delete ProjectMeeting relationships
@@ -104,6 +116,7 @@ def crud_delete_project_with_cascade(db: Session, project_id: uuid.UUID) -> bool
     # Finally delete the project
     db.delete(project)
     db.commit()
+    invalidate_user_access(member_ids)
     return True
 
 
@@ -116,6 +129,7 @@ def crud_add_user_to_project(db: Session, project_id: uuid.UUID, user_id: uuid.U
     db.add(user_project)
     db.commit()
     db.refresh(user_project)
+    invalidate_user_access([user_id])
     return user_project
 
 
@@ -125,9 +139,38 @@ def crud_remove_user_from_project(db: Session, project_id: uuid.UUID, user_id: u
         return False
     db.delete(user_project)
     db.commit()
+    invalidate_user_access([user_id])
     return True
 
 
+def crud_bulk_add_users_to_project(db: Session, project_id: uuid.UUID, roles: Dict[uuid.UUID, str]) -> List[uuid.UUID]:
+    """Insert memberships in one statement and return the ids of users that were actually added."""
+    if not roles:
+        return []
+    # Unknown users would fail the whole insert on the foreign key, so only existing ones are inserted
+    existing_user_ids = {user_id for (user_id,) in db.query(User.id).filter(User.id.in_(list(roles))).all()}
+    if not existing_user_ids:
+        return []
+    joined_at = datetime.now(timezone.utc)
+    rows = [{"project_id": project_id, "user_id": user_id, "role": roles[user_id], "joined_at": joined_at} for user_id in existing_user_ids]
+    statement = pg_insert(UserProject).values(rows).on_conflict_do_nothing(index_elements=["user_id", "project_id"]).returning(UserProject.user_id)
+    added_user_ids = list(db.execute(statement).scalars().all())
+    db.commit()
+    invalidate_user_access(added_user_ids)
+    return added_user_ids
+
+
+def crud_bulk_remove_users_from_project(db: Session, project_id: uuid.UUID, user_ids: List[uuid.UUID]) -> List[uuid.UUID]:
+    """Delete memberships in one statement and return the ids of users that were actually removed."""
+    if not user_ids:
+        return []
+    statement = delete(UserProject).where(UserProject.project_id == project_id, UserProject.user_id.in_(user_ids)).returning(UserProject.user_id)
+    removed_user_ids = list(db.execute(statement).scalars().all())
+    db.commit()
+    invalidate_user_access(removed_user_ids)
+    return removed_user_ids
+
+
 def crud_update_user_role_in_project(db: Session, project_id: uuid.UUID, user_id: uuid.UUID, role: str) -> Optional[UserProject]:
     user_project = db.query(UserProject).filter(UserProject.project_id == project_id, UserProject.user_id == user_id).first()
     if not user_project:
@@ -1,12 +1,16 @@
 import uuid
 from typing import List, Tuple
 
-from sqlalchemy import and_, or_
+from sqlalchemy import case, func, literal, or_, select, union, union_all
 from sqlalchemy.orm import Session
 
 from app.models.file import File
 from app.models.meeting import Meeting, ProjectMeeting
-from app.models.project import Project
+from app.models.project import Project, UserProject
+
+
+def _escape_like(term: str) -> str:
+    return term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
 
 
 def crud_search_dynamic(
@@ -18,83 +22,59 @@ def crud_search_dynamic(
     project_id: uuid.UUID = None,
     meeting_id: uuid.UUID = None,
 ) -> Tuple[List[dict], int]:
-    user_projects_query = db.query(Project.id).join(Project.users).filter(Project.users.any(user_id=user_id))
-    user_project_ids = [p.id for p in user_projects_query.all()]
-
+    user_project_ids = select(UserProject.project_id).where(UserProject.user_id == user_id)
     if project_id:
-        user_project_ids = [project_id] if project_id in user_project_ids else []
-
-    project_meetings_query = db.query(Meeting.id).join(ProjectMeeting, Meeting.id == ProjectMeeting.meeting_id).filter(ProjectMeeting.project_id.in_(user_project_ids))
-    personal_meetings_query = db.query(Meeting.id).filter(and_(Meeting.is_personal == True, Meeting.created_by == user_id))
-    user_meetings_query = project_meetings_query.union(personal_meetings_query)
-    user_meeting_ids = [m.id for m in user_meetings_query.all()]
+        user_project_ids = user_project_ids.where(UserProject.project_id == project_id)
 
+    user_meeting_ids = union(
+        select(ProjectMeeting.meeting_id).where(ProjectMeeting.project_id.in_(user_project_ids)),
+        select(Meeting.id).where(Meeting.is_personal == True, Meeting.created_by == user_id),
+    )
     if meeting_id:
-        user_meeting_ids = [meeting_id] if meeting_id in user_meeting_ids else []
-
-    meetings = db.query(Meeting.id, Meeting.title, Meeting.created_at).filter(Meeting.title.ilike(f"%{search_term}%"), Meeting.is_deleted == False).filter(Meeting.id.in_(user_meeting_ids)).all()
-
-    projects = db.query(Project.id, Project.name, Project.created_at).filter(Project.name.ilike(f"%{search_term}%"), Project.is_archived == False).filter(Project.id.in_(user_project_ids)).all()
-
-    files = (
-        db.query(File.id, File.filename, File.created_at)
-        .filter(File.filename.ilike(f"%{search_term}%"))
-        .filter(
-            or_(
-                File.uploaded_by == user_id,
-                File.project_id.in_(user_project_ids),
-                File.meeting_id.in_(user_meeting_ids),
-            )
-        )
-        .all()
+        user_meeting_ids = select(Meeting.id).where(Meeting.id == meeting_id, Meeting.id.in_(user_meeting_ids))
+
+    # Substring ILIKE is served by the pg_trgm GIN indexes on the name columns
+    pattern = f"%{_escape_like(search_term)}%"
+
+    def ranked(name_col, type_name: str):
+        relevance = case((name_col == search_term, 3), else_=2)
+        return name_col.label("name"), literal(type_name).label("type"), relevance.label("relevance"), func.similarity(name_col, search_term).label("similarity")
+
+    meetings = select(Meeting.id, *ranked(Meeting.title, "meeting"), Meeting.created_at).where(Meeting.title.ilike(pattern, escape="\\"), Meeting.is_deleted == False, Meeting.id.in_(user_meeting_ids))
+    projects = select(Project.id, *ranked(Project.name, "project"), Project.created_at).where(Project.name.ilike(pattern, escape="\\"), Project.is_archived == False, Project.id.in_(user_project_ids))
+    files = select(File.id, *ranked(File.filename, "file"), File.created_at).where(
+        File.filename.ilike(pattern, escape="\\"),
+        File.upload_expires_at.is_(None),
+        or_(
+            File.uploaded_by == user_id,
+            File.project_id.in_(user_project_ids),
+            File.meeting_id.in_(user_meeting_ids),
+        ),
     )
 
-    results = []
-    for m in meetings:
-        results.append(
-            {
-                "id": str(m.id),
-                "name": m.title,
-                "created_at": m.created_at,
-                "type": "meeting",
-            }
-        )
-    for p in projects:
-        results.append(
-            {
-                "id": str(p.id),
-                "name": p.name,
-                "created_at": p.created_at,
-                "type": "project",
-            }
-        )
-    for f in files:
-        results.append(
-            {
-                "id": str(f.id),
-                "name": f.filename,
-                "created_at": f.created_at,
-                "type": "file",
-            }
-        )
-
-    def get_relevance(item):
-        name = item["name"]
-        if name == search_term:
-            return 3
-        elif search_term.lower() in name.lower():
-            return 2
-        else:
-            return 1
-
-    results.sort(key=lambda x: (-get_relevance(x), x["created_at"].timestamp() if x["created_at"] else 0))
-
-    for result in results:
-        result["created_at"] = result["created_at"].isoformat() if result["created_at"] else None
-
-    start = (page - 1) * limit
-    end = start + limit
-    paginated_results = results[start:end]
-    total = len(results)
-
-    return paginated_results, total
+    matches = union_all(meetings, projects, files).subquery()
+    search_query = (
+        select(matches.c.id, matches.c.name, matches.c.type, matches.c.created_at, func.count().over().label("total"))
+        .order_by(matches.c.relevance.desc(), matches.c.similarity.desc(), matches.c.created_at.asc().nulls_first())
+        .offset((page - 1) * limit)
+        .limit(limit)
+    )
+    rows = db.execute(search_query).all()
+
+    # The window count is only available on returned rows; count separately for pages past the end
+    if rows:
+        total = rows[0].total
+    else:
+        total = db.execute(select(func.count()).select_from(matches)).scalar_one() if page > 1 else 0
+
+    results = [
+        {
+            "id": str(row.id),
+            "name": row.name,
+            "created_at": row.created_at.isoformat() if row.created_at else None,
+            "type": row.type,
+        }
+        for row in rows
+    ]
+
+    return results, total
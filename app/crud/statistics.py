@@ -1,131 +1,259 @@
 import logging
 from datetime import datetime, timedelta, timezone
-from typing import Any, List, Optional, Tuple
+from typing import Any, List, Optional, Set, Tuple
 from uuid import UUID
 
-from sqlalchemy import and_, case, desc, func, or_
+from sqlalchemy import and_, case, delete, desc, exists, false, func, insert, literal, literal_column, or_, true, union, union_all
 from sqlmodel import Session, select
 
 from app.models.file import File
-from app.models.meeting import AudioFile, Meeting, MeetingBot, MeetingStatus, Transcript
+from app.models.meeting import AudioFile, Meeting, MeetingBot, MeetingStatus, ProjectMeeting, Transcript
 from app.models.project import Project, UserProject
-from app.models.task import Task
+from app.models.statistics import UserDailyStats
+from app.models.task import Task, TaskProject
 
 logger = logging.getLogger(__name__)
 
 
-def crud_get_task_aggregates(db: Session, scope_filter: Any) -> Tuple[int, int, int, int, int, int, int]:
+def _day_series(start_date: datetime):
+    now = datetime.now(timezone.utc)
+    return func.generate_series(func.date_trunc("day", start_date), func.date_trunc("day", now), literal_column("interval '1 day'")).table_valued("day").render_derived()
+
+
+def crud_get_task_dashboard_aggregates(db: Session, scope_filter: Any, start_date: Optional[datetime] = None) -> Any:
     now = datetime.now(timezone.utc)
     today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
     week_end = today_start + timedelta(days=7)
+    tomorrow = now + timedelta(hours=24)
+    in_period = Task.created_at >= start_date if start_date else false()
+    is_overdue = and_(Task.status != "done", Task.due_date < now, Task.due_date.isnot(None))
 
     agg_query = select(
         func.count(Task.id).label("total"),
-        func.sum(case((Task.status == "todo", 1), else_=0)).label("todo"),
-        func.sum(case((Task.status == "in_progress", 1), else_=0)).label("in_progress"),
-        func.sum(case((Task.status == "done", 1), else_=0)).label("done"),
-        func.sum(case((and_(Task.status != "done", Task.due_date < now, Task.due_date.isnot(None)), 1), else_=0)).label("overdue"),
-        func.sum(case((and_(Task.due_date >= today_start, Task.due_date < today_start + timedelta(days=1)), 1), else_=0)).label("due_today"),
-        func.sum(case((and_(Task.due_date >= today_start, Task.due_date < week_end), 1), else_=0)).label("due_this_week"),
+        func.count(Task.id).filter(Task.status == "todo").label("todo"),
+        func.count(Task.id).filter(Task.status == "in_progress").label("in_progress"),
+        func.count(Task.id).filter(Task.status == "done").label("done"),
+        func.count(Task.id).filter(is_overdue).label("overdue"),
+        func.count(Task.id).filter(Task.due_date >= today_start, Task.due_date < today_start + timedelta(days=1)).label("due_today"),
+        func.count(Task.id).filter(Task.due_date >= today_start, Task.due_date < week_end).label("due_this_week"),
+        func.count(Task.id).filter(in_period).label("created_in_period"),
+        func.count(Task.id).filter(in_period, Task.status == "done").label("completed_in_period"),
+        func.count(Task.id).filter(or_(is_overdue, and_(Task.status != "done", Task.due_date >= now, Task.due_date < tomorrow))).label("pending"),
     ).where(scope_filter)
 
-    result = db.exec(agg_query).one()
-    return (result.total or 0, result.todo or 0, result.in_progress or 0, result.done or 0, result.overdue or 0, result.due_today or 0, result.due_this_week or 0)
-
-
-def crud_get_task_period_counts(db: Session, scope_filter: Any, start_date: datetime) -> Tuple[int, int]:
-    period_query = select(
-        func.count(Task.id).label("created"),
-        func.sum(case((Task.status == "done", 1), else_=0)).label("completed"),
-    ).where(scope_filter, Task.created_at >= start_date)
-    result = db.exec(period_query).one()
-    return (result.created or 0, result.completed or 0)
+    return db.exec(agg_query).one()
 
 
 def crud_get_task_chart_data(db: Session, scope_filter: Any, start_date: Optional[datetime] = None) -> List[Tuple[Any, int, int]]:
-    date_col = func.date_trunc("day", Task.created_at).label("day")
-    chart_query = select(
-        date_col,
-        func.count(Task.id).label("count"),
-        func.sum(case((Task.status == "done", 1), else_=0)).label("completed"),
-    ).where(scope_filter)
-
     if start_date:
-        chart_query = chart_query.where(Task.created_at >= start_date)
+        days = _day_series(start_date)
+        chart_query = (
+            select(
+                days.c.day,
+                func.count(Task.id).label("count"),
+                func.count(Task.id).filter(Task.status == "done").label("completed"),
+            )
+            .select_from(days)
+            .outerjoin(Task, and_(func.date_trunc("day", Task.created_at) == days.c.day, Task.created_at >= start_date, scope_filter))
+            .group_by(days.c.day)
+            .order_by(days.c.day)
+        )
+        return db.exec(chart_query).all()
 
-    chart_query = chart_query.group_by(date_col).order_by(date_col)
+    date_col = func.date_trunc("day", Task.created_at).label("day")
+    chart_query = (
+        select(
+            date_col,
+            func.count(Task.id).label("count"),
+            func.count(Task.id).filter(Task.status == "done").label("completed"),
+        )
+        .where(scope_filter)
+        .group_by(date_col)
+        .order_by(date_col)
+    )
     return db.exec(chart_query).all()
 
 
-def crud_get_meeting_ids_subquery(scope_filter: Any, start_date: Optional[datetime] = None):
-    meeting_ids_subq = select(Meeting.id).where(scope_filter, Meeting.is_deleted == False)
-    if start_date:
-        meeting_ids_subq = meeting_ids_subq.where(Meeting.created_at >= start_date)
-    return meeting_ids_subq.scalar_subquery()
-
-
-def crud_get_meeting_count(db: Session, scope_filter: Any, start_date: Optional[datetime] = None) -> int:
-    count_query = select(func.count(func.distinct(Meeting.id))).where(scope_filter, Meeting.is_deleted == False)
-    if start_date:
-        count_query = count_query.where(Meeting.created_at >= start_date)
-    return db.exec(count_query).one() or 0
+def _rollup_windows(created_at: Any, start_date: Optional[datetime]) -> Tuple[Any, Any]:
+    """Split a chart range into whole days read from the rollups and partial days counted from the raw table."""
+    today = func.date_trunc("day", func.now())
+    if not start_date:
+        return UserDailyStats.day < today, created_at >= today
+    # A rollup row covers its whole day, but the period starts part-way through its first day
+    first_day = func.date_trunc("day", start_date)
+    rolled_up = and_(UserDailyStats.day > first_day, UserDailyStats.day < today)
+    live = or_(created_at >= today, and_(created_at >= start_date, created_at < first_day + literal_column("interval '1 day'")))
+    return rolled_up, live
+
+
+def crud_get_task_chart_data_from_rollups(db: Session, user_id: UUID, scope_filter: Any, start_date: Optional[datetime] = None) -> List[Tuple[Any, int, int]]:
+    rolled_up_days, live_rows = _rollup_windows(Task.created_at, start_date)
+    rolled_up = select(
+        UserDailyStats.day.label("day"),
+        UserDailyStats.tasks_created.label("count"),
+        UserDailyStats.tasks_completed.label("completed"),
+    ).where(UserDailyStats.user_id == user_id, rolled_up_days, UserDailyStats.tasks_created > 0)
+    live_day = func.date_trunc("day", Task.created_at)
+    live = (
+        select(
+            live_day.label("day"),
+            func.count(Task.id).label("count"),
+            func.count(Task.id).filter(Task.status == "done").label("completed"),
+        )
+        .where(scope_filter, live_rows)
+        .group_by(live_day)
+    )
+    return _chart_from_rollups(db, union_all(rolled_up, live).subquery(), start_date, with_value=True)
 
 
-def crud_get_bot_usage_count(db: Session, meeting_ids_scalar) -> int:
+def crud_get_meeting_dashboard_aggregates(db: Session, scope_filter: Any, start_date: Optional[datetime] = None) -> Any:
+    now = datetime.now(timezone.utc)
+    tomorrow = now + timedelta(hours=24)
+    in_period = Meeting.created_at >= start_date if start_date else true()
     bot_statuses = ["joined", "recording", "complete", "ended"]
-    bot_query = select(func.count(func.distinct(MeetingBot.meeting_id))).where(
-        MeetingBot.meeting_id.in_(meeting_ids_scalar),
-        MeetingBot.status.in_(bot_statuses),
+    has_bot = exists().where(MeetingBot.meeting_id == Meeting.id, MeetingBot.status.in_(bot_statuses))
+    has_transcript = exists().where(Transcript.meeting_id == Meeting.id)
+    meeting_ids_in_period = select(Meeting.id).where(scope_filter, Meeting.is_deleted == False, in_period).correlate(None).scalar_subquery()
+    duration = (
+        select(func.sum(AudioFile.duration_seconds))
+        .where(
+            AudioFile.meeting_id.in_(meeting_ids_in_period),
+            AudioFile.is_deleted == False,
+        )
+        .correlate(None)
+        .scalar_subquery()
     )
-    return db.exec(bot_query).one() or 0
 
+    agg_query = select(
+        func.count(Meeting.id).label("total"),
+        func.count(Meeting.id).filter(in_period).label("period_total"),
+        func.count(Meeting.id).filter(in_period, has_bot).label("bot_usage"),
+        func.count(Meeting.id).filter(in_period, has_transcript).label("with_transcript"),
+        func.count(Meeting.id).filter(Meeting.start_time > now, Meeting.status != MeetingStatus.cancelled).label("upcoming"),
+        func.count(Meeting.id).filter(Meeting.start_time > now, Meeting.start_time < tomorrow).label("upcoming_24h"),
+        duration.label("duration_seconds"),
+    ).where(scope_filter, Meeting.is_deleted == False)
 
-def crud_get_transcript_meeting_count(db: Session, meeting_ids_scalar) -> int:
-    transcript_query = select(func.count(func.distinct(Transcript.meeting_id))).where(Transcript.meeting_id.in_(meeting_ids_scalar))
-    return db.exec(transcript_query).one() or 0
+    return db.exec(agg_query).one()
 
 
-def crud_get_upcoming_meetings_count(db: Session, scope_filter: Any) -> int:
-    now = datetime.now(timezone.utc)
-    upcoming_query = select(func.count(Meeting.id)).where(
-        scope_filter,
-        Meeting.is_deleted == False,
-        Meeting.start_time > now,
-        Meeting.status != MeetingStatus.cancelled,
-    )
-    return db.exec(upcoming_query).one() or 0
+def crud_get_meeting_chart_data(db: Session, scope_filter: Any, start_date: Optional[datetime] = None) -> List[Tuple[Any, int]]:
+    if start_date:
+        days = _day_series(start_date)
+        chart_query = (
+            select(days.c.day, func.count(Meeting.id).label("count"))
+            .select_from(days)
+            .outerjoin(Meeting, and_(func.date_trunc("day", Meeting.created_at) == days.c.day, Meeting.created_at >= start_date, scope_filter, Meeting.is_deleted == False))
+            .group_by(days.c.day)
+            .order_by(days.c.day)
+        )
+        return db.exec(chart_query).all()
 
+    date_col = func.date_trunc("day", Meeting.created_at).label("day")
+    chart_query = select(date_col, func.count(Meeting.id).label("count")).where(scope_filter, Meeting.is_deleted == False).group_by(date_col).order_by(date_col)
+    return db.exec(chart_query).all()
 
-def crud_get_meeting_duration(db: Session, meeting_ids_scalar) -> int:
-    duration_query = select(func.sum(AudioFile.duration_seconds)).where(
-        AudioFile.meeting_id.in_(meeting_ids_scalar),
-        AudioFile.is_deleted == False,
-    )
-    return db.exec(duration_query).one() or 0
 
+def crud_get_meeting_chart_data_from_rollups(db: Session, user_id: UUID, scope_filter: Any, start_date: Optional[datetime] = None) -> List[Tuple[Any, int]]:
+    rolled_up_days, live_rows = _rollup_windows(Meeting.created_at, start_date)
+    rolled_up = select(
+        UserDailyStats.day.label("day"),
+        UserDailyStats.meetings_created.label("count"),
+    ).where(UserDailyStats.user_id == user_id, rolled_up_days, UserDailyStats.meetings_created > 0)
+    live_day = func.date_trunc("day", Meeting.created_at)
+    live = select(live_day.label("day"), func.count(Meeting.id).label("count")).where(scope_filter, Meeting.is_deleted == False, live_rows).group_by(live_day)
+    return _chart_from_rollups(db, union_all(rolled_up, live).subquery(), start_date, with_value=False)
 
-def crud_get_meeting_chart_data(db: Session, scope_filter: Any, start_date: Optional[datetime] = None) -> List[Tuple[Any, int]]:
-    date_col = func.date_trunc("day", Meeting.created_at).label("day")
-    chart_query = select(
-        date_col,
-        func.count(func.distinct(Meeting.id)).label("count"),
-    ).where(scope_filter, Meeting.is_deleted == False)
 
+def _chart_from_rollups(db: Session, combined: Any, start_date: Optional[datetime], with_value: bool) -> List[Tuple]:
     if start_date:
-        chart_query = chart_query.where(Meeting.created_at >= start_date)
+        days = _day_series(start_date)
+        columns = [days.c.day, func.coalesce(func.sum(combined.c.count), 0).label("count")]
+        if with_value:
+            columns.append(func.coalesce(func.sum(combined.c.completed), 0).label("completed"))
+        chart_query = select(*columns).select_from(days).outerjoin(combined, combined.c.day == days.c.day).group_by(days.c.day).order_by(days.c.day)
+        return db.exec(chart_query).all()
+
+    columns = [combined.c.day, combined.c.count]
+    if with_value:
+        columns.append(combined.c.completed)
+    return db.exec(select(*columns).order_by(combined.c.day)).all()
+
+
+def crud_refresh_user_daily_stats(db: Session, since: Optional[datetime] = None) -> int:
+    task_day = func.date_trunc("day", Task.created_at)
+    meeting_day = func.date_trunc("day", Meeting.created_at)
+
+    dirty_days = None
+    if since:
+        dirty_days = db.execute(
+            union(
+                select(task_day).where(or_(Task.created_at >= since, Task.updated_at >= since)),
+                select(meeting_day).where(or_(Meeting.created_at >= since, Meeting.updated_at >= since)),
+                select(meeting_day).join(AudioFile, AudioFile.meeting_id == Meeting.id).where(or_(AudioFile.created_at >= since, AudioFile.updated_at >= since)),
+            )
+        ).scalars().all()
+        if not dirty_days:
+            return 0
+
+    # A task counts once per user whether they created it, are assigned to it, or both
+    task_users = union(
+        select(Task.creator_id.label("user_id"), Task.id, Task.status, Task.created_at),
+        select(Task.assignee_id.label("user_id"), Task.id, Task.status, Task.created_at).where(Task.assignee_id.isnot(None)),
+    ).subquery()
+    task_users_day = func.date_trunc("day", task_users.c.created_at)
+    task_rows = select(
+        task_users.c.user_id,
+        task_users_day.label("day"),
+        func.count().label("tasks_created"),
+        func.count().filter(task_users.c.status == "todo").label("tasks_todo"),
+        func.count().filter(task_users.c.status == "in_progress").label("tasks_in_progress"),
+        func.count().filter(task_users.c.status == "done").label("tasks_completed"),
+        literal(0).label("meetings_created"),
+        literal(0).label("meeting_duration_seconds"),
+    ).group_by(task_users.c.user_id, task_users_day)
+
+    durations = select(AudioFile.meeting_id, func.sum(AudioFile.duration_seconds).label("seconds")).where(AudioFile.is_deleted == False).group_by(AudioFile.meeting_id).subquery()
+    meeting_rows = (
+        select(
+            Meeting.created_by.label("user_id"),
+            meeting_day.label("day"),
+            literal(0).label("tasks_created"),
+            literal(0).label("tasks_todo"),
+            literal(0).label("tasks_in_progress"),
+            literal(0).label("tasks_completed"),
+            func.count(Meeting.id).label("meetings_created"),
+            func.coalesce(func.sum(durations.c.seconds), 0).label("meeting_duration_seconds"),
+        )
+        .outerjoin(durations, durations.c.meeting_id == Meeting.id)
+        .where(Meeting.is_deleted == False)
+        .group_by(Meeting.created_by, meeting_day)
+    )
+    if dirty_days is not None:
+        task_rows = task_rows.where(task_users_day.in_(dirty_days))
+        meeting_rows = meeting_rows.where(meeting_day.in_(dirty_days))
 
-    chart_query = chart_query.group_by(date_col).order_by(date_col)
-    return db.exec(chart_query).all()
+    rows = union_all(task_rows, meeting_rows).subquery()
+    columns = ["user_id", "day", "tasks_created", "tasks_todo", "tasks_in_progress", "tasks_completed", "meetings_created", "meeting_duration_seconds"]
+    rollup_query = select(rows.c.user_id, rows.c.day, *[func.sum(rows.c[column]) for column in columns[2:]]).group_by(rows.c.user_id, rows.c.day)
+
+    clear_query = delete(UserDailyStats)
+    if dirty_days is not None:
+        clear_query = clear_query.where(UserDailyStats.day.in_(dirty_days))
+    db.execute(clear_query)
+    result = db.execute(insert(UserDailyStats).from_select(columns, rollup_query))
+    db.commit()
+    return result.rowcount
 
 
 def crud_get_project_aggregates(db: Session, user_id: UUID) -> Tuple[int, int, int, int, int]:
     query = (
         select(
             func.count(Project.id).label("total"),
-            func.sum(case((Project.is_archived == False, 1), else_=0)).label("active"),
-            func.sum(case((Project.is_archived == True, 1), else_=0)).label("archived"),
-            func.sum(case((UserProject.role.in_(["admin", "owner"]), 1), else_=0)).label("owned"),
-            func.sum(case((UserProject.role == "member", 1), else_=0)).label("member"),
+            func.count(Project.id).filter(Project.is_archived == False).label("active"),
+            func.count(Project.id).filter(Project.is_archived == True).label("archived"),
+            func.count(Project.id).filter(UserProject.role.in_(["admin", "owner"])).label("owned"),
+            func.count(Project.id).filter(UserProject.role == "member").label("member"),
         )
         .select_from(Project)
         .join(UserProject)
@@ -219,51 +347,25 @@ def crud_get_active_projects(db: Session, user_id: UUID, member_count_subq, task
     return db.exec(projects_query).all()
 
 
-def crud_get_summary_task_counts(db: Session, scope_filter: Any) -> Tuple[int, int]:
-    now = datetime.now(timezone.utc)
-    tomorrow = now + timedelta(hours=24)
-
-    task_query = select(
-        func.count(Task.id).label("total"),
-        func.sum(
-            case(
-                (
-                    and_(
-                        Task.status != "done",
-                        or_(
-                            and_(Task.due_date < now, Task.due_date.isnot(None)),
-                            and_(Task.due_date >= now, Task.due_date < tomorrow),
-                        ),
-                    ),
-                    1,
-                ),
-                else_=0,
-            )
-        ).label("pending"),
-    ).where(scope_filter)
-    result = db.exec(task_query).one()
-    return (result.total or 0, result.pending or 0)
-
+def crud_get_project_member_ids(db: Session, project_id: UUID) -> Set[UUID]:
+    return set(db.exec(select(UserProject.user_id).where(UserProject.project_id == project_id)).all())
 
-def crud_get_summary_meeting_counts(db: Session, scope_filter: Any) -> Tuple[int, int]:
-    now = datetime.now(timezone.utc)
-    tomorrow = now + timedelta(hours=24)
 
-    meeting_query = select(
-        func.count(Meeting.id).label("total"),
-        func.sum(case((and_(Meeting.start_time > now, Meeting.start_time < tomorrow), 1), else_=0)).label("upcoming_24h"),
-    ).where(scope_filter, Meeting.is_deleted == False)
-    result = db.exec(meeting_query).one()
-    return (result.total or 0, result.upcoming_24h or 0)
+def crud_get_task_stakeholder_ids(db: Session, task_id: UUID) -> Set[UUID]:
+    user_ids = set()
+    task = db.exec(select(Task.creator_id, Task.assignee_id).where(Task.id == task_id)).first()
+    if task:
+        user_ids.update(user_id for user_id in task if user_id)
+    project_ids = select(TaskProject.project_id).where(TaskProject.task_id == task_id)
+    user_ids.update(db.exec(select(UserProject.user_id).where(UserProject.project_id.in_(project_ids))).all())
+    return user_ids
 
 
-def crud_get_summary_project_count(db: Session, user_id: UUID) -> int:
-    project_query = (
-        select(func.count(Project.id))
-        .join(UserProject)
-        .where(
-            UserProject.user_id == user_id,
-            Project.is_archived == False,
-        )
-    )
-    return db.exec(project_query).one() or 0
+def crud_get_meeting_stakeholder_ids(db: Session, meeting_id: UUID) -> Set[UUID]:
+    user_ids = set()
+    created_by = db.exec(select(Meeting.created_by).where(Meeting.id == meeting_id)).first()
+    if created_by:
+        user_ids.add(created_by)
+    project_ids = select(ProjectMeeting.project_id).where(ProjectMeeting.meeting_id == meeting_id)
+    user_ids.update(db.exec(select(UserProject.user_id).where(UserProject.project_id.in_(project_ids))).all())
+    return user_ids
@@ -5,8 +5,10 @@ from typing import List, Optional, Tuple
 from sqlalchemy.orm import Session, selectinload
 
 from app.models.meeting import Meeting, ProjectMeeting
-from app.models.project import Project, UserProject
+from app.models.project import UserProject
 from app.models.task import Task, TaskProject
+from app.utils.access import get_user_project_ids
+from app.utils.pagination import apply_cursor, order_by_position
 
 
 def crud_create_task(db: Session, **task_data) -> Task:
@@ -44,7 +46,9 @@ def crud_get_tasks(
     created_at_lte: Optional[str] = None,
     page: int = 1,
     limit: int = 20,
-) -> Tuple[List[Task], int]:
+    cursor: Optional[str] = None,
+    include_total: bool = True,
+) -> Tuple[List[Task], Optional[int]]:
     query = db.query(Task).options(
         selectinload(Task.creator),
         selectinload(Task.assignee),
@@ -68,18 +72,20 @@ def crud_get_tasks(
     if created_at_lte:
         query = query.filter(Task.created_at <= datetime.fromisoformat(created_at_lte))
 
-    user_projects = db.query(Project.id).join(Project.users).filter(Project.users.any(user_id=user_id)).subquery()
-    user_meetings = db.query(Meeting.id).join(ProjectMeeting, Meeting.id == ProjectMeeting.meeting_id).join(Project, ProjectMeeting.project_id == Project.id).join(Project.users).filter(Project.users.any(user_id=user_id)).subquery()
+    user_projects = list(get_user_project_ids(db, user_id))
+    user_meetings = db.query(ProjectMeeting.meeting_id).filter(ProjectMeeting.project_id.in_(user_projects)).subquery()
 
     task_projects_subquery = db.query(TaskProject.task_id).filter(TaskProject.project_id.in_(user_projects)).subquery()
 
     query = query.filter((Task.creator_id == user_id) | (Task.assignee_id == user_id) | (Task.id.in_(task_projects_subquery)) | (Task.meeting_id.in_(user_meetings)))
     if meeting_id:
         query = query.filter(Task.meeting_id == meeting_id)
-    total = query.count()
-    query = query.order_by(Task.created_at.desc(), Task.updated_at.desc())
-    offset = (page - 1) * limit
-    tasks = query.offset(offset).limit(limit).all()
+    total = query.count() if cursor is None or include_total else None
+    if cursor:
+        tasks = order_by_position(apply_cursor(query, Task, cursor), Task).limit(limit).all()
+    else:
+        offset = (page - 1) * limit
+        tasks = order_by_position(query, Task).offset(offset).limit(limit).all()
 
     return tasks, total
 
@@ -117,7 +123,9 @@ def crud_check_direct_access(task: Task, user_id: uuid.UUID) -> bool:
 
 
 def crud_check_project_access(db: Session, task_id: uuid.UUID, user_id: uuid.UUID) -> bool:
-    user_projects = db.query(Project.id).join(Project.users).filter(Project.users.any(user_id=user_id)).subquery()
+    user_projects = get_user_project_ids(db, user_id)
+    if not user_projects:
+        return False
     return db.query(TaskProject).filter(TaskProject.task_id == task_id, TaskProject.project_id.in_(user_projects)).first() is not None
 
 
@@ -125,12 +133,12 @@ def crud_check_meeting_access(db: Session, meeting_id: uuid.UUID, user_id: uuid.
     meeting = db.query(Meeting).filter(Meeting.id == meeting_id).first()
     if meeting and meeting.created_by == user_id:
         return True
-    linked_projects = db.query(ProjectMeeting.project_id).filter(ProjectMeeting.meeting_id == meeting_id).subquery()
-    return db.query(UserProject).filter(UserProject.user_id == user_id, UserProject.project_id.in_(linked_projects)).first() is not None
+    linked_projects = [project_id for (project_id,) in db.query(ProjectMeeting.project_id).filter(ProjectMeeting.meeting_id == meeting_id).all()]
+    return not get_user_project_ids(db, user_id).isdisjoint(linked_projects)
 
 
 def crud_check_user_project_access(db: Session, project_id: uuid.UUID, user_id: uuid.UUID) -> bool:
-    return db.query(Project).join(Project.users).filter(Project.id == project_id, Project.users.any(user_id=user_id)).first() is not None
+    return project_id in get_user_project_ids(db, user_id)
 
 
 def crud_get_task_status_notifyees(db: Session, task_id: uuid.UUID, task: Task, user_id: uuid.UUID) -> set:
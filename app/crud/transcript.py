@@ -1,10 +1,10 @@
 import uuid
 from typing import List, Optional, Tuple
 
-from sqlalchemy import or_
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import and_, func, literal, literal_column, or_
+from sqlalchemy.orm import Session, defer, joinedload
 
-from app.models.meeting import Meeting, ProjectMeeting, Transcript
+from app.models.meeting import TRANSCRIPT_SEARCH_DOCUMENT, Meeting, ProjectMeeting, Transcript
 from app.models.project import Project, UserProject
 
 
@@ -24,17 +24,34 @@ def crud_get_transcripts(
     meeting_id: Optional[uuid.UUID] = None,
     page: int = 1,
     limit: int = 20,
-) -> Tuple[List[Transcript], int]:
+) -> Tuple[List[Tuple[Transcript, Optional[str]]], int]:
     query = db.query(Transcript).options(joinedload(Transcript.meeting), joinedload(Transcript.audio_concat_file))
-    accessible_meetings = db.query(Meeting.id).outerjoin(ProjectMeeting).outerjoin(Project).outerjoin(UserProject).filter(or_(Meeting.is_personal == True and Meeting.created_by == user_id, UserProject.user_id == user_id)).subquery()
+    accessible_meetings = db.query(Meeting.id).outerjoin(ProjectMeeting).outerjoin(Project).outerjoin(UserProject).filter(or_(and_(Meeting.is_personal == True, Meeting.created_by == user_id), UserProject.user_id == user_id)).subquery()
     query = query.filter(Transcript.meeting_id.in_(accessible_meetings))
-    if content_search:
-        query = query.filter(or_(Transcript.content.ilike(f"%{content_search}%"), Transcript.extracted_text_for_search.ilike(f"%{content_search}%")))
     if meeting_id:
         query = query.filter(Transcript.meeting_id == meeting_id)
+
+    if not content_search:
+        total = query.count()
+        transcripts = query.offset((page - 1) * limit).limit(limit).all()
+        return [(transcript, None) for transcript in transcripts], total
+
+    search_query = func.websearch_to_tsquery(literal_column("'simple'"), literal(content_search))
+    document = literal_column(TRANSCRIPT_SEARCH_DOCUMENT)
+    query = query.filter(document.op("@@")(search_query))
     total = query.count()
-    transcripts = query.offset((page - 1) * limit).limit(limit).all()
-    return transcripts, total
+
+    # Rank and page on ids first so ts_headline only runs over the returned rows
+    page_ids = query.with_entities(Transcript.id, func.ts_rank_cd(document, search_query).label("rank")).order_by(literal_column("rank").desc(), Transcript.id).offset((page - 1) * limit).limit(limit).subquery()
+    snippet = func.ts_headline(literal_column("'simple'"), func.coalesce(Transcript.content, Transcript.extracted_text_for_search, ""), search_query, "MaxFragments=2, MinWords=10, MaxWords=30, FragmentDelimiter=\" ... \"")
+    rows = (
+        db.query(Transcript, snippet)
+        .join(page_ids, page_ids.c.id == Transcript.id)
+        .options(joinedload(Transcript.meeting), joinedload(Transcript.audio_concat_file), defer(Transcript.content), defer(Transcript.extracted_text_for_search))
+        .order_by(page_ids.c.rank.desc(), Transcript.id)
+        .all()
+    )
+    return [(transcript, snippet) for transcript, snippet in rows], total
 
 
 def crud_create_transcript(db: Session, **transcript_data) -> Transcript:
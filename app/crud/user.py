@@ -5,6 +5,8 @@ from typing import List, Optional, Tuple
 from sqlalchemy.orm import Session, selectinload
 
 from app.models.user import User
+from app.utils.access import invalidate_user_access
+from app.utils.user_cache import user_cache
 
 
 def crud_get_users(db: Session, **kwargs) -> Tuple[List[User], int]:
@@ -69,6 +71,7 @@ def crud_update_user(db: Session, user_id: uuid.UUID, **updates) -> User:
         if hasattr(user, key):
             setattr(user, key, value)
     db.commit()
+    user_cache.invalidate(user_id)
     db.refresh(user)
     return user
 
@@ -94,15 +97,12 @@ def crud_delete_user_with_cascade(db: Session, user_id: uuid.UUID) -> bool:
     if not user:
         return False
 
-    # Delete user's files
+    # Delete user's files; their objects and vectors are removed in the background after commit
     from app.core.config import settings
     from app.models.file import File
-    from app.utils.minio import delete_file_from_minio
 
-    user_files = db.query(File).filter(File.uploader_id == user_id).all()
-    for file in user_files:
-        delete_file_from_minio(settings.MINIO_BUCKET_NAME, str(file.id))
-        db.delete(file)
+    user_file_ids = [file_id for (file_id,) in db.query(File.id).filter(File.uploaded_by == user_id).all()]
+    db.query(File).filter(File.uploaded_by == user_id).delete(synchronize_session=False)
 
     # Delete user's projects with cascade
     from app.models.meeting import ProjectMeeting
@@ -110,8 +110,10 @@ def crud_delete_user_with_cascade(db: Session, user_id: uuid.UUID) -> bool:
     from app.models.task import TaskProject
 
     user_projects = db.query(Project).filter(Project.created_by == user_id).all()
+    affected_member_ids = {user_id}
     for project in user_projects:
         project_id = project.id
+        affected_member_ids.update(member_id for (member_id,) in db.query(UserProject.user_id).filter(UserProject.project_id == project_id).all())
         db.query(UserProject).filter(UserProject.project_id == project_id).delete()
         db.query(ProjectMeeting).filter(ProjectMeeting.project_id == project_id).delete()
         db.query(TaskProject).filter(TaskProject.project_id == project_id).delete()
@@ -132,6 +134,12 @@ def crud_delete_user_with_cascade(db: Session, user_id: uuid.UUID) -> bool:
     # Finally delete the user
     db.delete(user)
     db.commit()
+    user_cache.invalidate(user_id)
+    invalidate_user_access(affected_member_ids)
+
+    from app.services.storage_cleanup import schedule_storage_cleanup
+
+    schedule_storage_cleanup({settings.MINIO_BUCKET_NAME: [str(file_id) for file_id in user_file_ids]}, user_file_ids)
     return True
 
 
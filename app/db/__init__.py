@@ -109,14 +109,37 @@ def create_tables() -> None:
         TaskProject,  # noqa: F401
         Transcript,  # noqa: F401
         User,  # noqa: F401
+        UserDailyStats,  # noqa: F401
         UserDevice,  # noqa: F401
         UserIdentity,  # noqa: F401
         UserProject,  # noqa: F401
     )
 
     try:
+        # Trigram indexes used by search need pg_trgm before the tables are created
+        from sqlalchemy import text
+
+        with engine.begin() as conn:
+            conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+
         # Use SQLModel.metadata.create_all() - this includes all registered tables
         SQLModel.metadata.create_all(bind=engine)
+
+        # create_all skips indexes on tables that already exist, so add any missing ones
+        for table in SQLModel.metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(bind=engine, checkfirst=True)
+
+        # Likewise add nullable columns introduced on existing tables; anything else needs a manual migration
+        from sqlalchemy import inspect
+
+        inspector = inspect(engine)
+        with engine.begin() as conn:
+            for table in SQLModel.metadata.sorted_tables:
+                existing_columns = {column["name"] for column in inspector.get_columns(table.name)}
+                for column in table.columns:
+                    if column.name not in existing_columns and column.nullable and column.server_default is None:
+                        conn.execute(text(f'ALTER TABLE "{table.name}" ADD COLUMN IF NOT EXISTS "{column.name}" {column.type.compile(dialect=engine.dialect)}'))
     except Exception:
         print("[Database] Error creating tables")
         raise
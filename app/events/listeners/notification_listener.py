@@ -1,6 +1,7 @@
 from app.events.base import BaseListener
-from app.events.project_events import UserAddedToProjectEvent, UserRemovedFromProjectEvent
+from app.events.project_events import UserAddedToProjectEvent, UserRemovedFromProjectEvent, UsersAddedToProjectEvent, UsersRemovedFromProjectEvent
 from app.models.project import Project
+from app.models.user import User
 from app.services.notification import create_notifications_bulk, send_fcm_notification
 from app.services.project import get_project_members
 from app.services.user import get_user_by_id
@@ -12,6 +13,10 @@ class NotificationListener(BaseListener):
             self._handle_user_added(event)
         elif isinstance(event, UserRemovedFromProjectEvent):
             self._handle_user_removed(event)
+        elif isinstance(event, UsersAddedToProjectEvent):
+            self._handle_users_added(event)
+        elif isinstance(event, UsersRemovedFromProjectEvent):
+            self._handle_users_removed(event)
 
     def _handle_user_added(self, event: UserAddedToProjectEvent):
         try:
@@ -51,6 +56,7 @@ class NotificationListener(BaseListener):
                     "user_joined_project",
                     f"{added_user.name or added_user.email}",
                     notification_data["payload"],
+                    db=db,
                 )
 
             # 2. Notify added user
@@ -73,6 +79,7 @@ class NotificationListener(BaseListener):
                 "added_to_project",
                 f"{added_by_user.name or added_by_user.email}",
                 added_notification_data["payload"],
+                db=db,
             )
 
         except Exception:
@@ -117,6 +124,7 @@ class NotificationListener(BaseListener):
                     "user_removed_project",
                     f"{removed_user.name or removed_user.email}",
                     notification_data["payload"],
+                    db=db,
                 )
 
             # 2. Notify removed user (if removed by admin, not self-removal)
@@ -140,6 +148,139 @@ class NotificationListener(BaseListener):
                     "removed_from_project",
                     f"{project.name}",
                     removed_notification_data["payload"],
+                    db=db,
+                )
+
+        except Exception:
+            pass
+
+    def _handle_users_added(self, event: UsersAddedToProjectEvent):
+        """One notification per recipient for a bulk add, instead of one per added user."""
+        try:
+            db = event.db
+            project = db.query(Project).filter(Project.id == event.project_id).first()
+            added_by_user = get_user_by_id(db, event.added_by_user_id)
+            if not project or not added_by_user:
+                return
+
+            added_users = db.query(User).filter(User.id.in_(event.user_ids)).all()
+            added_ids = {user.id for user in added_users}
+            members = get_project_members(db, event.project_id)
+
+            # 1. Notify other members once with all added users
+            other_member_ids = [m.user_id for m in members if m.user_id not in added_ids]
+            if other_member_ids and added_users:
+                user_names = [user.name or user.email for user in added_users]
+                notification_data = {
+                    "type": "users_joined_project",
+                    "payload": {
+                        "event_type": "users_joined_project",
+                        "project_id": str(event.project_id),
+                        "project_name": project.name,
+                        "user_ids": [str(user.id) for user in added_users],
+                        "user_names": user_names,
+                    },
+                    "channel": "in_app",
+                }
+
+                create_notifications_bulk(db, other_member_ids, **notification_data)
+
+                send_fcm_notification(
+                    other_member_ids,
+                    "users_joined_project",
+                    ", ".join(user_names),
+                    notification_data["payload"],
+                    db=db,
+                )
+
+            # 2. Notify added users; they all receive the same payload
+            if added_ids:
+                added_notification_data = {
+                    "type": "added_to_project",
+                    "payload": {
+                        "event_type": "added_to_project",
+                        "project_id": str(event.project_id),
+                        "project_name": project.name,
+                        "added_by_id": str(event.added_by_user_id),
+                        "added_by_name": added_by_user.name or added_by_user.email,
+                    },
+                    "channel": "in_app",
+                }
+
+                create_notifications_bulk(db, list(added_ids), **added_notification_data)
+
+                send_fcm_notification(
+                    list(added_ids),
+                    "added_to_project",
+                    f"{added_by_user.name or added_by_user.email}",
+                    added_notification_data["payload"],
+                    db=db,
+                )
+
+        except Exception:
+            pass
+
+    def _handle_users_removed(self, event: UsersRemovedFromProjectEvent):
+        """One notification per recipient for a bulk removal, instead of one per removed user."""
+        try:
+            db = event.db
+            project = db.query(Project).filter(Project.id == event.project_id).first()
+            removed_by_user = get_user_by_id(db, event.removed_by_user_id)
+            if not project or not removed_by_user:
+                return
+
+            removed_users = db.query(User).filter(User.id.in_(event.user_ids)).all()
+            members = get_project_members(db, event.project_id)
+
+            # 1. Notify remaining members once with all removed users
+            remaining_member_ids = [m.user_id for m in members]
+            if remaining_member_ids and removed_users:
+                user_names = [user.name or user.email for user in removed_users]
+                notification_data = {
+                    "type": "users_removed_project",
+                    "payload": {
+                        "event_type": "users_removed_project",
+                        "project_id": str(event.project_id),
+                        "project_name": project.name,
+                        "user_ids": [str(user.id) for user in removed_users],
+                        "user_names": user_names,
+                    },
+                    "channel": "in_app",
+                }
+
+                create_notifications_bulk(db, remaining_member_ids, **notification_data)
+
+                send_fcm_notification(
+                    remaining_member_ids,
+                    "users_removed_project",
+                    ", ".join(user_names),
+                    notification_data["payload"],
+                    db=db,
+                )
+
+            # 2. Notify removed users, except the actor removing themselves
+            removed_ids = [user.id for user in removed_users if user.id != event.removed_by_user_id]
+            if removed_ids:
+                removed_notification_data = {
+                    "type": "removed_from_project",
+                    "payload": {
+                        "event_type": "removed_from_project",
+                        "project_id": str(event.project_id),
+                        "project_name": project.name,
+                        "removed_by_id": str(event.removed_by_user_id),
+                        "removed_by_name": removed_by_user.name or removed_by_user.email,
+                    },
+                    "channel": "in_app",
+                }
+
+                create_notifications_bulk(db, removed_ids, **removed_notification_data)
+
+                send_fcm_notification(
+                    removed_ids,
+                    "removed_from_project",
+                    f"{project.name}",
+                    removed_notification_data["payload"],
+                    db=db,
                 )
 
         except Exception:
@@ -1,9 +1,9 @@
 import asyncio
 
 from app.events.base import BaseListener
-from app.events.project_events import UserAddedToProjectEvent, UserRemovedFromProjectEvent
+from app.events.project_events import UserAddedToProjectEvent, UserRemovedFromProjectEvent, UsersAddedToProjectEvent, UsersRemovedFromProjectEvent
 from app.services.project import get_project_members
-from app.utils.redis import publish_to_user_channel
+from app.utils.redis import publish_to_user_channel, publish_to_user_channels
 
 
 class WebSocketListener(BaseListener):
@@ -24,6 +24,10 @@ class WebSocketListener(BaseListener):
                 loop.run_until_complete(self._handle_user_added(event))
             elif isinstance(event, UserRemovedFromProjectEvent):
                 loop.run_until_complete(self._handle_user_removed(event))
+            elif isinstance(event, UsersAddedToProjectEvent):
+                loop.run_until_complete(self._handle_users_added(event))
+            elif isinstance(event, UsersRemovedFromProjectEvent):
+                loop.run_until_complete(self._handle_users_removed(event))
         except Exception as e:
             print(f"{self.colors.RED}[WebSocketListener] Error handling event {event_type}: {str(e)}{self.colors.RESET}")
 
@@ -44,11 +48,7 @@ class WebSocketListener(BaseListener):
 
             await publish_to_user_channel(str(event.user_id), confirmation_message)
 
-            for member in members:
-                if member.user_id != event.user_id:
-                    member_id = str(member.user_id)
-
-                    await publish_to_user_channel(member_id, message)
+            await publish_to_user_channels([member.user_id for member in members if member.user_id != event.user_id], message)
 
         except Exception:
             pass
@@ -70,10 +70,52 @@ class WebSocketListener(BaseListener):
 
             await publish_to_user_channel(str(event.user_id), removal_confirmation_message)
 
-            for member in members:
-                member_id = str(member.user_id)
+            await publish_to_user_channels([member.user_id for member in members], message)
+
+        except Exception:
+            pass
+
+    async def _handle_users_added(self, event: UsersAddedToProjectEvent):
+        try:
+            db = event.db
+            members = get_project_members(db, event.project_id)
+            added_ids = set(event.user_ids)
+
+            message = {
+                "type": "users_joined",
+                "data": {"project_id": str(event.project_id), "user_ids": [str(user_id) for user_id in event.user_ids]},
+            }
+
+            confirmation_message = {
+                "type": "you_added_to_project",
+                "data": {"project_id": str(event.project_id), "added_by_user_id": str(event.added_by_user_id), "message": f"You were added to project {event.project_id}"},
+            }
+
+            await publish_to_user_channels(list(added_ids), confirmation_message)
+
+            await publish_to_user_channels([member.user_id for member in members if member.user_id not in added_ids], message)
+
+        except Exception:
+            pass
+
+    async def _handle_users_removed(self, event: UsersRemovedFromProjectEvent):
+        try:
+            db = event.db
+            members = get_project_members(db, event.project_id)
+
+            message = {
+                "type": "users_removed",
+                "data": {"project_id": str(event.project_id), "user_ids": [str(user_id) for user_id in event.user_ids]},
+            }
+
+            removal_confirmation_message = {
+                "type": "you_removed_from_project",
+                "data": {"project_id": str(event.project_id), "removed_by_user_id": str(event.removed_by_user_id), "is_self_removal": False, "message": f"You were removed from project {event.project_id}"},
+            }
+
+            await publish_to_user_channels([user_id for user_id in event.user_ids if user_id != event.removed_by_user_id], removal_confirmation_message)
 
-                await publish_to_user_channel(member_id, message)
+            await publish_to_user_channels([member.user_id for member in members], message)
 
         except Exception:
             pass
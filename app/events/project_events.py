@@ -1,5 +1,6 @@
 import uuid
 from datetime import datetime
+from typing import List
 
 from sqlalchemy.orm import Session
 
@@ -38,3 +39,39 @@ class UserRemovedFromProjectEvent(BaseEvent):
         self.removed_by_user_id = removed_by_user_id
         self.db = db
         self.is_self_removal = is_self_removal
+
+
+class UsersAddedToProjectEvent(BaseEvent):
+    """Several users added to a project at once, e.g. by a bulk request."""
+
+    def __init__(
+        self,
+        project_id: uuid.UUID,
+        user_ids: List[uuid.UUID],
+        added_by_user_id: uuid.UUID,
+        db: Session,
+        timestamp: datetime = None,
+    ):
+        super().__init__(timestamp)
+        self.project_id = project_id
+        self.user_ids = user_ids
+        self.added_by_user_id = added_by_user_id
+        self.db = db
+
+
+class UsersRemovedFromProjectEvent(BaseEvent):
+    """Several users removed from a project at once, e.g. by a bulk request."""
+
+    def __init__(
+        self,
+        project_id: uuid.UUID,
+        user_ids: List[uuid.UUID],
+        removed_by_user_id: uuid.UUID,
+        db: Session,
+        timestamp: datetime = None,
+    ):
+        super().__init__(timestamp)
+        self.project_id = project_id
+        self.user_ids = user_ids
+        self.removed_by_user_id = removed_by_user_id
+        self.db = db
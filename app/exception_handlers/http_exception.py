@@ -56,7 +56,7 @@ async def custom_http_exception_handler(request: Request, exc: HTTPException):
         message = exc.detail.get("message", str(exc.detail))
         data = exc.detail.get("data")
 
-    return JSONResponse(status_code=exc.status_code, content=ApiResponse(message=message, success=False, data=data).model_dump())
+    return JSONResponse(status_code=exc.status_code, content=ApiResponse(message=message, success=False, data=data).model_dump(), headers=getattr(exc, "headers", None))
 
 
 async def custom_exception_handler(request: Request, exc: Exception):
@@ -1,6 +1,7 @@
 import time
 
 from celery import Celery
+from celery.schedules import crontab
 
 from app.core.config import settings
 from app.core.firebase import initialize_firebase
@@ -32,6 +33,23 @@ celery_app.conf.update(
     # Retry settings
     task_default_retry_delay=60,
     task_max_retries=3,
+    # Periodic jobs (requires a celery beat process)
+    beat_schedule={
+        "refresh-statistics-rollups": {
+            "task": "app.jobs.tasks.refresh_statistics_rollups_task",
+            "schedule": 15 * 60,
+        },
+        # Incremental refreshes cannot see hard-deleted rows, so rebuild everything nightly
+        "rebuild-statistics-rollups": {
+            "task": "app.jobs.tasks.refresh_statistics_rollups_task",
+            "schedule": crontab(hour=3, minute=0),
+            "kwargs": {"full": True},
+        },
+        "cleanup-expired-upload-slots": {
+            "task": "app.jobs.tasks.cleanup_expired_upload_slots_task",
+            "schedule": 10 * 60,
+        },
+    },
 )
 
 
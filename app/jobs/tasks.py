@@ -3,6 +3,7 @@ import hashlib
 import json
 import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 
@@ -22,9 +23,11 @@ from app.services.audit_service import AuditLogService
 from app.services.notification import create_notifications_bulk, send_fcm_notification
 from app.services.qdrant_service import (
     chunk_text,
+    delete_files_vectors,
     delete_transcript_vectors,
     reindex_file,
 )
+from app.services.statistics import ROLLUP_LOCK_KEY, invalidate_dashboard_stats_for_event, refresh_daily_stats
 from app.services.transcript import transcribe_audio_file
 from app.utils.llm import (
     create_general_chat_agent,
@@ -132,6 +135,92 @@ def process_domain_event(self, event_dict: dict) -> None:  # noqa: ARG001
         logger.error(f"Domain event task failed: {type(e).__name__}: {str(e)}")
 
 
+@celery_app.task(soft_time_limit=60, time_limit=120)
+def invalidate_dashboard_stats_task(event_dict: dict) -> None:
+    """Drop the cached dashboards of the users a domain event affects."""
+    from app.db import SessionLocal as SQLModelSessionLocal
+
+    db = SQLModelSessionLocal()
+    try:
+        invalidate_dashboard_stats_for_event(db, event_dict)
+    except Exception as e:
+        logger.warning(f"Dashboard cache invalidation failed: {type(e).__name__}: {str(e)}")
+    finally:
+        db.close()
+
+
+@celery_app.task(soft_time_limit=1800, time_limit=3600)
+def refresh_statistics_rollups_task(full: bool = False) -> int:
+    """Refresh the per-user daily statistics rollups used by long-range dashboard charts."""
+    from app.db import SessionLocal as SQLModelSessionLocal
+
+    # Overlapping runs would race on the same rollup rows; a full rebuild waits, an incremental run is skipped
+    lock = sync_redis_client.lock(ROLLUP_LOCK_KEY, timeout=3600)
+    if not lock.acquire(blocking=full, blocking_timeout=1800):
+        logger.info("Statistics rollup refresh already running; skipping")
+        return 0
+
+    db = SQLModelSessionLocal()
+    try:
+        return refresh_daily_stats(db, full=full)
+    except Exception as e:
+        logger.error(f"Statistics rollup refresh failed: {type(e).__name__}: {str(e)}")
+        raise
+    finally:
+        db.close()
+        try:
+            lock.release()
+        except Exception:
+            pass
+
+
+@celery_app.task(soft_time_limit=600, time_limit=900)
+def cleanup_expired_upload_slots_task() -> int:
+    """Drop pending direct uploads whose presigned URL expired without being completed."""
+    from app.db import SessionLocal as SQLModelSessionLocal
+    from app.services.upload import cleanup_expired_upload_slots
+
+    db = SQLModelSessionLocal()
+    try:
+        removed = cleanup_expired_upload_slots(db)
+        if removed:
+            logger.info(f"Cleaned up {removed} expired upload slots")
+        return removed
+    except Exception as e:
+        logger.error(f"Upload slot cleanup failed: {type(e).__name__}: {str(e)}")
+        raise
+    finally:
+        db.close()
+
+
+@celery_app.task(bind=True, max_retries=5, soft_time_limit=900, time_limit=1200)
+def delete_storage_objects_task(self, objects_by_bucket: Dict[str, List[str]], file_ids: Optional[List[str]] = None) -> Dict[str, Any]:
+    """Delete storage objects per bucket and the vectors of deleted files, retrying only what failed."""
+    from app.utils.minio import delete_objects_from_minio
+
+    file_ids = file_ids or []
+    # Buckets are deleted in parallel with the vector cleanup
+    with ThreadPoolExecutor(max_workers=len(objects_by_bucket) + 1) as executor:
+        vectors_future = executor.submit(asyncio.run, delete_files_vectors(file_ids, settings.QDRANT_COLLECTION_NAME)) if file_ids else None
+        bucket_futures = {bucket: executor.submit(delete_objects_from_minio, bucket, names) for bucket, names in objects_by_bucket.items()}
+        failed_objects = {bucket: future.result() for bucket, future in bucket_futures.items()}
+        vectors_deleted = vectors_future.result() if vectors_future else True
+
+    failed_objects = {bucket: names for bucket, names in failed_objects.items() if names}
+    failed_file_ids = [] if vectors_deleted else file_ids
+    result = {
+        "deleted_objects": sum(len(names) for names in objects_by_bucket.values()) - sum(len(names) for names in failed_objects.values()),
+        "failed_objects": failed_objects,
+        "failed_file_ids": failed_file_ids,
+    }
+    if failed_objects or failed_file_ids:
+        if self.request.retries < self.max_retries:
+            logger.warning(f"Storage cleanup partially failed, retrying: {result}")
+            raise self.retry(args=(failed_objects, failed_file_ids), countdown=60 * 2**self.request.retries)
+        logger.error(f"Storage cleanup gave up after {self.request.retries} retries: {result}")
+    return result
+
+
 def fetch_conversation_history_sync(conversation_id: str, limit: int = 10) -> List[Message]:
     """Synchronous version of fetch_conversation_history for use in Celery tasks."""
     from app.db import SessionLocal
@@ -161,17 +250,13 @@ async def _perform_async_indexing(
     """Async helper function to perform file indexing"""
     try:
         import os
-        import tempfile
-
-        from app.utils.minio import get_minio_client
 
-        minio_client = get_minio_client()
-        file_content = minio_client.get_object(bucket_name=settings.MINIO_BUCKET_NAME, object_name=file_id)
+        from app.utils.minio import download_file_to_temp_from_minio
 
-        # Create temporary file
-        with tempfile.NamedTemporaryFile(delete=False, suffix=f"_{filename}") as temp_file:
-            temp_file.write(file_content.data)
-            temp_file_path = temp_file.name
+        # Stream the object to disk instead of holding it in memory
+        temp_file_path = download_file_to_temp_from_minio(settings.MINIO_BUCKET_NAME, file_id, suffix=f"_{filename}")
+        if not temp_file_path:
+            return False
 
         try:
             # Use qdrant_service to reindex the file (cleans up old vectors first)
@@ -329,6 +414,41 @@ def _get_meeting_member_ids(db, meeting_id: uuid.UUID, include_creator: bool = T
     return list(set(members))
 
 
+@celery_app.task(bind=True, soft_time_limit=900, time_limit=1200)
+def ingest_remote_audio_task(self, meeting_id: str, user_id: str, file_url: str, idempotency_key: Optional[str] = None) -> Dict[str, Any]:
+    """Stream a remote audio file straight into storage and create its audio file row."""
+    from app.schemas.audio_file import AudioFileCreate
+    from app.services.audio_file import create_audio_file_from_stream
+    from app.utils.http import open_url_stream
+    from app.utils.idempotency import release_idempotency_key
+
+    task_id = self.request.id or f"ingest_audio_{meeting_id}_{int(time.time())}"
+    max_size = settings.WEBHOOK_AUDIO_MAX_SIZE_MB * 1024 * 1024
+    db = SessionLocal()
+    try:
+        update_task_progress(task_id, user_id, 0, "downloading", task_type="webhook_audio")
+
+        with open_url_stream(file_url, max_size=max_size) as response:
+            content_type = response.headers.get("content-type", "audio/webm").split(";")[0].strip()
+            audio_data = AudioFileCreate(meeting_id=uuid.UUID(meeting_id), uploaded_by=uuid.UUID(user_id))
+            audio_file = create_audio_file_from_stream(db, audio_data, response.raw, content_type, max_size=max_size)
+        if not audio_file:
+            raise Exception("Failed to store downloaded audio file")
+
+        update_task_progress(task_id, user_id, 100, "completed", task_type="webhook_audio")
+        logger.info(f"Ingested remote audio {file_url} as audio file {audio_file.id}")
+        return {"success": True, "audio_file_id": str(audio_file.id), "meeting_id": meeting_id}
+    except Exception as e:
+        logger.error(f"Remote audio ingestion failed for {file_url}: {type(e).__name__}: {str(e)}")
+        update_task_progress(task_id, user_id, 0, "failed", task_type="webhook_audio")
+        # Let a redelivery of the same webhook try again
+        if idempotency_key:
+            release_idempotency_key(f"webhook_audio:{user_id}", idempotency_key)
+        return {"success": False, "error": str(e)}
+    finally:
+        db.close()
+
+
 @celery_app.task(bind=True)
 def process_audio_task(self, audio_file_id: str, actor_user_id: str) -> Dict[str, Any]:
     task_id = self.request.id or f"process_audio_{audio_file_id}_{int(time.time())}"
@@ -413,6 +533,7 @@ def process_audio_task(self, audio_file_id: str, actor_user_id: str) -> Dict[str
                 "meeting_id": str(meeting_id),
                 "type": "audio_processing_completed",
             },
+            db=db,
         )
 
         return {
@@ -840,31 +961,22 @@ def publish_notification_to_redis_task(user_ids: list, notification_type: str, p
     """
     import asyncio
 
-    from app.utils.redis import publish_to_user_channel
+    from app.utils.redis import publish_to_user_channels
 
     try:
 
         async def publish_all():
-            """Helper async function to publish to all users."""
-            success_count = 0
-            for user_id in user_ids:
-                message = {
-                    "type": "notification",
-                    "data": {
-                        "notification_type": notification_type,
-                        "payload": payload,
-                        "channel": channel,
-                        "timestamp": asyncio.get_event_loop().time(),
-                    },
-                }
-                try:
-                    success = await publish_to_user_channel(str(user_id), message)
-                    if success:
-                        success_count += 1
-                except Exception as e:
-                    logger.error(f"Failed to publish notification to user {user_id}: {e}")
-
-            return success_count
+            """Helper async function to publish to all users in pipelined batches."""
+            message = {
+                "type": "notification",
+                "data": {
+                    "notification_type": notification_type,
+                    "payload": payload,
+                    "channel": channel,
+                    "timestamp": asyncio.get_event_loop().time(),
+                },
+            }
+            return await publish_to_user_channels(user_ids, message)
 
         try:
             asyncio.get_running_loop()
@@ -1,6 +1,6 @@
-from typing import Any, Dict
+from typing import Any, Dict, Optional, Tuple
 
-from fastapi import Depends, FastAPI, HTTPException
+from fastapi import Depends, FastAPI, HTTPException, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.openapi.utils import get_openapi
 from fastapi.responses import StreamingResponse
@@ -105,6 +105,14 @@ async def startup_event():
 
     init_database()
 
+    # Check buckets and apply their policies once, so uploads skip the existence round trip
+    try:
+        from app.utils.minio import get_minio_client
+
+        get_minio_client()
+    except Exception as e:
+        logger.warning(f"MinIO initialization at startup failed: {e}")
+
     EventManager.register(NotificationListener())
     EventManager.register(WebSocketListener())
 
@@ -122,6 +130,11 @@ async def shutdown_event():
 
     await websocket_manager.stop_redis_listener()
 
+    # Stop the shared chat SSE hub
+    from app.services.sse_hub import sse_hub
+
+    await sse_hub.stop()
+
 
 # Add middleware to log all requests
 @app.middleware("http")
@@ -487,15 +500,68 @@ def health_services(db: Session = Depends(get_db)) -> Dict[str, Any]:
     }
 
 
+def _parse_byte_range(range_header: str, size: int) -> Optional[Tuple[int, int]]:
+    """Parse a single-range "bytes=" header into an inclusive (start, end), or None to serve the whole object.
+
+    Raises HTTPException 416 when the range lies outside the object.
+    """
+    unit, _, spec = range_header.partition("=")
+    if unit.strip().lower() != "bytes" or "," in spec:
+        return None  # Multiple ranges are not supported; a full response is always valid
+    start_str, _, end_str = spec.strip().partition("-")
+    try:
+        if start_str:
+            start = int(start_str)
+            if end_str and int(end_str) < start:
+                return None  # Syntactically invalid ranges are ignored
+            end = min(int(end_str), size - 1) if end_str else size - 1
+        else:
+            start, end = max(size - int(end_str), 0), size - 1
+    except ValueError:
+        return None
+    if start < 0 or start > end or start >= size:
+        raise HTTPException(status_code=416, detail="Requested range not satisfiable", headers={"Content-Range": f"bytes */{size}"})
+    return start, end
+
+
 @app.get("/download")
-def download_file(object_name: str):
-    from app.utils.minio import download_file_from_minio
+def download_file(object_name: str, request: Request, db: Session = Depends(get_db)):
+    from app.services.file import is_pending_file_object
+    from app.utils.minio import iter_object_chunks, stat_object_in_minio
 
     filename_only = object_name.split("/")[-1]
     bucket_name = object_name.split("/")[0]
 
-    file_bytes = download_file_from_minio(bucket_name, filename_only)
-    if not file_bytes:
+    if bucket_name == settings.MINIO_BUCKET_NAME and is_pending_file_object(db, filename_only):
         raise HTTPException(status_code=404, detail="File not found")
 
-    return StreamingResponse(iter([file_bytes]), media_type="application/octet-stream", headers={"Content-Disposition": f"attachment; filename={filename_only}"})
+    stat = stat_object_in_minio(bucket_name, filename_only)
+    if stat is None:
+        raise HTTPException(status_code=404, detail="File not found")
+
+    etag = f'"{stat.etag}"'
+    headers = {
+        "Content-Disposition": f"attachment; filename={filename_only}",
+        "Accept-Ranges": "bytes",
+        "ETag": etag,
+    }
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and (if_none_match.strip() == "*" or etag in [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]):
+        return Response(status_code=304, headers=headers)
+
+    byte_range = None
+    range_header = request.headers.get("range")
+    if_range = request.headers.get("if-range")
+    if range_header and stat.size and (not if_range or if_range.strip() == etag):
+        byte_range = _parse_byte_range(range_header, stat.size)
+
+    media_type = stat.content_type or "application/octet-stream"
+    if byte_range is None:
+        headers["Content-Length"] = str(stat.size)
+        return StreamingResponse(iter_object_chunks(bucket_name, filename_only), media_type=media_type, headers=headers)
+
+    start, end = byte_range
+    headers["Content-Range"] = f"bytes {start}-{end}/{stat.size}"
+    headers["Content-Length"] = str(end - start + 1)
+    return StreamingResponse(iter_object_chunks(bucket_name, filename_only, offset=start, length=end - start + 1), status_code=206, media_type=media_type, headers=headers)
@@ -16,6 +16,7 @@ from .meeting import (
 )
 from .notification import Notification
 from .project import Project, UserProject
+from .statistics import UserDailyStats
 from .tag import MeetingTag, Tag
 from .task import Task, TaskProject
 from .user import User, UserDevice, UserIdentity
@@ -46,4 +47,5 @@ __all__ = [
     "Conversation",
     "ChatMessageType",
     "ChatMessage",
+    "UserDailyStats",
 ]
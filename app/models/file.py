@@ -2,7 +2,7 @@ import uuid
 from datetime import datetime
 from typing import TYPE_CHECKING, Optional
 
-from sqlalchemy import BigInteger, Column, DateTime, String, Text, func
+from sqlalchemy import BigInteger, Column, DateTime, Index, String, Text, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlmodel import Field, Relationship, SQLModel
 
@@ -14,6 +14,10 @@ class File(SQLModel, table=True):
     """File model"""
 
     __tablename__ = "files"
+    __table_args__ = (
+        Index("ix_files_filename_trgm", "filename", postgresql_using="gin", postgresql_ops={"filename": "gin_trgm_ops"}),
+        Index("ix_files_created_at_id", "created_at", "id"),
+    )
 
     id: uuid.UUID = Field(
         default_factory=uuid.uuid4,
@@ -35,6 +39,8 @@ class File(SQLModel, table=True):
     uploaded_by: Optional[uuid.UUID] = Field(default=None, foreign_key="users.id")
     extracted_text: Optional[str] = Field(default=None, sa_column=Column(Text))
     qdrant_vector_id: Optional[str] = Field(default=None, sa_column=Column(String))
+    # Set while a direct upload awaits completion; pending rows are hidden and removed once it passes
+    upload_expires_at: Optional[datetime] = Field(default=None, sa_column=Column(DateTime(timezone=True)))
 
     # Relationships
     project: Optional["Project"] = Relationship(back_populates="files")  # type: ignore
@@ -3,7 +3,7 @@ from datetime import datetime, timezone
 from enum import Enum
 from typing import TYPE_CHECKING, Optional
 
-from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Integer, String, Text, func
+from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Index, Integer, String, Text, func, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlmodel import Field, Relationship, SQLModel
 
@@ -45,6 +45,10 @@ class Meeting(SQLModel, table=True):
     """Meeting model"""
 
     __tablename__ = "meetings"
+    __table_args__ = (
+        Index("ix_meetings_title_trgm", "title", postgresql_using="gin", postgresql_ops={"title": "gin_trgm_ops"}),
+        Index("ix_meetings_created_at_id", "created_at", "id"),
+    )
 
     id: uuid.UUID = Field(
         default_factory=uuid.uuid4,
@@ -120,8 +124,12 @@ class AudioFile(SQLModel, table=True):
     file_url: Optional[str] = Field(default=None, sa_column=Column(String))
     seq_order: Optional[int] = Field(default=None, sa_column=Column(Integer))
     duration_seconds: Optional[int] = Field(default=None, sa_column=Column(Integer))
+    sample_rate: Optional[int] = Field(default=None, sa_column=Column(Integer))
+    channels: Optional[int] = Field(default=None, sa_column=Column(Integer))
     is_concatenated: bool = Field(default=False, sa_column=Column(Boolean))
     is_deleted: bool = Field(default=False, sa_column=Column(Boolean))
+    # Set while a direct upload awaits completion; pending rows are hidden and removed once it passes
+    upload_expires_at: Optional[datetime] = Field(default=None, sa_column=Column(DateTime(timezone=True)))
 
     # Relationships
     meeting: Meeting = Relationship(back_populates="audio_files")
@@ -135,10 +143,15 @@ class AudioFile(SQLModel, table=True):
     )
 
 
+# Full-text document for transcript search; queries must use this exact expression to hit the GIN index
+TRANSCRIPT_SEARCH_DOCUMENT = "to_tsvector('simple', coalesce(content, '') || ' ' || coalesce(extracted_text_for_search, ''))"
+
+
 class Transcript(SQLModel, table=True):
     """Transcript model"""
 
     __tablename__ = "transcripts"
+    __table_args__ = (Index("ix_transcripts_search_document", text(TRANSCRIPT_SEARCH_DOCUMENT), postgresql_using="gin"),)
 
     id: uuid.UUID = Field(
         default_factory=uuid.uuid4,
@@ -2,7 +2,7 @@ import uuid
 from datetime import datetime
 from typing import TYPE_CHECKING, Any, Dict, Optional
 
-from sqlalchemy import JSON, Boolean, Column, DateTime, Integer, String, func
+from sqlalchemy import JSON, Boolean, Column, DateTime, Index, Integer, String, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlmodel import Field, Relationship, SQLModel
 
@@ -16,6 +16,7 @@ class Notification(SQLModel, table=True):
     """Notification model"""
 
     __tablename__ = "notifications"
+    __table_args__ = (Index("ix_notifications_user_id_created_at_id", "user_id", "created_at", "id"),)
 
     id: uuid.UUID = Field(
         default_factory=uuid.uuid4,
@@ -2,7 +2,7 @@ import uuid
 from datetime import datetime
 from typing import TYPE_CHECKING, Optional
 
-from sqlalchemy import Boolean, Column, DateTime, String, Text, func
+from sqlalchemy import Boolean, Column, DateTime, Index, String, Text, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlmodel import Field, Relationship, SQLModel
 
@@ -21,6 +21,7 @@ class Project(SQLModel, table=True):
     """Project model"""
 
     __tablename__ = "projects"
+    __table_args__ = (Index("ix_projects_name_trgm", "name", postgresql_using="gin", postgresql_ops={"name": "gin_trgm_ops"}),)
 
     id: uuid.UUID = Field(
         default_factory=uuid.uuid4,
@@ -52,6 +53,8 @@ class UserProject(SQLModel, table=True):
     """Junction table for users and projects (many-to-many relationship)"""
 
     __tablename__ = "users_projects"
+    # The primary key leads with user_id; per-project lookups and member counts need their own index
+    __table_args__ = (Index("ix_users_projects_project_id", "project_id"),)
 
     user_id: uuid.UUID = Field(foreign_key="users.id", primary_key=True)
     project_id: uuid.UUID = Field(foreign_key="projects.id", primary_key=True)
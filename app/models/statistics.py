@@ -0,0 +1,21 @@
+import uuid
+from datetime import datetime
+
+from sqlalchemy import BigInteger, Column, DateTime, Integer
+from sqlmodel import Field, SQLModel
+
+
+class UserDailyStats(SQLModel, table=True):
+    """Per-user daily rollup of task and meeting activity for long-range charts"""
+
+    __tablename__ = "user_daily_stats"
+
+    user_id: uuid.UUID = Field(foreign_key="users.id", primary_key=True)
+    day: datetime = Field(sa_column=Column(DateTime(timezone=True), primary_key=True))
+
+    tasks_created: int = Field(default=0, sa_column=Column(Integer, nullable=False, server_default="0"))
+    tasks_todo: int = Field(default=0, sa_column=Column(Integer, nullable=False, server_default="0"))
+    tasks_in_progress: int = Field(default=0, sa_column=Column(Integer, nullable=False, server_default="0"))
+    tasks_completed: int = Field(default=0, sa_column=Column(Integer, nullable=False, server_default="0"))
+    meetings_created: int = Field(default=0, sa_column=Column(Integer, nullable=False, server_default="0"))
+    meeting_duration_seconds: int = Field(default=0, sa_column=Column(BigInteger, nullable=False, server_default="0"))
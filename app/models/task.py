@@ -2,7 +2,7 @@ import uuid
 from datetime import datetime
 from typing import TYPE_CHECKING, Optional
 
-from sqlalchemy import Column, DateTime, String, Text, func
+from sqlalchemy import Column, DateTime, Index, String, Text, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlmodel import Field, Relationship, SQLModel
 
@@ -14,6 +14,7 @@ class Task(SQLModel, table=True):
     """Task model"""
 
     __tablename__ = "tasks"
+    __table_args__ = (Index("ix_tasks_created_at_id", "created_at", "id"),)
 
     id: uuid.UUID = Field(
         default_factory=uuid.uuid4,
@@ -30,6 +30,8 @@ class AudioFileResponse(BaseModel):
     file_url: Optional[str]
     seq_order: Optional[int]
     duration_seconds: Optional[int]
+    sample_rate: Optional[int] = None
+    channels: Optional[int] = None
     is_concatenated: bool
     created_at: datetime
     updated_at: Optional[datetime] = None
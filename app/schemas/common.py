@@ -11,10 +11,11 @@ class PaginationMeta(BaseModel):
 
     page: int
     limit: int
-    total: int
-    total_pages: int
+    total: Optional[int] = None  # Omitted for cursor pages unless explicitly requested
+    total_pages: Optional[int] = None
     has_next: bool
     has_prev: bool
+    next_cursor: Optional[str] = None  # Opaque cursor for the following page
 
 
 class ApiResponse(BaseModel, Generic[T]):
@@ -33,8 +34,13 @@ class PaginatedResponse(ApiResponse[List[T]], Generic[T]):
     pagination: Optional[PaginationMeta] = None
 
 
-def create_pagination_meta(page: int, limit: int, total: int) -> PaginationMeta:
+def create_pagination_meta(page: int, limit: int, total: Optional[int], next_cursor: Optional[str] = None, cursor: Optional[str] = None) -> PaginationMeta:
     """Create pagination metadata"""
+    if cursor is not None:
+        # Keyset pages have no page number; has_next follows from the next cursor
+        total_pages = (total + limit - 1) // limit if total is not None else None
+        return PaginationMeta(page=page, limit=limit, total=total, total_pages=total_pages, has_next=next_cursor is not None, has_prev=True, next_cursor=next_cursor)
+
     total_pages = (total + limit - 1) // limit  # Ceiling division
     return PaginationMeta(
         page=page,
@@ -43,6 +49,7 @@ def create_pagination_meta(page: int, limit: int, total: int) -> PaginationMeta:
         total_pages=total_pages,
         has_next=page < total_pages,
         has_prev=page > 1,
+        next_cursor=next_cursor if page < total_pages else None,
     )
 
 
@@ -1,6 +1,6 @@
 import uuid
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from pydantic import BaseModel, field_validator
 
@@ -71,10 +71,30 @@ class FileMoveRequest(BaseModel):
     meeting_id: Optional[uuid.UUID] = None
 
 
+class FileUploadUrlRequest(BaseModel):
+    filename: str
+    content_type: str
+    size_bytes: Optional[int] = None
+    project_id: Optional[uuid.UUID] = None
+    meeting_id: Optional[uuid.UUID] = None
+
+
+class FileUploadUrlResponse(BaseModel):
+    id: uuid.UUID
+    upload_url: str
+    method: str = "PUT"
+    headers: Dict[str, str] = {}
+    expires_in: int
+
+
 class FileApiResponse(ApiResponse[FileResponse]):
     pass
 
 
+class FileUploadUrlApiResponse(ApiResponse[FileUploadUrlResponse]):
+    pass
+
+
 class FilesPaginatedResponse(PaginatedResponse[FileResponse]):
     pass
 
@@ -89,6 +89,8 @@ class AudioFileItem(BaseModel):
     file_url: Optional[str] = None
     seq_order: Optional[int] = None
     duration_seconds: Optional[int] = None
+    sample_rate: Optional[int] = None
+    channels: Optional[int] = None
     uploaded_by: UUID
     created_at: datetime
     can_access: bool = True
@@ -97,4 +99,11 @@ class AudioFileItem(BaseModel):
         from_attributes = True
 
 
+class AudioUploadUrlRequest(BaseModel):
+    filename: str
+    content_type: str
+    size_bytes: Optional[int] = None
+    seq_order: Optional[int] = None
+
+
 MeetingAudioFilesPaginatedResponse = PaginatedResponse[AudioFileItem]
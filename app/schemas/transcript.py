@@ -38,6 +38,7 @@ class TranscriptResponse(BaseModel):
     total_tokens: Optional[int]
     created_at: datetime
     updated_at: Optional[datetime] = None
+    snippet: Optional[str] = None  # Highlighted excerpt, set only for content searches
 
     class Config:
         from_attributes = True
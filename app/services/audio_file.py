@@ -1,15 +1,17 @@
 import uuid
-from typing import List, Optional
+from typing import BinaryIO, List, Optional
 
 from sqlalchemy.orm import Session
 
 from app.crud.audio_file import (
     crud_create_audio_file,
+    crud_create_audio_file_from_stream,
     crud_delete_audio_file,
     crud_get_audio_file,
     crud_get_audio_files_by_meeting,
     crud_update_audio_file,
 )
+from app.events.domain_events import BaseDomainEvent
 from app.models.meeting import AudioFile
 from app.schemas.audio_file import AudioFileCreate, AudioFileUpdate
 
@@ -35,6 +37,16 @@ def create_audio_file(
     return crud_create_audio_file(db, audio_data, file_bytes, content_type)
 
 
+def create_audio_file_from_stream(
+    db: Session,
+    audio_data: AudioFileCreate,
+    file_obj: BinaryIO,
+    content_type: str = "audio/webm",
+    max_size: Optional[int] = None,
+) -> Optional[AudioFile]:
+    return crud_create_audio_file_from_stream(db, audio_data, file_obj, content_type, max_size)
+
+
 def get_audio_file(db: Session, audio_id: uuid.UUID) -> Optional[AudioFile]:
     return crud_get_audio_file(db, audio_id)
 
@@ -47,5 +59,14 @@ def update_audio_file(db: Session, audio_id: uuid.UUID, updates: AudioFileUpdate
     return crud_update_audio_file(db, audio_id, updates)
 
 
-def delete_audio_file(db: Session, audio_id: uuid.UUID) -> bool:
-    return crud_delete_audio_file(db, audio_id)
+def delete_audio_file(db: Session, audio_id: uuid.UUID, actor_user_id: Optional[uuid.UUID] = None) -> bool:
+    # Lazy import to avoid circular import
+    from app.services.event_manager import EventManager
+
+    audio_file = crud_get_audio_file(db, audio_id)
+    meeting_id = audio_file.meeting_id if audio_file else None
+    if not crud_delete_audio_file(db, audio_id):
+        return False
+    if actor_user_id:
+        EventManager.emit_domain_event(BaseDomainEvent(event_name="audio.deleted", actor_user_id=actor_user_id, target_type="audio", target_id=audio_id, metadata={"meeting_id": str(meeting_id) if meeting_id else None}))
+    return True
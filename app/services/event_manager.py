@@ -30,10 +30,13 @@ class EventManager:
         """
         try:
             # Lazy import to avoid circular import
-            from app.jobs.tasks import process_domain_event
+            from app.jobs.tasks import invalidate_dashboard_stats_task, process_domain_event
+            from app.services.statistics import is_dashboard_event
 
             payload = event.to_dict() if isinstance(event, BaseDomainEvent) else event
             process_domain_event.delay(payload)
+            if is_dashboard_event(payload):
+                invalidate_dashboard_stats_task.delay(payload)
             logger.debug(f"[EventManager] Enqueued domain event: {payload.get('event_name')}")
         except Exception as e:
             # Do not raise to callers; audit must not affect business flow
@@ -1,5 +1,5 @@
 import uuid
-from typing import List, Optional, Tuple
+from typing import BinaryIO, List, Optional, Tuple
 
 from sqlalchemy.orm import Session
 
@@ -12,6 +12,7 @@ from app.crud.file import (
     crud_get_file,
     crud_get_files,
     crud_get_project_ids_for_meeting,
+    crud_is_file_pending,
     crud_update_file,
 )
 from app.events.domain_events import BaseDomainEvent, build_diff
@@ -19,20 +20,31 @@ from app.models.file import File
 from app.schemas.file import FileCreate, FileFilter, FileUpdate
 from app.services.meeting import get_meeting
 from app.services.project import get_project, is_user_in_project
+from app.services.storage_cleanup import schedule_storage_cleanup
 from app.utils.minio import (
-    delete_file_from_minio,
+    UploadRejectedError,
     generate_presigned_url,
-    upload_bytes_to_minio,
+    upload_stream_to_minio,
 )
 
 
-def create_file(db: Session, file_data: FileCreate, uploaded_by: uuid.UUID, file_bytes: bytes) -> Optional[File]:
+def create_file(db: Session, file_data: FileCreate, uploaded_by: uuid.UUID, file_obj: BinaryIO) -> Optional[File]:
+    """Create a file record and stream its content to MinIO.
+
+    Raises UploadRejectedError when the content exceeds the size cap or does not match its type.
+    """
     # Lazy import to avoid circular import
     from app.services.event_manager import EventManager
 
     file = crud_create_file(db, **{**file_data.model_dump(), "uploaded_by": uploaded_by})
-    upload_result = upload_bytes_to_minio(file_bytes, settings.MINIO_BUCKET_NAME, str(file.id), file_data.mime_type)
+    try:
+        upload_result = upload_stream_to_minio(file_obj, settings.MINIO_BUCKET_NAME, str(file.id), file_data.mime_type, max_size=settings.MAX_FILE_SIZE_MB * 1024 * 1024)
+    except UploadRejectedError:
+        db.delete(file)
+        db.commit()
+        raise
     if upload_result:
+        file.size_bytes = upload_result.size_bytes
         # Generate and store presigned URL
         storage_url = generate_presigned_url(settings.MINIO_BUCKET_NAME, str(file.id))
         if storage_url:
@@ -52,11 +64,13 @@ def create_file(db: Session, file_data: FileCreate, uploaded_by: uuid.UUID, file
                         "project_id": str(file.project_id) if file.project_id else None,
                         "meeting_id": str(file.meeting_id) if file.meeting_id else None,
                         "storage_url_present": True,
+                        "sha256": upload_result.sha256,
                     },
                 )
             )
             return file
         else:
+            db.commit()
             # Emit event even if URL missing (still uploaded to storage)
             EventManager.emit_domain_event(
                 BaseDomainEvent(
@@ -70,6 +84,7 @@ def create_file(db: Session, file_data: FileCreate, uploaded_by: uuid.UUID, file
                         "project_id": str(file.project_id) if file.project_id else None,
                         "meeting_id": str(file.meeting_id) if file.meeting_id else None,
                         "storage_url_present": False,
+                        "sha256": upload_result.sha256,
                     },
                 )
             )
@@ -96,8 +111,8 @@ def get_file(db: Session, file_id: uuid.UUID) -> Optional[File]:
     return crud_get_file(db, file_id)
 
 
-def get_files(db: Session, filters: Optional[FileFilter] = None, page: int = 1, limit: int = 20, user_id: Optional[uuid.UUID] = None) -> Tuple[List[File], int]:
-    return crud_get_files(db, filters.model_dump() if filters else None, page=page, limit=limit, user_id=user_id)
+def get_files(db: Session, filters: Optional[FileFilter] = None, page: int = 1, limit: int = 20, user_id: Optional[uuid.UUID] = None, cursor: Optional[str] = None, include_total: bool = True) -> Tuple[List[File], Optional[int]]:
+    return crud_get_files(db, filters.model_dump() if filters else None, page=page, limit=limit, user_id=user_id, cursor=cursor, include_total=include_total)
 
 
 def update_file(db: Session, file_id: uuid.UUID, updates: FileUpdate, actor_user_id: uuid.UUID | None = None) -> Optional[File]:
@@ -125,8 +140,8 @@ def delete_file(db: Session, file_id: uuid.UUID, actor_user_id: uuid.UUID | None
     if not file:
         EventManager.emit_domain_event(BaseDomainEvent(event_name="file.delete_failed", actor_user_id=actor_user_id or uuid.uuid4(), target_type="file", target_id=file_id, metadata={"reason": "not_found"}))
         return False
-    delete_file_from_minio(settings.MINIO_BUCKET_NAME, str(file.id))
     crud_delete_file(db, file_id)
+    schedule_storage_cleanup({settings.MINIO_BUCKET_NAME: [str(file_id)]}, [file_id])
     EventManager.emit_domain_event(BaseDomainEvent(event_name="file.deleted", actor_user_id=actor_user_id or file.uploaded_by, target_type="file", target_id=file_id, metadata={}))
     return True
 
@@ -135,6 +150,15 @@ def check_file_access(db: Session, file: File, user_id: uuid.UUID) -> bool:
     return crud_check_file_access(db, file, user_id)
 
 
+def is_pending_file_object(db: Session, object_name: str) -> bool:
+    """Whether a storage object belongs to a direct upload that has not been completed."""
+    try:
+        file_id = uuid.UUID(object_name)
+    except ValueError:
+        return False
+    return crud_is_file_pending(db, file_id)
+
+
 def check_delete_permissions(db: Session, file: File, current_user_id: uuid.UUID) -> File:
     from fastapi import HTTPException
 
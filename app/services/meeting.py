@@ -1,6 +1,5 @@
 import uuid
-from io import BytesIO
-from typing import List, Optional, Tuple
+from typing import BinaryIO, List, Optional, Tuple
 
 from fastapi import HTTPException, status
 from sqlalchemy.orm import Session
@@ -23,18 +22,20 @@ from app.crud.meeting import (
     crud_update_audio_file_url,
     crud_update_meeting,
 )
+from app.crud.statistics import crud_get_meeting_stakeholder_ids
 from app.events.domain_events import BaseDomainEvent, build_diff
 from app.models.meeting import AudioFile, Meeting
 from app.schemas.meeting import MeetingCreate, MeetingFilter, MeetingResponse, MeetingUpdate, MeetingWithProjects, ProjectResponse
 from app.schemas.user import UserResponse
 from app.services.event_manager import EventManager
+from app.services.storage_cleanup import schedule_storage_cleanup
 from app.utils.meeting import (
     can_delete_meeting,
     check_meeting_access,
     notify_meeting_members,
     validate_meeting_url,
 )
-from app.utils.minio import delete_file_from_minio, generate_presigned_url, get_minio_client
+from app.utils.minio import UploadRejectedError, generate_presigned_url, upload_stream_to_minio
 
 
 def create_meeting(db: Session, meeting_data: MeetingCreate, created_by: uuid.UUID) -> Meeting:
@@ -83,7 +84,7 @@ def get_meeting_by_url(db: Session, meeting_url: str) -> Optional[Meeting]:
     return db.query(Meeting).filter(Meeting.url == meeting_url).first()
 
 
-def get_meetings(db: Session, user_id: uuid.UUID, filters: Optional[MeetingFilter] = None, page: int = 1, limit: int = 20) -> Tuple[List[Meeting], int]:
+def get_meetings(db: Session, user_id: uuid.UUID, filters: Optional[MeetingFilter] = None, page: int = 1, limit: int = 20, cursor: Optional[str] = None, include_total: bool = True) -> Tuple[List[Meeting], Optional[int]]:
     filter_params = {}
     if filters:
         filter_params = {
@@ -97,7 +98,7 @@ def get_meetings(db: Session, user_id: uuid.UUID, filters: Optional[MeetingFilte
             "project_id": filters.project_id,
             "tag_ids": filters.tag_ids,
         }
-    return crud_get_meetings(db, user_id, page=page, limit=limit, **filter_params)
+    return crud_get_meetings(db, user_id, page=page, limit=limit, cursor=cursor, include_total=include_total, **filter_params)
 
 
 def update_meeting(db: Session, meeting_id: uuid.UUID, updates: MeetingUpdate, user_id: uuid.UUID) -> Optional[Meeting]:
@@ -166,18 +167,20 @@ def delete_meeting(db: Session, meeting_id: uuid.UUID, user_id: uuid.UUID) -> bo
             )
         )
         return False
+    stakeholder_ids = crud_get_meeting_stakeholder_ids(db, meeting_id)
     associated_files = crud_get_meeting_associated_files(db, meeting_id)
+    file_ids = [file.id for file in associated_files]
     for file in associated_files:
-        delete_file_from_minio(settings.MINIO_BUCKET_NAME, str(file.id))
         db.delete(file)
     crud_soft_delete_meeting(db, meeting_id)
+    schedule_storage_cleanup({settings.MINIO_BUCKET_NAME: [str(file_id) for file_id in file_ids]}, file_ids)
     EventManager.emit_domain_event(
         BaseDomainEvent(
             event_name="meeting.deleted",
             actor_user_id=user_id,
             target_type="meeting",
             target_id=meeting_id,
-            metadata={},
+            metadata={"stakeholder_ids": [str(stakeholder_id) for stakeholder_id in stakeholder_ids]},
         )
     )
     return True
@@ -224,8 +227,9 @@ def create_audio_file(
     uploaded_by: uuid.UUID,
     filename: str,
     content_type: str,
-    file_bytes: bytes,
+    file_obj: BinaryIO,
     seq_order: Optional[int] = None,
+    max_size: Optional[int] = None,
 ) -> Optional[AudioFile]:
     seq = seq_order if seq_order is not None else crud_get_next_audio_file_seq_order(db, meeting_id)
     audio = crud_create_audio_file(db, meeting_id, uploaded_by, seq)
@@ -234,18 +238,13 @@ def create_audio_file(
         ext = filename.split(".")[-1].lower()
     object_name = f"meetings/{meeting_id}/audio/{audio.id}{('.' + ext) if ext else ''}"
     try:
-        client = get_minio_client()
-        file_data = BytesIO(file_bytes)
-        client.put_object(
-            bucket_name=settings.MINIO_BUCKET_NAME,
-            object_name=object_name,
-            data=file_data,
-            length=len(file_bytes),
-            content_type=content_type,
-        )
+        if not upload_stream_to_minio(file_obj, settings.MINIO_BUCKET_NAME, object_name, content_type, max_size=max_size):
+            raise RuntimeError("MinIO upload failed")
         url = generate_presigned_url(settings.MINIO_BUCKET_NAME, object_name)
-        crud_update_audio_file_url(db, audio.id, url)
-        return crud_get_meeting(db, meeting_id)
+        return crud_update_audio_file_url(db, audio.id, url)
+    except UploadRejectedError:
+        crud_delete_audio_file(db, audio.id)
+        raise
     except Exception:
         try:
             crud_delete_audio_file(db, audio.id)
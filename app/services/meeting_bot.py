@@ -1,6 +1,6 @@
 import uuid
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, BinaryIO, Dict, List, Optional, Tuple
 
 from fastapi import HTTPException, status
 from sqlalchemy.orm import Session
@@ -12,7 +12,9 @@ from app.jobs.celery_worker import celery_app
 from app.models.meeting import MeetingBot
 from app.schemas.audio_file import AudioFileCreate
 from app.schemas.meeting_bot import MeetingBotCreate, MeetingBotLogCreate, MeetingBotLogResponse, MeetingBotResponse, MeetingBotUpdate
-from app.services.audio_file import create_audio_file
+from app.services.audio_file import create_audio_file_from_stream
+from app.utils.idempotency import claim_idempotency_key, record_idempotency_result, release_idempotency_key
+from app.utils.logging import logger
 
 
 def create_meeting_bot(db: Session, bot_data: MeetingBotCreate, created_by: uuid.UUID) -> Any:
@@ -90,15 +92,27 @@ def update_bot_status(db: Session, bot_id: uuid.UUID, status: str, error: Option
     return bot
 
 
-def process_bot_webhook_recording(db: Session, meeting_id: uuid.UUID, user_id: uuid.UUID, file_bytes: bytes) -> Dict[str, Any]:
+def process_bot_webhook_recording(db: Session, meeting_id: uuid.UUID, user_id: uuid.UUID, file_obj: BinaryIO, idempotency_key: Optional[str] = None) -> Dict[str, Any]:
     meeting = crud_get_meeting(db, meeting_id)
     if not meeting:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=MessageDescriptions.MEETING_NOT_FOUND)
+    if idempotency_key:
+        existing = claim_idempotency_key("bot_recording", idempotency_key, "pending")
+        if existing:
+            return {"audio_file_id": existing if existing != "pending" else None, "meeting_id": str(meeting_id), "duplicate": True}
     audio_data = AudioFileCreate(meeting_id=meeting_id, uploaded_by=user_id)
-    audio_file = create_audio_file(db, audio_data, file_bytes, "video/webm")
+    try:
+        audio_file = create_audio_file_from_stream(db, audio_data, file_obj, "video/webm")
+    except Exception as e:
+        logger.error(f"Failed to store bot recording for meeting {meeting_id}: {e}")
+        audio_file = None
     if not audio_file:
+        if idempotency_key:
+            release_idempotency_key("bot_recording", idempotency_key)
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=MessageDescriptions.MEETING_AUDIO_UPLOAD_FAILED)
-    return {"audio_file_id": str(audio_file.id), "meeting_id": str(meeting_id)}
+    if idempotency_key:
+        record_idempotency_result("bot_recording", idempotency_key, str(audio_file.id))
+    return {"audio_file_id": str(audio_file.id), "meeting_id": str(meeting_id), "duplicate": False}
 
 
 def trigger_meeting_bot_join(db: Session, meeting_id: uuid.UUID, user_id: uuid.UUID, bearer_token: str, meeting_url_override: Optional[str] = None, immediate: bool = False) -> Dict[str, Any]:
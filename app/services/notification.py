@@ -1,4 +1,5 @@
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List, Optional, Tuple
 
 from fastapi import HTTPException, status
@@ -10,6 +11,7 @@ from app.crud.notification import (
     crud_create_global_notification,
     crud_create_notification,
     crud_create_notifications_bulk,
+    crud_deactivate_fcm_tokens,
     crud_delete_notification,
     crud_get_notification,
     crud_get_user_fcm_tokens,
@@ -19,8 +21,11 @@ from app.db import SessionLocal
 from app.models.notification import Notification
 from app.utils.logging import logger
 
+FCM_MULTICAST_LIMIT = 500
+FCM_MAX_WORKERS = 8
 
-def get_notifications(db: Session, user_id: uuid.UUID, **kwargs) -> Tuple[List[Notification], int]:
+
+def get_notifications(db: Session, user_id: uuid.UUID, **kwargs) -> Tuple[List[Notification], Optional[int]]:
     return crud_get_notification(
         db,
         user_id=user_id,
@@ -29,6 +34,8 @@ def get_notifications(db: Session, user_id: uuid.UUID, **kwargs) -> Tuple[List[N
         direction=kwargs.get("dir", "desc"),
         page=kwargs.get("page", 1),
         limit=kwargs.get("limit", 20),
+        cursor=kwargs.get("cursor"),
+        include_total=kwargs.get("include_total", True),
     )
 
 
@@ -63,6 +70,24 @@ def delete_notification(db: Session, notification_id: uuid.UUID, user_id: uuid.U
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=MessageDescriptions.NOTIFICATION_NOT_FOUND)
 
 
+def _send_fcm_multicast(message: messaging.MulticastMessage) -> List[str]:
+    response = messaging.send_each_for_multicast(message)
+    return [token for token, result in zip(message.tokens, response.responses) if not result.success and isinstance(result.exception, messaging.UnregisteredError)]
+
+
+def _deactivate_fcm_tokens(tokens: List[str]) -> None:
+    # Own session and commit: callers passing db= do not commit after sending, and their unit of work must not be committed here
+    db = SessionLocal()
+    try:
+        count = crud_deactivate_fcm_tokens(db, tokens)
+        logger.info(f"Deactivated {count} unregistered FCM tokens")
+    except Exception as e:
+        db.rollback()
+        logger.error(f"FCM Notification error deactivating tokens: {str(e)}", exc_info=True)
+    finally:
+        db.close()
+
+
 def send_fcm_notification(
     user_ids: List[uuid.UUID],
     title: str,
@@ -72,8 +97,11 @@ def send_fcm_notification(
     badge: Optional[str] = None,
     sound: Optional[str] = None,
     ttl: Optional[int] = None,
+    db: Optional[Session] = None,
 ) -> None:
-    db = SessionLocal()
+    owns_session = db is None
+    if owns_session:
+        db = SessionLocal()
     try:
         tokens = crud_get_user_fcm_tokens(db, user_ids)
         if not tokens:
@@ -95,15 +123,27 @@ def send_fcm_notification(
             headers = {}
             headers["TTL"] = str(ttl)
             webpush_kwargs["headers"] = headers
-        message = messaging.MulticastMessage(
-            notification=messaging.Notification(title=title, body=body),
-            data=fcm_data,
-            tokens=tokens,
-        )
-        try:
-            messaging.send_each_for_multicast(message)
-        except Exception as e:
-            logger.error(f"FCM Notification error sending notification: {str(e)}", exc_info=True)
-            raise
+        messages = [
+            messaging.MulticastMessage(
+                notification=messaging.Notification(title=title, body=body),
+                data=fcm_data,
+                tokens=tokens[start : start + FCM_MULTICAST_LIMIT],
+            )
+            for start in range(0, len(tokens), FCM_MULTICAST_LIMIT)
+        ]
+        unregistered_tokens = []
+        errors = []
+        with ThreadPoolExecutor(max_workers=min(len(messages), FCM_MAX_WORKERS)) as executor:
+            for future in [executor.submit(_send_fcm_multicast, message) for message in messages]:
+                try:
+                    unregistered_tokens.extend(future.result())
+                except Exception as e:
+                    logger.error(f"FCM Notification error sending notification: {str(e)}", exc_info=True)
+                    errors.append(e)
+        if unregistered_tokens:
+            _deactivate_fcm_tokens(unregistered_tokens)
+        if errors:
+            raise errors[0]
     finally:
-        db.close()
+        if owns_session:
+            db.close()
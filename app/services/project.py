@@ -3,9 +3,10 @@ from typing import Any, Dict, List, Optional
 
 from sqlalchemy.orm import Session
 
-from app.crud.project import crud_add_user_to_project, crud_create_project, crud_delete_project_with_cascade, crud_get_project, crud_get_project_members, crud_get_projects, crud_get_user_role_in_project, crud_is_user_in_project, crud_remove_user_from_project, crud_update_project, crud_update_user_role_in_project
+from app.crud.project import crud_add_user_to_project, crud_bulk_add_users_to_project, crud_bulk_remove_users_from_project, crud_create_project, crud_delete_project_with_cascade, crud_get_project, crud_get_project_member_counts, crud_get_project_members, crud_get_projects, crud_get_user_role_in_project, crud_is_user_in_project, crud_remove_user_from_project, crud_update_project, crud_update_user_role_in_project
+from app.crud.statistics import crud_get_project_member_ids
 from app.events.domain_events import BaseDomainEvent
-from app.events.project_events import UserAddedToProjectEvent, UserRemovedFromProjectEvent
+from app.events.project_events import UserAddedToProjectEvent, UserRemovedFromProjectEvent, UsersAddedToProjectEvent, UsersRemovedFromProjectEvent
 from app.models.project import Project, UserProject
 from app.schemas.project import ProjectCreate, ProjectFilter, ProjectUpdate, UserProjectCreate
 from app.services.event_manager import EventManager
@@ -26,6 +27,10 @@ def get_projects(db: Session, filters: Optional[ProjectFilter] = None, page: int
     return crud_get_projects(db, filters.model_dump() if filters else None, page=page, limit=limit, order_by=order_by, dir=dir)
 
 
+def get_project_member_counts(db: Session, project_ids: List[uuid.UUID]) -> Dict[uuid.UUID, int]:
+    return crud_get_project_member_counts(db, project_ids)
+
+
 def update_project(db: Session, project_id: uuid.UUID, updates: ProjectUpdate, actor_user_id: uuid.UUID | None = None) -> Optional[Project]:
     project = crud_update_project(db, project_id, **updates.model_dump(exclude_unset=True))
     if project and actor_user_id:
@@ -34,9 +39,10 @@ def update_project(db: Session, project_id: uuid.UUID, updates: ProjectUpdate, a
 
 
 def delete_project(db: Session, project_id: uuid.UUID, actor_user_id: uuid.UUID | None = None) -> bool:
+    member_ids = crud_get_project_member_ids(db, project_id)
     result = crud_delete_project_with_cascade(db, project_id)
     if result and actor_user_id:
-        EventManager.emit_domain_event(BaseDomainEvent(event_name="project.deleted", actor_user_id=actor_user_id, target_type="project", target_id=project_id, metadata={}))
+        EventManager.emit_domain_event(BaseDomainEvent(event_name="project.deleted", actor_user_id=actor_user_id, target_type="project", target_id=project_id, metadata={"stakeholder_ids": [str(member_id) for member_id in member_ids]}))
     return result
 
 
@@ -80,16 +86,19 @@ def get_user_role_in_project(db: Session, project_id: uuid.UUID, user_id: uuid.U
 
 # Bulk operations
 def bulk_add_users_to_project(db: Session, project_id: uuid.UUID, users_data: List[UserProjectCreate], added_by_user_id: uuid.UUID = None) -> List[Dict[str, Any]]:
-    results = []
-    for user_data in users_data:
-        user_project = add_user_to_project(db, project_id, user_data.user_id, user_data.role, added_by_user_id)
-        results.append({"success": user_project is not None, "user_id": str(user_data.user_id)})
-    return results
-
-
-def bulk_remove_users_from_project(db: Session, project_id: uuid.UUID, user_ids: List[uuid.UUID]) -> List[Dict[str, Any]]:
-    results = []
-    for user_id in user_ids:
-        success = remove_user_from_project(db, project_id, user_id)
-        results.append({"success": success, "user_id": str(user_id)})
-    return results
+    roles = {user_data.user_id: user_data.role for user_data in users_data}
+    added_user_ids = set(crud_bulk_add_users_to_project(db, project_id, roles))
+    if added_user_ids and added_by_user_id:
+        added = sorted(added_user_ids, key=str)
+        EventManager.emit(UsersAddedToProjectEvent(project_id=project_id, user_ids=added, added_by_user_id=added_by_user_id, db=db))
+        EventManager.emit_domain_event(BaseDomainEvent(event_name="project.members_added", actor_user_id=added_by_user_id, target_type="project", target_id=project_id, metadata={"added_users": [{"user_id": str(user_id), "role": roles[user_id]} for user_id in added]}))
+    return [{"success": user_data.user_id in added_user_ids, "user_id": str(user_data.user_id)} for user_data in users_data]
+
+
+def bulk_remove_users_from_project(db: Session, project_id: uuid.UUID, user_ids: List[uuid.UUID], removed_by_user_id: uuid.UUID = None) -> List[Dict[str, Any]]:
+    removed_user_ids = set(crud_bulk_remove_users_from_project(db, project_id, list(dict.fromkeys(user_ids))))
+    if removed_user_ids and removed_by_user_id:
+        removed = sorted(removed_user_ids, key=str)
+        EventManager.emit(UsersRemovedFromProjectEvent(project_id=project_id, user_ids=removed, removed_by_user_id=removed_by_user_id, db=db))
+        EventManager.emit_domain_event(BaseDomainEvent(event_name="project.members_removed", actor_user_id=removed_by_user_id, target_type="project", target_id=project_id, metadata={"removed_user_ids": [str(user_id) for user_id in removed]}))
+    return [{"success": user_id in removed_user_ids, "user_id": str(user_id)} for user_id in user_ids]
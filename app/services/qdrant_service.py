@@ -483,6 +483,28 @@ async def delete_file_vectors(file_id: str, collection_name: str | None = None)
         return False
 
 
+async def delete_files_vectors(file_ids: List[str], collection_name: str | None = None) -> bool:
+    """Delete all vectors for several file_ids with a single filtered delete"""
+    if not file_ids:
+        return True
+    client = get_qdrant_client()
+
+    try:
+        if not collection_name:
+            collection_name = settings.QDRANT_COLLECTION_NAME
+        filter_condition = qmodels.Filter(must=[qmodels.FieldCondition(key="file_id", match=qmodels.MatchAny(any=file_ids))])
+
+        client.delete(
+            collection_name=collection_name,
+            points_selector=qmodels.FilterSelector(filter=filter_condition),
+        )
+
+        return True
+
+    except Exception:
+        return False
+
+
 async def delete_transcript_vectors(transcript_id: str, collection_name: str | None = None) -> bool:
     """Delete all vectors for a specific transcript_id from the collection"""
     client = get_qdrant_client()
@@ -0,0 +1,178 @@
+import asyncio
+import json
+import logging
+from typing import Dict, Optional, Set
+
+from app.utils.redis import get_async_redis_client
+
+logger = logging.getLogger(__name__)
+
+HEARTBEAT_FRAME = f"data: {json.dumps({'type': 'heartbeat'})}\n\n"
+
+
+class SSEHub:
+    """
+    Process-wide SSE hub backed by a single Redis pub/sub connection.
+    Channels are subscribed on demand and reference counted by client queues;
+    heartbeats are pushed to every client from one central task.
+    """
+
+    def __init__(self, heartbeat_interval: float = 30.0, queue_size: int = 100):
+        self.subscribers: Dict[str, Set[asyncio.Queue]] = {}  # channel -> set of client queues
+        self._heartbeat_interval = heartbeat_interval
+        self._queue_size = queue_size
+        self._pubsub = None
+        self._listener_task: Optional[asyncio.Task] = None
+        self._heartbeat_task: Optional[asyncio.Task] = None
+        self._lock = asyncio.Lock()
+        self._stop = False
+        self._metrics = {
+            "messages_received": 0,
+            "messages_dropped": 0,
+            "redis_errors": 0,
+        }
+
+    async def subscribe(self, channel: str) -> asyncio.Queue:
+        """Register a client queue for a channel, subscribing in Redis on first use."""
+        await self.start()
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self._queue_size)
+
+        async with self._lock:
+            is_new_channel = channel not in self.subscribers
+            self.subscribers.setdefault(channel, set()).add(queue)
+            if is_new_channel and self._pubsub is not None:
+                await self._pubsub.subscribe(channel)
+
+        logger.debug("SSE client subscribed to %s (clients: %s)", channel, len(self.subscribers[channel]))
+        return queue
+
+    async def unsubscribe(self, channel: str, queue: asyncio.Queue) -> None:
+        """Remove a client queue, unsubscribing in Redis when the last client leaves."""
+        async with self._lock:
+            queues = self.subscribers.get(channel)
+            if queues is None:
+                return
+
+            queues.discard(queue)
+            if queues:
+                return
+
+            del self.subscribers[channel]
+            if self._pubsub is not None:
+                try:
+                    await self._pubsub.unsubscribe(channel)
+                except Exception as e:
+                    logger.warning("Failed to unsubscribe SSE channel %s: %s", channel, e)
+
+        logger.debug("SSE channel %s has no clients left, unsubscribed", channel)
+
+    def dispatch(self, channel: str, frame: str) -> int:
+        """Push a pre-formatted SSE frame to every client queue of a channel."""
+        queues = self.subscribers.get(channel)
+        if not queues:
+            return 0
+
+        for queue in list(queues):
+            if queue.full():
+                # Slow client: drop its oldest frame rather than blocking the hub
+                queue.get_nowait()
+                self._metrics["messages_dropped"] += 1
+            queue.put_nowait(frame)
+
+        return len(queues)
+
+    async def start(self) -> None:
+        """Start the listener and heartbeat tasks if they are not running."""
+        if self._listener_task and not self._listener_task.done():
+            return
+
+        self._stop = False
+        self._listener_task = asyncio.create_task(self._run_pubsub())
+        self._heartbeat_task = asyncio.create_task(self._run_heartbeat())
+        logger.info("Started SSE hub")
+
+    async def stop(self) -> None:
+        """Stop the hub and release its Redis connection."""
+        self._stop = True
+        for task in (self._listener_task, self._heartbeat_task):
+            if task:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+
+        await self._close_pubsub()
+        logger.info("Stopped SSE hub")
+
+    async def _close_pubsub(self) -> None:
+        if self._pubsub is None:
+            return
+
+        try:
+            await self._pubsub.close()
+        except Exception:
+            pass
+        self._pubsub = None
+
+    async def _run_pubsub(self) -> None:
+        """Run the shared pub/sub listener with exponential backoff."""
+        backoff = 0.5
+        max_backoff = 30.0
+
+        while not self._stop:
+            try:
+                redis_client = await get_async_redis_client()
+                async with self._lock:
+                    self._pubsub = redis_client.pubsub(ignore_subscribe_messages=True)
+                    # Resubscribe to every channel that still has clients after a reconnect
+                    if self.subscribers:
+                        await self._pubsub.subscribe(*self.subscribers.keys())
+                backoff = 0.5
+
+                while not self._stop:
+                    if not self._pubsub.subscribed:
+                        await asyncio.sleep(1.0)
+                        continue
+
+                    message = await self._pubsub.get_message(timeout=1.0)
+                    if message is None or message.get("type") != "message":
+                        continue
+
+                    self._metrics["messages_received"] += 1
+                    data = message.get("data", "")
+                    if isinstance(data, bytes):
+                        data = data.decode("utf-8")
+
+                    self.dispatch(message.get("channel", ""), f"data: {data}\n\n")
+
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.exception("SSE hub pub/sub error: %s", e)
+                self._metrics["redis_errors"] += 1
+                await self._close_pubsub()
+
+                if not self._stop:
+                    logger.info("Retrying SSE hub Redis connection in %.1f seconds", backoff)
+                    await asyncio.sleep(backoff)
+                    backoff = min(backoff * 1.5, max_backoff)
+
+    async def _run_heartbeat(self) -> None:
+        """Send a heartbeat frame to every connected client on a fixed interval."""
+        while not self._stop:
+            await asyncio.sleep(self._heartbeat_interval)
+            for channel in list(self.subscribers.keys()):
+                self.dispatch(channel, HEARTBEAT_FRAME)
+
+    def get_stats(self) -> dict:
+        """Get hub statistics."""
+        return {
+            **self._metrics,
+            "channels": len(self.subscribers),
+            "clients": sum(len(queues) for queues in self.subscribers.values()),
+        }
+
+
+# Global instance
+sse_hub = SSEHub()
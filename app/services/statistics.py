@@ -1,31 +1,29 @@
 import logging
 from datetime import datetime, timedelta, timezone
-from typing import Any, List, Optional
+from typing import Any, Dict, List, Optional, Set
 from uuid import UUID
 
 from sqlalchemy import func
 from sqlmodel import Session, select
 
+from app.core.config import settings
 from app.crud.statistics import (
     crud_get_active_projects,
-    crud_get_bot_usage_count,
     crud_get_file_type_breakdown,
     crud_get_meeting_chart_data,
-    crud_get_meeting_count,
-    crud_get_meeting_duration,
-    crud_get_meeting_ids_subquery,
+    crud_get_meeting_chart_data_from_rollups,
+    crud_get_meeting_dashboard_aggregates,
+    crud_get_meeting_stakeholder_ids,
     crud_get_meetings_by_time,
     crud_get_priority_tasks,
     crud_get_project_aggregates,
+    crud_get_project_member_ids,
     crud_get_storage_aggregates,
-    crud_get_summary_meeting_counts,
-    crud_get_summary_project_count,
-    crud_get_summary_task_counts,
-    crud_get_task_aggregates,
     crud_get_task_chart_data,
-    crud_get_task_period_counts,
-    crud_get_transcript_meeting_count,
-    crud_get_upcoming_meetings_count,
+    crud_get_task_chart_data_from_rollups,
+    crud_get_task_dashboard_aggregates,
+    crud_get_task_stakeholder_ids,
+    crud_refresh_user_daily_stats,
 )
 from app.models.meeting import Meeting, ProjectMeeting
 from app.models.project import UserProject
@@ -46,9 +44,16 @@ from app.schemas.statistics import (
     TaskStats,
     TaskStatusBreakdown,
 )
+from app.utils.redis import redis_client
 
 logger = logging.getLogger(__name__)
 
+DASHBOARD_CACHE_PREFIX = "dashboard_stats"
+DASHBOARD_EVENT_TARGETS = {"task", "meeting", "project", "file", "transcript", "audio"}
+ROLLUP_WATERMARK_KEY = "statistics_rollup:watermark"
+ROLLUP_LOCK_KEY = "statistics_rollup:lock"
+ROLLUP_MIN_RANGE = timedelta(days=90)
+
 
 def get_date_range(period: DashboardPeriod) -> Optional[datetime]:
     now = datetime.now(timezone.utc)
@@ -61,24 +66,24 @@ def get_date_range(period: DashboardPeriod) -> Optional[datetime]:
     return None
 
 
-def _fill_chart_data(data: List[Any], start_date: Optional[datetime]) -> List[ChartDataPoint]:
-    if not start_date:
-        return [ChartDataPoint(date=d.date() if hasattr(d, "date") else d, count=c, value=v) for d, c, v in data]
+def _build_chart_data(data: List[Any]) -> List[ChartDataPoint]:
+    return [ChartDataPoint(date=d.date() if hasattr(d, "date") else d, count=c, value=v) for d, c, v in data]
+
 
-    data_map = {(d.date() if hasattr(d, "date") else d): (c, v) for d, c, v in data}
-    result = []
-    current_date = start_date.date() if hasattr(start_date, "date") else start_date
-    end_date = datetime.now(timezone.utc).date()
+def _rollups_ready() -> bool:
+    # The watermark is only written once a refresh has completed, so until then the rollup table is incomplete
+    try:
+        return bool(redis_client.exists(ROLLUP_WATERMARK_KEY))
+    except Exception as e:
+        logger.warning("Failed to read statistics rollup watermark: %s", e)
+        return False
 
-    while current_date <= end_date:
-        if current_date in data_map:
-            count, value = data_map[current_date]
-            result.append(ChartDataPoint(date=current_date, count=count, value=value))
-        else:
-            result.append(ChartDataPoint(date=current_date, count=0, value=0))
-        current_date += timedelta(days=1)
 
-    return result
+def _use_rollups(start_date: Optional[datetime]) -> bool:
+    # Short ranges are cheap on the raw tables; rollups only pay off for long windows
+    if start_date is not None and datetime.now(timezone.utc) - start_date < ROLLUP_MIN_RANGE:
+        return False
+    return _rollups_ready()
 
 
 def _build_task_scope_filter(user_id: UUID, scope: DashboardScope):
@@ -107,58 +112,47 @@ def _build_meeting_scope_filter(user_id: UUID, scope: DashboardScope):
         return or_(Meeting.created_by == user_id, Meeting.id.in_(meeting_ids_in_projects))
 
 
-def get_task_stats(db: Session, user_id: UUID, start_date: Optional[datetime], scope: DashboardScope) -> TaskStats:
-    scope_filter = _build_task_scope_filter(user_id, scope)
-    total, todo, in_progress, done, overdue, due_today, due_this_week = crud_get_task_aggregates(db, scope_filter)
-
-    created_in_period, completed_in_period = 0, 0
-    if start_date:
-        created_in_period, completed_in_period = crud_get_task_period_counts(db, scope_filter, start_date)
-
-    rate = (done / total * 100) if total > 0 else 0.0
-    chart_results = crud_get_task_chart_data(db, scope_filter, start_date)
-    formatted_chart_data = [(day, count, completed or 0) for day, count, completed in chart_results]
-    chart_data = _fill_chart_data(formatted_chart_data, start_date)
+def get_task_stats(db: Session, aggregates: Any, scope_filter: Any, start_date: Optional[datetime], user_id: UUID, scope: DashboardScope) -> TaskStats:
+    rate = (aggregates.done / aggregates.total * 100) if aggregates.total > 0 else 0.0
+    if scope != DashboardScope.PROJECT and _use_rollups(start_date):
+        chart_results = crud_get_task_chart_data_from_rollups(db, user_id, scope_filter, start_date)
+    else:
+        chart_results = crud_get_task_chart_data(db, scope_filter, start_date)
+    chart_data = _build_chart_data([(day, count, completed or 0) for day, count, completed in chart_results])
 
     return TaskStats(
-        total=total,
-        status_breakdown=TaskStatusBreakdown(todo=todo, in_progress=in_progress, done=done),
-        overdue_count=overdue,
+        total=aggregates.total,
+        status_breakdown=TaskStatusBreakdown(todo=aggregates.todo, in_progress=aggregates.in_progress, done=aggregates.done),
+        overdue_count=aggregates.overdue,
         completion_rate=round(rate, 1),
-        due_today=due_today,
-        due_this_week=due_this_week,
-        created_this_period=created_in_period,
-        completed_this_period=completed_in_period,
+        due_today=aggregates.due_today,
+        due_this_week=aggregates.due_this_week,
+        created_this_period=aggregates.created_in_period,
+        completed_this_period=aggregates.completed_in_period,
         chart_data=chart_data,
     )
 
 
-def get_meeting_stats(db: Session, user_id: UUID, start_date: Optional[datetime], scope: DashboardScope) -> MeetingStats:
-    scope_filter = _build_meeting_scope_filter(user_id, scope)
-    meeting_ids_scalar = crud_get_meeting_ids_subquery(scope_filter, start_date)
-
-    total_count = crud_get_meeting_count(db, scope_filter, start_date)
-    bot_usage = crud_get_bot_usage_count(db, meeting_ids_scalar)
-    meetings_with_transcript = crud_get_transcript_meeting_count(db, meeting_ids_scalar)
-    upcoming_count = crud_get_upcoming_meetings_count(db, scope_filter)
-    total_seconds = crud_get_meeting_duration(db, meeting_ids_scalar)
-
-    total_minutes = int(total_seconds / 60)
+def get_meeting_stats(db: Session, aggregates: Any, scope_filter: Any, start_date: Optional[datetime], user_id: UUID, scope: DashboardScope) -> MeetingStats:
+    total_count = aggregates.period_total
+    total_minutes = int((aggregates.duration_seconds or 0) / 60)
     avg_minutes = round(total_minutes / total_count, 1) if total_count > 0 else 0.0
-    bot_usage_rate = round((bot_usage / total_count) * 100, 1) if total_count > 0 else 0.0
+    bot_usage_rate = round((aggregates.bot_usage / total_count) * 100, 1) if total_count > 0 else 0.0
 
-    chart_results = crud_get_meeting_chart_data(db, scope_filter, start_date)
-    formatted_chart_data = [(d, c, 0) for d, c in chart_results]
-    chart_data = _fill_chart_data(formatted_chart_data, start_date)
+    if scope == DashboardScope.PERSONAL and _use_rollups(start_date):
+        chart_results = crud_get_meeting_chart_data_from_rollups(db, user_id, scope_filter, start_date)
+    else:
+        chart_results = crud_get_meeting_chart_data(db, scope_filter, start_date)
+    chart_data = _build_chart_data([(d, c, 0) for d, c in chart_results])
 
     return MeetingStats(
         total_count=total_count,
         total_duration_minutes=total_minutes,
         average_duration_minutes=avg_minutes,
-        bot_usage_count=bot_usage,
+        bot_usage_count=aggregates.bot_usage,
         bot_usage_rate=bot_usage_rate,
-        meetings_with_transcript=meetings_with_transcript,
-        upcoming_count=upcoming_count,
+        meetings_with_transcript=aggregates.with_transcript,
+        upcoming_count=aggregates.upcoming,
         chart_data=chart_data,
     )
 
@@ -284,32 +278,25 @@ def get_quick_access(db: Session, user_id: UUID) -> QuickAccessData:
     )
 
 
-def get_summary_stats(db: Session, user_id: UUID, scope: DashboardScope) -> SummaryStats:
+def get_dashboard_stats(db: Session, user_id: UUID, period: DashboardPeriod, scope: DashboardScope) -> DashboardResponse:
+    start_date = get_date_range(period)
     task_scope_filter = _build_task_scope_filter(user_id, scope)
-    task_total, task_pending = crud_get_summary_task_counts(db, task_scope_filter)
-
     meeting_scope_filter = _build_meeting_scope_filter(user_id, scope)
-    meeting_total, upcoming_24h = crud_get_summary_meeting_counts(db, meeting_scope_filter)
-
-    project_count = crud_get_summary_project_count(db, user_id)
-
-    return SummaryStats(
-        total_tasks=task_total,
-        total_meetings=meeting_total,
-        total_projects=project_count,
-        pending_tasks=task_pending,
-        upcoming_meetings_24h=upcoming_24h,
-    )
-
+    task_aggregates = crud_get_task_dashboard_aggregates(db, task_scope_filter, start_date)
+    meeting_aggregates = crud_get_meeting_dashboard_aggregates(db, meeting_scope_filter, start_date)
 
-def get_dashboard_stats(db: Session, user_id: UUID, period: DashboardPeriod, scope: DashboardScope) -> DashboardResponse:
-    start_date = get_date_range(period)
-    summary = get_summary_stats(db, user_id, scope)
-    tasks = get_task_stats(db, user_id, start_date, scope)
-    meetings = get_meeting_stats(db, user_id, start_date, scope)
+    tasks = get_task_stats(db, task_aggregates, task_scope_filter, start_date, user_id, scope)
+    meetings = get_meeting_stats(db, meeting_aggregates, meeting_scope_filter, start_date, user_id, scope)
     projects = get_project_stats(db, user_id)
     storage = get_storage_stats(db, user_id)
     quick_access = get_quick_access(db, user_id)
+    summary = SummaryStats(
+        total_tasks=task_aggregates.total,
+        total_meetings=meeting_aggregates.total,
+        total_projects=projects.active_count,
+        pending_tasks=task_aggregates.pending,
+        upcoming_meetings_24h=meeting_aggregates.upcoming_24h,
+    )
 
     return DashboardResponse(
         period=period,
@@ -321,3 +308,83 @@ def get_dashboard_stats(db: Session, user_id: UUID, period: DashboardPeriod, sco
         storage=storage,
         quick_access=quick_access,
     )
+
+
+def _dashboard_cache_key(user_id: UUID, period: DashboardPeriod, scope: DashboardScope) -> str:
+    return f"{DASHBOARD_CACHE_PREFIX}:{user_id}:{period.value}:{scope.value}"
+
+
+def get_cached_dashboard_stats(db: Session, user_id: UUID, period: DashboardPeriod, scope: DashboardScope) -> DashboardResponse:
+    key = _dashboard_cache_key(user_id, period, scope)
+    try:
+        cached = redis_client.get(key)
+        if cached:
+            return DashboardResponse.model_validate_json(cached)
+    except Exception as e:
+        logger.warning("Failed to read cached dashboard stats for user %s: %s", user_id, e)
+
+    stats = get_dashboard_stats(db, user_id, period, scope)
+    try:
+        redis_client.set(key, stats.model_dump_json(), ex=settings.DASHBOARD_CACHE_TTL_SECONDS)
+    except Exception as e:
+        logger.warning("Failed to cache dashboard stats for user %s: %s", user_id, e)
+    return stats
+
+
+def invalidate_dashboard_stats(user_ids: Set[UUID]) -> None:
+    keys = [_dashboard_cache_key(user_id, period, scope) for user_id in user_ids for period in DashboardPeriod for scope in DashboardScope]
+    if keys:
+        redis_client.delete(*keys)
+
+
+def is_dashboard_event(event: Dict[str, Any]) -> bool:
+    target_type, _, action = (event.get("event_name") or "").partition(".")
+    return target_type in DASHBOARD_EVENT_TARGETS and not action.endswith("_failed")
+
+
+def invalidate_dashboard_stats_for_event(db: Session, event: Dict[str, Any]) -> None:
+    if not is_dashboard_event(event):
+        return
+    event_name = event["event_name"]
+    target_type = event_name.partition(".")[0]
+
+    target_id = UUID(event["target_id"]) if event.get("target_id") else None
+    metadata = event.get("metadata") or {}
+    user_ids = {UUID(event["actor_user_id"])} if event.get("actor_user_id") else set()
+    # Delete events are emitted after the row is gone, so they carry the stakeholders collected beforehand
+    user_ids |= {UUID(user_id) for user_id in metadata.get("stakeholder_ids") or []}
+    if target_type in ("transcript", "audio"):
+        # Transcripts and recordings feed the meeting's transcript and duration stats
+        if metadata.get("meeting_id"):
+            user_ids |= crud_get_meeting_stakeholder_ids(db, UUID(metadata["meeting_id"]))
+    elif target_id and target_type == "task":
+        user_ids |= crud_get_task_stakeholder_ids(db, target_id)
+        # The lookup only sees the current assignee; a reassigned task also changes the previous assignee's stats
+        user_ids |= {UUID(str(user_id)) for user_id in (metadata.get("diff") or {}).get("assignee_id") or [] if user_id}
+    elif target_id and target_type == "meeting":
+        user_ids |= crud_get_meeting_stakeholder_ids(db, target_id)
+    elif target_id and target_type == "project":
+        user_ids |= crud_get_project_member_ids(db, target_id)
+        user_ids |= {UUID(metadata[key]) for key in ("added_user_id", "removed_user_id", "user_id") if metadata.get(key)}
+        # Bulk membership events carry their users as lists; removed users are no longer members
+        user_ids |= {UUID(user_id) for user_id in metadata.get("removed_user_ids") or []}
+        user_ids |= {UUID(user["user_id"]) for user in metadata.get("added_users") or [] if user.get("user_id")}
+
+    invalidate_dashboard_stats(user_ids)
+    logger.debug("Invalidated dashboard stats for %s users after %s", len(user_ids), event_name)
+
+
+def refresh_daily_stats(db: Session, full: bool = False) -> int:
+    """Recompute per-user daily rollups for days touched since the last run."""
+    started_at = datetime.now(timezone.utc)
+    since = None
+    if not full:
+        watermark = redis_client.get(ROLLUP_WATERMARK_KEY)
+        if watermark:
+            # Overlap the previous run so rows committed while it was running are not missed
+            since = datetime.fromisoformat(watermark.decode() if isinstance(watermark, bytes) else watermark) - timedelta(minutes=5)
+
+    rows = crud_refresh_user_daily_stats(db, since)
+    redis_client.set(ROLLUP_WATERMARK_KEY, started_at.isoformat())
+    logger.info("Refreshed %s daily statistics rollup rows (since=%s)", rows, since)
+    return rows
@@ -0,0 +1,22 @@
+import uuid
+from typing import Dict, Iterable, List
+
+from app.utils.logging import logger
+
+
+def schedule_storage_cleanup(objects_by_bucket: Dict[str, List[str]], file_ids: Iterable[uuid.UUID] = ()) -> None:
+    """Enqueue background deletion of storage objects and file vectors.
+
+    Call only after the rows referencing them are committed, so a rollback never leaves rows without content.
+    """
+    objects_by_bucket = {bucket: list(names) for bucket, names in objects_by_bucket.items() if names}
+    file_ids = [str(file_id) for file_id in file_ids]
+    if not objects_by_bucket and not file_ids:
+        return
+    try:
+        # Lazy import to avoid circular import
+        from app.jobs.tasks import delete_storage_objects_task
+
+        delete_storage_objects_task.delay(objects_by_bucket, file_ids)
+    except Exception as e:
+        logger.error(f"Failed to enqueue storage cleanup for {sum(len(names) for names in objects_by_bucket.values())} objects: {e}")
@@ -5,6 +5,7 @@ from fastapi import HTTPException, status
 from sqlalchemy.orm import Session
 
 from app.constants.messages import MessageDescriptions
+from app.crud.statistics import crud_get_task_stakeholder_ids
 from app.crud.task import (
     crud_check_direct_access,
     crud_check_meeting_access,
@@ -31,11 +32,15 @@ def check_task_access(db: Session, task_id: uuid.UUID, user_id: uuid.UUID) -> bo
     task = crud_get_task(db, task_id)
     if not task:
         return False
+    return _has_task_access(db, task, user_id)
+
+
+def _has_task_access(db: Session, task: Task, user_id: uuid.UUID) -> bool:
     if crud_check_direct_access(task, user_id):
         return True
     if task.meeting_id and crud_check_meeting_access(db, task.meeting_id, user_id):
         return True
-    return crud_check_project_access(db, task_id, user_id)
+    return crud_check_project_access(db, task.id, user_id)
 
 
 def _validate_meeting_and_projects(db: Session, task_data: TaskCreate, creator_id: uuid.UUID) -> None:
@@ -100,6 +105,7 @@ def _notify_assignee(db: Session, task: Task, creator_id: uuid.UUID) -> None:
             "Task Assigned",
             f"You have been assigned to task: {task.title}",
             {"task_id": str(task.id), "type": "task_assigned"},
+            db=db,
         )
     except Exception as e:
         print(f"Failed to send task assignment notification: {e}")
@@ -118,6 +124,7 @@ def _notify_assignee_updated(db: Session, task: Task, assignee_id: uuid.UUID, us
             "Task Assigned",
             f"You have been assigned to task: {task.title}",
             {"task_id": str(task.id), "type": "task_assigned"},
+            db=db,
         )
     except Exception as e:
         print(f"Failed to send assignment notification: {e}")
@@ -169,6 +176,7 @@ def _emit_update_event_and_notifications(
                     "Task Updated",
                     f"Task '{task.title}' status changed to {updates['status']}",
                     {"task_id": str(task.id), "type": "task_updated"},
+                    db=db,
                 )
     except Exception as e:
         print(f"Failed to send task update notification: {e}")
@@ -238,9 +246,11 @@ def delete_task(db: Session, task_id: uuid.UUID, user_id: uuid.UUID) -> bool:
             )
         )
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=MessageDescriptions.TASK_NOT_FOUND)
+    # Stakeholders can no longer be looked up once the task is gone
+    stakeholder_ids = crud_get_task_stakeholder_ids(db, task_id)
     crud_delete_task(db, task_id)
     try:
-        EventManager.emit_domain_event(BaseDomainEvent(event_name="task.deleted", actor_user_id=user_id, target_type="task", target_id=task_id, metadata={}))
+        EventManager.emit_domain_event(BaseDomainEvent(event_name="task.deleted", actor_user_id=user_id, target_type="task", target_id=task_id, metadata={"stakeholder_ids": [str(stakeholder_id) for stakeholder_id in stakeholder_ids]}))
     except Exception:
         pass
     return True
@@ -299,9 +309,11 @@ def get_tasks(
     created_at_lte: Optional[str] = None,
     page: int = 1,
     limit: int = 20,
-) -> Tuple[List[Task], int]:
-    # Get all tasks with filters first
-    tasks, total = crud_get_tasks(
+    cursor: Optional[str] = None,
+    include_total: bool = True,
+) -> Tuple[List[Task], Optional[int]]:
+    # crud_get_tasks restricts rows to tasks the user can access, so the page is returned as queried
+    return crud_get_tasks(
         db=db,
         user_id=user_id,
         title=title,
@@ -315,13 +327,10 @@ def get_tasks(
         created_at_lte=created_at_lte,
         page=page,
         limit=limit,
+        cursor=cursor,
+        include_total=include_total,
     )
 
-    # Filter tasks based on access control
-    accessible_tasks = [task for task in tasks if check_task_access(db, task.id, user_id)]
-
-    return accessible_tasks, len(accessible_tasks)
-
 
 def serialize_task(task: Task) -> TaskResponse:
     projects: list[ProjectResponse] = []
@@ -1,5 +1,4 @@
 import os
-import tempfile
 import uuid
 from typing import List, Optional, Tuple
 
@@ -15,14 +14,15 @@ from app.crud.transcript import (
     crud_update_transcript,
 )
 from app.events.domain_events import BaseDomainEvent, build_diff
-from app.models.meeting import Transcript
+from app.models.meeting import AudioFile, Transcript
 from app.schemas.transcript import TranscriptCreate, TranscriptUpdate
 from app.services.audio_file import get_audio_file
 from app.services.event_manager import EventManager
+from app.utils.audio import probe_audio, transcode_for_transcription
 from app.utils.inference import transcriber
 from app.utils.logging import logger
 from app.utils.meeting import check_meeting_access
-from app.utils.minio import download_file_from_minio
+from app.utils.minio import download_file_to_temp_from_minio
 
 from .meeting import get_meeting
 
@@ -37,6 +37,22 @@ def check_transcript_access(db: Session, transcript_id: uuid.UUID, user_id: uuid
     return check_meeting_access(db, meeting, user_id)
 
 
+def prepare_audio_for_transcription(db: Session, audio_file: AudioFile, path: str) -> Optional[str]:
+    """Store probed audio metadata on the row and return a normalized copy for the transcriber, if one could be made."""
+    probe = probe_audio(path)
+    if probe:
+        if probe.duration_seconds is not None:
+            audio_file.duration_seconds = round(probe.duration_seconds)
+        audio_file.sample_rate = probe.sample_rate
+        audio_file.channels = probe.channels
+        db.commit()
+        logger.debug(f"Probed audio {audio_file.id}: {probe}")
+    normalized_path = transcode_for_transcription(path)
+    if normalized_path:
+        logger.debug(f"Normalized audio {audio_file.id}: {os.path.getsize(path)} -> {os.path.getsize(normalized_path)} bytes")
+    return normalized_path
+
+
 def transcribe_audio_file(db: Session, audio_id: uuid.UUID) -> Optional[Transcript]:
     audio_file = get_audio_file(db, audio_id)
     if not audio_file:
@@ -63,8 +79,9 @@ def transcribe_audio_file(db: Session, audio_id: uuid.UUID) -> Optional[Transcri
         return None
     bucket_name = "audio-files"
     object_name = audio_file.file_url.split("/")[-1].split("?")[0]
-    audio_bytes = download_file_from_minio(bucket_name, object_name)
-    if not audio_bytes:
+    file_extension = "." + object_name.split(".")[-1] if "." in object_name else ".webm"
+    temp_path = download_file_to_temp_from_minio(bucket_name, object_name, suffix=file_extension)
+    if not temp_path:
         EventManager.emit_domain_event(
             BaseDomainEvent(
                 event_name="transcript.transcribe_failed",
@@ -75,12 +92,10 @@ def transcribe_audio_file(db: Session, audio_id: uuid.UUID) -> Optional[Transcri
             )
         )
         return None
-    file_extension = "." + object_name.split(".")[-1] if "." in object_name else ".webm"
-    with tempfile.NamedTemporaryFile(suffix=file_extension, delete=False) as temp_file:
-        temp_file.write(audio_bytes)
-        temp_path = temp_file.name
+    normalized_path = None
     try:
-        transcript_text, token_usage = transcriber(temp_path)
+        normalized_path = prepare_audio_for_transcription(db, audio_file, temp_path)
+        transcript_text, token_usage = transcriber(normalized_path or temp_path)
         transcript_data = TranscriptCreate(
             meeting_id=audio_file.meeting_id,
             content=transcript_text,
@@ -108,6 +123,8 @@ def transcribe_audio_file(db: Session, audio_id: uuid.UUID) -> Optional[Transcri
         return transcript
     finally:
         os.unlink(temp_path)
+        if normalized_path:
+            os.unlink(normalized_path)
 
 
 def create_transcript(db: Session, transcript_data: TranscriptCreate, user_id: uuid.UUID) -> Transcript:
@@ -162,7 +179,7 @@ def get_transcript_by_meeting(db: Session, meeting_id: uuid.UUID, user_id: uuid.
     return crud_get_transcript(db, meeting_id=meeting_id)
 
 
-def get_transcripts(db: Session, user_id: uuid.UUID, content_search: Optional[str] = None, meeting_id: Optional[uuid.UUID] = None, page: int = 1, limit: int = 20) -> Tuple[List[Transcript], int]:
+def get_transcripts(db: Session, user_id: uuid.UUID, content_search: Optional[str] = None, meeting_id: Optional[uuid.UUID] = None, page: int = 1, limit: int = 20) -> Tuple[List[Tuple[Transcript, Optional[str]]], int]:
     return crud_get_transcripts(db, user_id, content_search=content_search, meeting_id=meeting_id, page=page, limit=limit)
 
 
@@ -201,7 +218,7 @@ def update_transcript(db: Session, transcript_id: uuid.UUID, transcript_data: Tr
                 actor_user_id=user_id,
                 target_type="transcript",
                 target_id=transcript.id,
-                metadata={"diff": diff},
+                metadata={"diff": diff, "meeting_id": str(transcript.meeting_id)},
             )
         )
     return transcript
@@ -219,6 +236,8 @@ def delete_transcript(db: Session, transcript_id: uuid.UUID, user_id: uuid.UUID)
             )
         )
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="No access to transcript")
+    transcript = crud_get_transcript(db, transcript_id)
+    meeting_id = transcript.meeting_id if transcript else None
     if not crud_delete_transcript(db, transcript_id):
         EventManager.emit_domain_event(
             BaseDomainEvent(
@@ -236,7 +255,7 @@ def delete_transcript(db: Session, transcript_id: uuid.UUID, user_id: uuid.UUID)
             actor_user_id=user_id,
             target_type="transcript",
             target_id=transcript_id,
-            metadata={},
+            metadata={"meeting_id": str(meeting_id) if meeting_id else None},
         )
     )
 
@@ -0,0 +1,185 @@
+import json
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Tuple
+
+from fastapi import HTTPException, status
+from sqlalchemy.orm import Session
+
+from app.constants.messages import MessageConstants
+from app.core.config import settings
+from app.crud.file import crud_complete_pending_file, crud_create_file, crud_delete_file, crud_delete_pending_file, crud_get_file
+from app.crud.audio_file import crud_get_audio_file
+from app.crud.meeting import crud_complete_pending_audio_file, crud_create_audio_file, crud_delete_audio_file, crud_delete_pending_audio_file, crud_get_next_audio_file_seq_order
+from app.events.domain_events import BaseDomainEvent
+from app.models.file import File
+from app.models.meeting import AudioFile
+from app.schemas.file import FileCreate
+from app.utils.logging import logger
+from app.utils.minio import (
+    delete_file_from_minio,
+    generate_presigned_upload_url,
+    generate_presigned_url,
+    matches_content_type,
+    read_object_head,
+    stat_object_in_minio,
+)
+from app.utils.redis import redis_client
+
+UPLOAD_SLOT_PREFIX = "upload_slot"
+PENDING_UPLOADS_KEY = "upload_slots:pending"  # sorted set of slot ids scored by expiry time
+
+
+def _slot_key(slot_id: str) -> str:
+    return f"{UPLOAD_SLOT_PREFIX}:{slot_id}"
+
+
+def _cleanup_deadline() -> datetime:
+    # Completion is accepted for one more URL lifetime after the presigned URL expires
+    return datetime.now(timezone.utc) + timedelta(seconds=settings.MINIO_UPLOAD_URL_EXPIRE_SECONDS * 2)
+
+
+def _open_slot(slot_id: str, user_id: uuid.UUID, object_name: str, content_type: Optional[str], max_size: int, deadline: datetime) -> None:
+    slot = {"user_id": str(user_id), "object_name": object_name, "content_type": content_type, "max_size": max_size}
+    pipe = redis_client.pipeline()
+    # The slot outlives the cleanup deadline so cleanup can still find the object
+    pipe.set(_slot_key(slot_id), json.dumps(slot), ex=settings.MINIO_UPLOAD_URL_EXPIRE_SECONDS * 3)
+    pipe.zadd(PENDING_UPLOADS_KEY, {slot_id: deadline.timestamp()})
+    pipe.execute()
+
+
+def _get_slot(slot_id: str, user_id: uuid.UUID) -> dict:
+    raw = redis_client.get(_slot_key(slot_id))
+    slot = json.loads(raw) if raw else None
+    if not slot or slot["user_id"] != str(user_id):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=MessageConstants.FILE_NOT_FOUND)
+    return slot
+
+
+def _close_slot(slot_id: str) -> None:
+    pipe = redis_client.pipeline()
+    pipe.delete(_slot_key(slot_id))
+    pipe.zrem(PENDING_UPLOADS_KEY, slot_id)
+    pipe.execute()
+
+
+def _verify_uploaded_object(slot: dict) -> int:
+    """Check the uploaded object against its slot and return its size; rejects remove the object."""
+    stat = stat_object_in_minio(settings.MINIO_BUCKET_NAME, slot["object_name"])
+    if stat is None:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Upload not found in storage")
+
+    head = read_object_head(settings.MINIO_BUCKET_NAME, slot["object_name"]) if stat.size else b""
+    if stat.size > slot["max_size"] or head is None or not matches_content_type(head, slot["content_type"]):
+        delete_file_from_minio(settings.MINIO_BUCKET_NAME, slot["object_name"])
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=MessageConstants.VALIDATION_ERROR)
+    return stat.size
+
+
+def create_file_upload_slot(db: Session, file_data: FileCreate, uploaded_by: uuid.UUID) -> Tuple[File, str]:
+    """Create a pending file row and a presigned URL the client uploads its content to."""
+    deadline = _cleanup_deadline()
+    file = crud_create_file(db, **{**file_data.model_dump(), "uploaded_by": uploaded_by, "upload_expires_at": deadline})
+    object_name = str(file.id)
+    upload_url = generate_presigned_upload_url(settings.MINIO_BUCKET_NAME, object_name, settings.MINIO_UPLOAD_URL_EXPIRE_SECONDS)
+    if not upload_url:
+        crud_delete_file(db, file.id)
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=MessageConstants.OPERATION_FAILED)
+
+    _open_slot(f"file:{file.id}", uploaded_by, object_name, file_data.mime_type, settings.MAX_FILE_SIZE_MB * 1024 * 1024, deadline)
+    return file, upload_url
+
+
+def complete_file_upload(db: Session, file_id: uuid.UUID, user_id: uuid.UUID) -> File:
+    """Verify a directly uploaded file in storage and mark its row as stored."""
+    # Lazy import to avoid circular import
+    from app.services.event_manager import EventManager
+
+    slot_id = f"file:{file_id}"
+    slot = _get_slot(slot_id, user_id)
+    if not crud_get_file(db, file_id):
+        _close_slot(slot_id)
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=MessageConstants.FILE_NOT_FOUND)
+
+    size_bytes = _verify_uploaded_object(slot)
+    file = crud_complete_pending_file(db, file_id, size_bytes, generate_presigned_url(settings.MINIO_BUCKET_NAME, slot["object_name"]))
+    _close_slot(slot_id)
+    if not file:
+        # Cleanup removed the upload after its deadline passed
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=MessageConstants.FILE_NOT_FOUND)
+
+    EventManager.emit_domain_event(
+        BaseDomainEvent(
+            event_name="file.uploaded",
+            actor_user_id=user_id,
+            target_type="file",
+            target_id=file.id,
+            metadata={
+                "filename": file.filename,
+                "mime_type": file.mime_type,
+                "project_id": str(file.project_id) if file.project_id else None,
+                "meeting_id": str(file.meeting_id) if file.meeting_id else None,
+                "storage_url_present": bool(file.storage_url),
+                "direct_upload": True,
+            },
+        )
+    )
+    return file
+
+
+def create_audio_upload_slot(db: Session, meeting_id: uuid.UUID, uploaded_by: uuid.UUID, filename: str, content_type: str, max_size: int, seq_order: Optional[int] = None) -> Tuple[AudioFile, str]:
+    """Create a pending meeting audio row and a presigned URL the client uploads the recording to."""
+    seq = seq_order if seq_order is not None else crud_get_next_audio_file_seq_order(db, meeting_id)
+    deadline = _cleanup_deadline()
+    audio = crud_create_audio_file(db, meeting_id, uploaded_by, seq, upload_expires_at=deadline)
+    ext = filename.split(".")[-1].lower() if filename and "." in filename else ""
+    object_name = f"meetings/{meeting_id}/audio/{audio.id}{('.' + ext) if ext else ''}"
+    upload_url = generate_presigned_upload_url(settings.MINIO_BUCKET_NAME, object_name, settings.MINIO_UPLOAD_URL_EXPIRE_SECONDS)
+    if not upload_url:
+        crud_delete_audio_file(db, audio.id)
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=MessageConstants.MEETING_AUDIO_UPLOAD_FAILED)
+
+    _open_slot(f"audio:{audio.id}", uploaded_by, object_name, content_type, max_size, deadline)
+    return audio, upload_url
+
+
+def complete_audio_upload(db: Session, meeting_id: uuid.UUID, audio_id: uuid.UUID, user_id: uuid.UUID) -> AudioFile:
+    """Verify a directly uploaded recording in storage and attach its URL to the audio row."""
+    slot_id = f"audio:{audio_id}"
+    slot = _get_slot(slot_id, user_id)
+    if not slot["object_name"].startswith(f"meetings/{meeting_id}/"):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=MessageConstants.FILE_NOT_FOUND)
+
+    _verify_uploaded_object(slot)
+    audio = crud_complete_pending_audio_file(db, audio_id, generate_presigned_url(settings.MINIO_BUCKET_NAME, slot["object_name"]))
+    _close_slot(slot_id)
+    if not audio:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=MessageConstants.FILE_NOT_FOUND)
+    return audio
+
+
+def cleanup_expired_upload_slots(db: Session) -> int:
+    """Remove pending rows and partial objects for direct uploads that were never completed."""
+    expired = redis_client.zrangebyscore(PENDING_UPLOADS_KEY, 0, time.time())
+    removed = 0
+    for raw_slot_id in expired:
+        slot_id = raw_slot_id.decode() if isinstance(raw_slot_id, bytes) else raw_slot_id
+        kind, _, row_id = slot_id.partition(":")
+        raw = redis_client.get(_slot_key(slot_id))
+        try:
+            # Only rows still pending are deleted, so an upload completed since the scan keeps its row and object
+            if kind == "file":
+                orphaned = crud_delete_pending_file(db, uuid.UUID(row_id)) or crud_get_file(db, uuid.UUID(row_id)) is None
+            else:
+                orphaned = crud_delete_pending_audio_file(db, uuid.UUID(row_id)) or crud_get_audio_file(db, uuid.UUID(row_id)) is None
+            if not orphaned:
+                _close_slot(slot_id)
+                continue
+            if raw:
+                delete_file_from_minio(settings.MINIO_BUCKET_NAME, json.loads(raw)["object_name"])
+            removed += 1
+        except Exception as e:
+            logger.warning(f"Failed to clean up upload slot {slot_id}: {e}")
+        _close_slot(slot_id)
+    return removed
@@ -8,7 +8,7 @@ from fastapi import WebSocket
 
 from app.utils.redis import (
     get_async_redis_client,
-    get_recent_messages_for_user,
+    get_messages_since,
     publish_to_user_channel,
 )
 
@@ -74,6 +74,16 @@ class WebSocketConnectionManager:
         if user_id not in self.connections:
             return 0
 
+        return await self.broadcast_text_to_user(user_id, json.dumps(message_data, separators=(",", ":"), ensure_ascii=False))
+
+    async def broadcast_text_to_user(self, user_id: str, payload: str) -> int:
+        """
+        Send an already serialized frame to all WebSocket connections for a user.
+        The payload is encoded once and reused for every connection.
+        """
+        if user_id not in self.connections:
+            return 0
+
         connections = list(self.connections[user_id])
         if not connections:
             return 0
@@ -83,7 +93,7 @@ class WebSocketConnectionManager:
 
         for websocket in connections:
             try:
-                await websocket.send_json(message_data)
+                await websocket.send_text(payload)
                 sent_count += 1
                 self._metrics["messages_sent"] += 1
             except RuntimeError as e:
@@ -129,21 +139,19 @@ class WebSocketConnectionManager:
             user_id = parts[1]
             message_type = parts[2]
 
-            # Parse message data
-            try:
-                message = json.loads(message_data)
-            except json.JSONDecodeError as e:
-                logger.exception("Invalid JSON in Redis message: %s", e)
+            if user_id not in self.connections:
                 return
 
-            # Add metadata
-            message["received_at"] = datetime.now(timezone.utc).isoformat() + "Z"
-            message["channel"] = channel
+            # Splice metadata into the raw JSON so the frame is serialized once for all connections
+            payload = self._with_metadata(message_data, channel)
+            if payload is None:
+                logger.warning("Invalid JSON object in Redis message on channel %s", channel)
+                return
 
             self._metrics["messages_received"] += 1
 
             # Broadcast to user's WebSocket connections
-            sent_count = await self.broadcast_to_user(user_id, message)
+            sent_count = await self.broadcast_text_to_user(user_id, payload)
 
             logger.debug(
                 "Processed Redis message for user %s (type: %s, sent to %s connections)",
@@ -156,6 +164,21 @@ class WebSocketConnectionManager:
             logger.exception("Error handling Redis message: %s", e)
             self._metrics["redis_errors"] += 1
 
+    @staticmethod
+    def _with_metadata(message_data: str, channel: str) -> Optional[str]:
+        """Append received_at/channel to a raw JSON object without re-serializing it."""
+        body = message_data.strip()
+        if not (body.startswith("{") and body.endswith("}")):
+            return None
+
+        metadata = json.dumps(
+            {"received_at": datetime.now(timezone.utc).isoformat() + "Z", "channel": channel},
+            separators=(",", ":"),
+            ensure_ascii=False,
+        )[1:-1]
+        inner = body[1:-1].strip()
+        return "{" + (inner + "," if inner else "") + metadata + "}"
+
     async def start_redis_listener(self) -> None:
         """Start the Redis pub/sub listener for user channels."""
         if self._pubsub_task and not self._pubsub_task.done():
@@ -235,21 +258,27 @@ class WebSocketConnectionManager:
                 else:
                     break
 
-    async def replay_recent_messages(self, user_id: str, websocket: WebSocket) -> None:
-        """Replay recent messages for a reconnecting client."""
+    async def replay_recent_messages(self, user_id: str, websocket: WebSocket, last_id: str) -> int:
+        """
+        Replay messages a reconnecting client missed after its last seen stream id.
+        Returns the number of replayed messages.
+        """
+        replayed = 0
         try:
-            recent_messages = await get_recent_messages_for_user(user_id, limit=10)
+            missed_messages = await get_messages_since(user_id, last_id)
 
-            if recent_messages:
+            if missed_messages:
                 logger.info(
-                    "Replaying %s recent messages for user %s",
-                    len(recent_messages),
+                    "Replaying %s missed messages for user %s since %s",
+                    len(missed_messages),
                     user_id,
+                    last_id,
                 )
 
-                for message in recent_messages:
+                for message in missed_messages:
                     try:
                         await websocket.send_json(message)
+                        replayed += 1
                     except RuntimeError as e:
                         # Handle closed WebSocket connections specifically
                         if "close message has been sent" in str(e):
@@ -264,6 +293,8 @@ class WebSocketConnectionManager:
         except Exception as e:
             logger.exception("Failed to replay messages for user %s: %s", user_id, e)
 
+        return replayed
+
     def get_connection_stats(self) -> dict:
         """Get connection statistics."""
         return {
@@ -0,0 +1,74 @@
+import json
+import logging
+import uuid
+from typing import Iterable, Set
+
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.project import UserProject
+from app.utils.redis import redis_client
+
+logger = logging.getLogger(__name__)
+
+ACCESS_CACHE_PREFIX = "access"
+
+
+def _version_key(user_id: uuid.UUID) -> str:
+    return f"{ACCESS_CACHE_PREFIX}:version:{user_id}"
+
+
+def _projects_key(user_id: uuid.UUID, version: str) -> str:
+    return f"{ACCESS_CACHE_PREFIX}:projects:{user_id}:{version}"
+
+
+def get_user_project_ids(db: Session, user_id: uuid.UUID) -> Set[uuid.UUID]:
+    """Return the ids of projects the user belongs to, cached in Redis per membership version."""
+    key = None
+    try:
+        version = redis_client.get(_version_key(user_id))
+        key = _projects_key(user_id, version.decode() if isinstance(version, bytes) else (version or "0"))
+        cached = redis_client.get(key)
+        if cached is not None:
+            return {uuid.UUID(project_id) for project_id in json.loads(cached)}
+    except Exception as e:
+        logger.warning("Failed to read cached project access for user %s: %s", user_id, e)
+
+    project_ids = {project_id for (project_id,) in db.query(UserProject.project_id).filter(UserProject.user_id == user_id).all()}
+    if key is not None:
+        try:
+            redis_client.set(key, json.dumps([str(project_id) for project_id in project_ids]), ex=settings.ACCESS_CACHE_TTL_SECONDS)
+        except Exception as e:
+            logger.warning("Failed to cache project access for user %s: %s", user_id, e)
+    return project_ids
+
+
+def invalidate_user_access(user_ids: Iterable[uuid.UUID]) -> None:
+    """Bump the membership version of users so their cached project ids are no longer read.
+
+    Bumping a version rather than deleting the entry means a reader that loaded the old
+    membership concurrently can only write it under the stale version key.
+    """
+    user_ids = set(user_ids)
+    if not user_ids:
+        return
+    try:
+        # Version keys never expire: resetting one could make an old cached entry current again
+        pipe = redis_client.pipeline(transaction=False)
+        for user_id in user_ids:
+            pipe.incr(_version_key(user_id))
+        pipe.execute()
+    except Exception as e:
+        logger.warning("Failed to invalidate project access for %s users: %s", len(user_ids), e)
+        _drop_cached_access(user_ids)
+
+
+def _drop_cached_access(user_ids: Set[uuid.UUID]) -> None:
+    # Without a version bump the current entry would keep granting revoked access until it expires
+    for user_id in user_ids:
+        try:
+            keys = list(redis_client.scan_iter(match=_projects_key(user_id, "*")))
+            if keys:
+                redis_client.delete(*keys)
+        except Exception as e:
+            logger.error("Failed to drop cached project access for user %s: %s", user_id, e)
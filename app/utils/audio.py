@@ -0,0 +1,99 @@
+import json
+import logging
+import os
+import subprocess
+import tempfile
+from dataclasses import dataclass
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+# Speech recognition does not benefit from more than 16 kHz mono; FLAC keeps it lossless and compact
+NORMALIZED_SAMPLE_RATE = 16000
+NORMALIZED_CHANNELS = 1
+NORMALIZED_SUFFIX = ".flac"
+FFMPEG_TIMEOUT_SECONDS = 600
+
+
+@dataclass
+class AudioProbe:
+    duration_seconds: Optional[float]
+    sample_rate: Optional[int]
+    channels: Optional[int]
+    codec: Optional[str]
+
+
+def _to_number(value, cast):
+    try:
+        return cast(value) if value not in (None, "N/A") else None
+    except (TypeError, ValueError):
+        return None
+
+
+def probe_audio(path: str) -> Optional[AudioProbe]:
+    """Read duration, sample rate, channels and codec of the first audio stream with ffprobe."""
+    command = [
+        "ffprobe",
+        "-v",
+        "error",
+        "-select_streams",
+        "a:0",
+        "-show_entries",
+        "stream=codec_name,sample_rate,channels,duration:format=duration",
+        "-of",
+        "json",
+        path,
+    ]
+    try:
+        result = subprocess.run(command, capture_output=True, check=True, timeout=60)
+        data = json.loads(result.stdout or b"{}")
+    except (OSError, subprocess.SubprocessError, ValueError) as e:
+        logger.warning("ffprobe failed for %s: %s", path, e)
+        return None
+
+    streams = data.get("streams") or []
+    if not streams:
+        return None
+    stream = streams[0]
+    # Containers such as webm only record the duration at format level
+    duration = _to_number(stream.get("duration"), float) or _to_number((data.get("format") or {}).get("duration"), float)
+    return AudioProbe(
+        duration_seconds=duration,
+        sample_rate=_to_number(stream.get("sample_rate"), int),
+        channels=_to_number(stream.get("channels"), int),
+        codec=stream.get("codec_name"),
+    )
+
+
+def transcode_for_transcription(path: str) -> Optional[str]:
+    """Transcode audio to 16 kHz mono FLAC in a new temporary file and return its path, or None on failure.
+
+    The caller is responsible for removing the file.
+    """
+    fd, output_path = tempfile.mkstemp(suffix=NORMALIZED_SUFFIX)
+    os.close(fd)
+    command = [
+        "ffmpeg",
+        "-nostdin",
+        "-y",
+        "-v",
+        "error",
+        "-i",
+        path,
+        "-vn",
+        "-ac",
+        str(NORMALIZED_CHANNELS),
+        "-ar",
+        str(NORMALIZED_SAMPLE_RATE),
+        "-c:a",
+        "flac",
+        output_path,
+    ]
+    try:
+        subprocess.run(command, capture_output=True, check=True, timeout=FFMPEG_TIMEOUT_SECONDS)
+        return output_path
+    except (OSError, subprocess.SubprocessError) as e:
+        stderr = getattr(e, "stderr", None)
+        logger.warning("ffmpeg transcoding failed for %s: %s %s", path, e, stderr.decode(errors="replace") if stderr else "")
+        os.unlink(output_path)
+        return None
@@ -1,5 +1,8 @@
+import hashlib
 import re
+import threading
 import time
+from collections import OrderedDict
 from datetime import datetime, timedelta, timezone
 from typing import Optional
 from uuid import UUID
@@ -13,6 +16,30 @@ from sqlalchemy.orm import Session
 from app.core.config import settings
 from app.db import get_db
 from app.models.user import User
+from app.utils.user_cache import user_cache
+
+
+_firebase_token_cache: "OrderedDict[str, dict]" = OrderedDict()
+_firebase_token_cache_lock = threading.Lock()
+
+
+def _get_cached_firebase_token(token_hash: str) -> Optional[dict]:
+    with _firebase_token_cache_lock:
+        decoded_token = _firebase_token_cache.get(token_hash)
+        if decoded_token is None:
+            return None
+        if decoded_token.get("exp", 0) <= time.time():
+            del _firebase_token_cache[token_hash]
+            return None
+        _firebase_token_cache.move_to_end(token_hash)
+        return decoded_token
+
+
+def _cache_firebase_token(token_hash: str, decoded_token: dict) -> None:
+    with _firebase_token_cache_lock:
+        _firebase_token_cache[token_hash] = decoded_token
+        while len(_firebase_token_cache) > settings.FIREBASE_TOKEN_CACHE_MAX_SIZE:
+            _firebase_token_cache.popitem(last=False)
 
 
 def verify_firebase_token(id_token: str) -> dict:
@@ -32,9 +59,14 @@ def verify_firebase_token(id_token: str) -> dict:
         if len(token_parts) != 3:
             raise ValueError(f"Invalid JWT format: expected 3 parts, got {len(token_parts)}")
 
-        # Verify the token with Firebase
-        time.sleep(2)  # Small delay to avoid rapid-fire requests in case of retries
-        decoded_token = firebase_auth.verify_id_token(id_token)
+        token_hash = hashlib.sha256(id_token.encode("utf-8")).hexdigest()
+        decoded_token = _get_cached_firebase_token(token_hash)
+        if decoded_token:
+            return decoded_token
+
+        # Verify the token with Firebase, tolerating small clock differences instead of sleeping
+        decoded_token = firebase_auth.verify_id_token(id_token, clock_skew_seconds=settings.FIREBASE_CLOCK_SKEW_SECONDS)
+        _cache_firebase_token(token_hash, decoded_token)
         return decoded_token
     except ValueError as e:
         raise HTTPException(status_code=401, detail=f"Invalid Google token format: {str(e)}")
@@ -135,10 +167,16 @@ def get_current_user(token: str = Depends(jwt_bearer), db: Session = Depends(get
         if not user_id:
             raise HTTPException(status_code=401, detail="Invalid token")
 
+        user = user_cache.get(db, UUID(user_id))
+        if user:
+            return user
+
         user = db.query(User).filter(User.id == UUID(user_id)).first()
         if not user:
             raise HTTPException(status_code=404, detail="User not found")
 
+        user_cache.set(user)
+
         return user
     except HTTPException:
         raise
@@ -0,0 +1,45 @@
+import logging
+from typing import Optional
+
+from app.core.config import settings
+from app.utils.redis import redis_client
+
+logger = logging.getLogger(__name__)
+
+IDEMPOTENCY_PREFIX = "idempotency"
+
+
+def _idempotency_key(scope: str, key: str) -> str:
+    return f"{IDEMPOTENCY_PREFIX}:{scope}:{key}"
+
+
+def claim_idempotency_key(scope: str, key: str, value: str) -> Optional[str]:
+    """Claim a key for a delivery; returns None if claimed, else the value stored by the earlier delivery.
+
+    If Redis is unavailable the delivery is processed rather than dropped.
+    """
+    try:
+        redis_key = _idempotency_key(scope, key)
+        if redis_client.set(redis_key, value, nx=True, ex=settings.WEBHOOK_IDEMPOTENCY_TTL_SECONDS):
+            return None
+        existing = redis_client.get(redis_key)
+        return existing.decode() if isinstance(existing, bytes) else existing
+    except Exception as e:
+        logger.warning("Failed to claim idempotency key %s:%s: %s", scope, key, e)
+        return None
+
+
+def record_idempotency_result(scope: str, key: str, value: str) -> None:
+    """Replace the value of a claimed key, e.g. with the id of what the delivery created."""
+    try:
+        redis_client.set(_idempotency_key(scope, key), value, xx=True, ex=settings.WEBHOOK_IDEMPOTENCY_TTL_SECONDS)
+    except Exception as e:
+        logger.warning("Failed to record idempotency result for %s:%s: %s", scope, key, e)
+
+
+def release_idempotency_key(scope: str, key: str) -> None:
+    """Release a claimed key so a later delivery can be processed again, e.g. after a failure."""
+    try:
+        redis_client.delete(_idempotency_key(scope, key))
+    except Exception as e:
+        logger.warning("Failed to release idempotency key %s:%s: %s", scope, key, e)
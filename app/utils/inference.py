@@ -1,3 +1,4 @@
+import mimetypes
 import os
 import time
 
@@ -11,7 +12,7 @@ def transcriber(audio_path):
     url = f"{settings.TRANSCRIBE_API_BASE_URL}/transcribe"
 
     with open(audio_path, "rb") as f:
-        files = {"file": (os.path.basename(audio_path), f, "audio/wav")}
+        files = {"file": (os.path.basename(audio_path), f, mimetypes.guess_type(audio_path)[0] or "audio/wav")}
         response = requests.post(url, files=files)
 
     if response.status_code != 200:
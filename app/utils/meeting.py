@@ -8,6 +8,7 @@ from app.models.project import UserProject
 from app.models.user import User  # noqa: F401
 from app.schemas.notification import NotificationCreate
 from app.services.notification import create_notifications_bulk
+from app.utils.access import get_user_project_ids
 
 
 def validate_meeting_url(url: Optional[str]) -> bool:
@@ -32,18 +33,7 @@ def check_meeting_access(db: Session, meeting: Meeting, user_id: uuid.UUID) -> b
     # Non-personal
     linked_projects = get_meeting_projects(db, meeting.id)
     if linked_projects:
-        for project_id in linked_projects:
-            user_project = (
-                db.query(UserProject)
-                .filter(
-                    UserProject.user_id == user_id,
-                    UserProject.project_id == project_id,
-                )
-                .first()
-            )
-            if user_project:
-                return True
-        return False
+        return not get_user_project_ids(db, user_id).isdisjoint(linked_projects)
 
     # No linked projects → only owner
     return meeting.created_by == user_id
@@ -88,13 +78,12 @@ def notify_meeting_members(db: Session, meeting: Meeting, action: str, user_id:
         linked_projects = get_meeting_projects(db, meeting.id)
 
         # Get all users from linked projects
-        member_ids = []
-        for project_id in linked_projects:
-            user_projects = db.query(UserProject).filter(UserProject.project_id == project_id).all()
-            member_ids.extend([up.user_id for up in user_projects])
+        member_ids = set()
+        if linked_projects:
+            member_ids = {member_id for (member_id,) in db.query(UserProject.user_id).filter(UserProject.project_id.in_(linked_projects)).distinct().all()}
 
-        # Remove duplicates and current user
-        member_ids = list(set(member_ids) - {user_id})
+        # Remove current user
+        member_ids = list(member_ids - {user_id})
 
         if member_ids:
             notification_data = NotificationCreate(
@@ -1,8 +1,16 @@
+import hashlib
 import io
 import logging
-from typing import Optional
+import os
+import tempfile
+import threading
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Any, BinaryIO, Iterable, Iterator, List, Optional, Set
+from urllib.parse import urlparse
 
 from minio import Minio
+from minio.deleteobjects import DeleteObject
 from minio.error import S3Error
 from tenacity import (
     retry,
@@ -16,6 +24,11 @@ from app.core.config import settings
 logger = logging.getLogger(__name__)
 
 minio_client = None
+presign_client = None
+
+# Buckets confirmed to exist in this process; only a NoSuchBucket error removes an entry
+_known_buckets: Set[str] = set()
+_known_buckets_lock = threading.Lock()
 
 
 def get_minio_client() -> Minio:
@@ -49,12 +62,50 @@ def get_minio_client() -> Minio:
     return minio_client
 
 
+def get_minio_presign_client() -> Minio:
+    """Client addressed at the public MinIO URL, used only to sign URLs handed to browsers.
+
+    The host is part of the signature, so URLs for clients must be signed against the public
+    endpoint rather than the internal one. Signing is offline; the region is fixed to avoid a lookup.
+    """
+    global presign_client
+    if presign_client is None:
+        public_url = urlparse(settings.MINIO_PUBLIC_URL)
+        presign_client = Minio(
+            endpoint=public_url.netloc or settings.MINIO_ENDPOINT,
+            access_key=settings.MINIO_ACCESS_KEY,
+            secret_key=settings.MINIO_SECRET_KEY,
+            secure=public_url.scheme == "https" if public_url.scheme else settings.MINIO_SECURE,
+            region="us-east-1",
+        )
+    return presign_client
+
+
+def ensure_bucket(client: Minio, bucket_name: str) -> None:
+    """Create the bucket if needed, checking storage only the first time a bucket is seen."""
+    if bucket_name in _known_buckets:
+        return
+    with _known_buckets_lock:
+        if bucket_name in _known_buckets:
+            return
+        if not client.bucket_exists(bucket_name=bucket_name):
+            client.make_bucket(bucket_name=bucket_name)
+        _known_buckets.add(bucket_name)
+
+
+def forget_bucket_on_missing(error: Exception, bucket_name: str) -> bool:
+    """Drop a bucket from the known set if the error says it no longer exists."""
+    if isinstance(error, S3Error) and error.code == "NoSuchBucket":
+        _known_buckets.discard(bucket_name)
+        return True
+    return False
+
+
 def ensure_bucket_public_access(client: Minio, bucket_name: str) -> None:
     """Đảm bảo bucket có public read access"""
     try:
         # Tạo bucket nếu chưa tồn tại
-        if not client.bucket_exists(bucket_name=bucket_name):
-            client.make_bucket(bucket_name=bucket_name)
+        ensure_bucket(client, bucket_name)
 
         # Cấu hình bucket policy cho public read
         policy = {
@@ -105,20 +156,21 @@ def upload_bytes_to_minio(
     try:
         client = get_minio_client()
 
-        # Ensure bucket exists
-        if not client.bucket_exists(bucket_name=bucket_name):
-            client.make_bucket(bucket_name=bucket_name)
-
-        # Upload bytes directly
-        file_size = len(file_bytes)
-        file_data = io.BytesIO(file_bytes)
-        client.put_object(
-            bucket_name=bucket_name,
-            object_name=object_name,
-            data=file_data,
-            length=file_size,
-            content_type=content_type,
-        )
+        # Upload bytes directly; a bucket deleted since it was memoized is recreated once
+        for attempt in range(2):
+            ensure_bucket(client, bucket_name)
+            try:
+                client.put_object(
+                    bucket_name=bucket_name,
+                    object_name=object_name,
+                    data=io.BytesIO(file_bytes),
+                    length=len(file_bytes),
+                    content_type=content_type,
+                )
+                break
+            except S3Error as e:
+                if attempt or not forget_bucket_on_missing(e, bucket_name):
+                    raise
 
         return True
     except S3Error as e:
@@ -129,6 +181,112 @@ def upload_bytes_to_minio(
         return False
 
 
+# Leading bytes expected for declared content types; types not listed are not sniffed
+CONTENT_SIGNATURES = {
+    "application/pdf": (b"%PDF",),
+    "application/vnd.openxmlformats-officedocument.wordprocessingml.document": (b"PK\x03\x04",),
+    "audio/wav": (b"RIFF",),
+    "audio/webm": (b"\x1a\x45\xdf\xa3",),
+    "video/webm": (b"\x1a\x45\xdf\xa3",),
+}
+# ISO base media files (mp4/m4a) carry "ftyp" at offset 4
+ISO_MEDIA_TYPES = {"audio/mp4", "audio/m4a", "audio/x-m4a"}
+MPEG_AUDIO_TYPES = {"audio/mpeg", "audio/mp3"}
+
+
+class UploadRejectedError(ValueError):
+    """Raised while streaming an upload whose content does not match its declared type."""
+
+
+class UploadTooLargeError(UploadRejectedError):
+    """Raised while streaming an upload that exceeds its size cap."""
+
+
+@dataclass
+class StreamedUpload:
+    size_bytes: int
+    sha256: str
+
+
+def matches_content_type(head: bytes, content_type: Optional[str]) -> bool:
+    """Check the first bytes of a file against the signature of its declared content type."""
+    if content_type in ISO_MEDIA_TYPES:
+        return head[4:8] == b"ftyp"
+    if content_type in MPEG_AUDIO_TYPES:
+        # ID3 tag or a bare MPEG frame sync (11 set bits)
+        return head.startswith(b"ID3") or (len(head) > 1 and head[0] == 0xFF and head[1] & 0xE0 == 0xE0)
+    signatures = CONTENT_SIGNATURES.get(content_type or "")
+    if not signatures:
+        return True
+    return head.startswith(signatures)
+
+
+class _MeteredReader:
+    """File-like wrapper that sizes, hashes, sniffs and caps a stream as MinIO reads it."""
+
+    def __init__(self, stream: BinaryIO, content_type: Optional[str], max_size: Optional[int]):
+        self._stream = stream
+        self._content_type = content_type
+        self._max_size = max_size
+        self._sha256 = hashlib.sha256()
+        self.size = 0
+
+    def read(self, size: int = -1) -> bytes:
+        chunk = self._stream.read(size)
+        if not chunk:
+            return chunk
+        if self.size == 0 and not matches_content_type(chunk[:16], self._content_type):
+            raise UploadRejectedError(f"Content does not match declared type {self._content_type}")
+        self.size += len(chunk)
+        if self._max_size is not None and self.size > self._max_size:
+            raise UploadTooLargeError(f"Upload exceeds {self._max_size} bytes")
+        self._sha256.update(chunk)
+        return chunk
+
+    @property
+    def sha256(self) -> str:
+        return self._sha256.hexdigest()
+
+
+def upload_stream_to_minio(
+    stream: BinaryIO,
+    bucket_name: str,
+    object_name: str,
+    content_type: Optional[str] = None,
+    max_size: Optional[int] = None,
+) -> Optional[StreamedUpload]:
+    """Stream a file-like object to MinIO as a multipart upload of unknown length
+
+    The stream is read one part at a time, so memory use is bounded by the part
+    size rather than the file size. Exceeding max_size or failing the content
+    sniff aborts the upload and raises UploadRejectedError.
+
+    Returns:
+        StreamedUpload with the size and SHA-256 of the uploaded bytes, or None on storage errors
+    """
+    reader = _MeteredReader(stream, content_type, max_size)
+    try:
+        client = get_minio_client()
+        ensure_bucket(client, bucket_name)
+
+        client.put_object(
+            bucket_name=bucket_name,
+            object_name=object_name,
+            data=reader,
+            length=-1,
+            part_size=settings.MINIO_UPLOAD_PART_SIZE_MB * 1024 * 1024,
+            content_type=content_type or "application/octet-stream",
+        )
+        return StreamedUpload(size_bytes=reader.size, sha256=reader.sha256)
+    except UploadRejectedError:
+        raise
+    except Exception as e:
+        # The stream is partly consumed, so a missing bucket is only recreated on the next upload
+        forget_bucket_on_missing(e, bucket_name)
+        logger.exception(f"MinIO streaming upload error: {e}")
+        return None
+
+
 @retry(
     stop=stop_after_attempt(3),
     wait=wait_exponential(multiplier=0.5, min=0.5, max=5),
@@ -144,6 +302,51 @@ def download_file_from_minio(bucket_name: str, object_name: str) -> Optional[byt
         return None
 
 
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+
+def iter_object_chunks(bucket_name: str, object_name: str, offset: int = 0, length: int = 0, chunk_size: int = DOWNLOAD_CHUNK_SIZE) -> Iterator[bytes]:
+    """Stream an object (or the byte range offset..offset+length) in fixed-size chunks.
+
+    A single ranged GET is read incrementally, so memory stays at one chunk regardless of object size.
+    """
+    client = get_minio_client()
+    response = client.get_object(bucket_name=bucket_name, object_name=object_name, offset=offset, length=length)
+    try:
+        yield from response.stream(chunk_size)
+    finally:
+        response.close()
+        response.release_conn()
+
+
+@retry(
+    stop=stop_after_attempt(3),
+    wait=wait_exponential(multiplier=0.5, min=0.5, max=5),
+    retry=retry_if_exception_type(S3Error),
+)
+def _stream_object_to_file(bucket_name: str, object_name: str, path: str) -> None:
+    # Each attempt rewrites the file from the start, so a retried download never leaves partial bytes behind
+    with open(path, "wb") as file:
+        for chunk in iter_object_chunks(bucket_name, object_name):
+            file.write(chunk)
+
+
+def download_file_to_temp_from_minio(bucket_name: str, object_name: str, suffix: str = "") -> Optional[str]:
+    """Stream an object into a new temporary file and return its path, or None on failure.
+
+    Memory use is bounded by the chunk size; the caller is responsible for removing the file.
+    """
+    temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=suffix)
+    temp_file.close()
+    try:
+        _stream_object_to_file(bucket_name, object_name, temp_file.name)
+        return temp_file.name
+    except Exception as e:
+        logger.exception(f"MinIO download error: {e}")
+        os.unlink(temp_file.name)
+        return None
+
+
 @retry(
     stop=stop_after_attempt(3),
     wait=wait_exponential(multiplier=0.5, min=0.5, max=5),
@@ -159,6 +362,32 @@ def delete_file_from_minio(bucket_name: str, object_name: str) -> bool:
         return False
 
 
+def delete_objects_from_minio(bucket_name: str, object_names: Iterable[str]) -> List[str]:
+    """Delete objects with multi-object delete requests and return the names that failed.
+
+    The client sends up to 1000 keys per request; missing objects count as deleted.
+    """
+    object_names = list(dict.fromkeys(object_names))
+    if not object_names:
+        return []
+    try:
+        client = get_minio_client()
+        errors = client.remove_objects(bucket_name=bucket_name, delete_object_list=(DeleteObject(name) for name in object_names))
+        failed = [error.name for error in errors if error.code != "NoSuchKey"]
+    except S3Error as e:
+        if e.code == "NoSuchBucket":
+            forget_bucket_on_missing(e, bucket_name)
+            return []
+        logger.exception(f"MinIO bulk delete error: {e}")
+        return object_names
+    except Exception as e:
+        logger.exception(f"MinIO bulk delete error: {e}")
+        return object_names
+    if failed:
+        logger.warning(f"MinIO bulk delete failed for {len(failed)} of {len(object_names)} objects in {bucket_name}")
+    return failed
+
+
 @retry(
     stop=stop_after_attempt(3),
     wait=wait_exponential(multiplier=0.5, min=0.5, max=5),
@@ -185,6 +414,41 @@ def generate_presigned_url(bucket_name: str, object_name: str) -> Optional[str]:
         return None
 
 
+def generate_presigned_upload_url(bucket_name: str, object_name: str, expires_seconds: int) -> Optional[str]:
+    """Presigned PUT URL that lets a client upload an object directly to MinIO."""
+    try:
+        ensure_bucket(get_minio_client(), bucket_name)
+        return get_minio_presign_client().presigned_put_object(bucket_name=bucket_name, object_name=object_name, expires=timedelta(seconds=expires_seconds))
+    except Exception as e:
+        logger.exception(f"MinIO presigned upload URL error: {e}")
+        return None
+
+
+def stat_object_in_minio(bucket_name: str, object_name: str) -> Optional[Any]:
+    """Return object metadata (size, content type, etag), or None if the object does not exist."""
+    try:
+        client = get_minio_client()
+        return client.stat_object(bucket_name=bucket_name, object_name=object_name)
+    except S3Error:
+        return None
+
+
+def read_object_head(bucket_name: str, object_name: str, length: int = 16) -> Optional[bytes]:
+    """Read the first bytes of an object, e.g. for content sniffing."""
+    response = None
+    try:
+        client = get_minio_client()
+        response = client.get_object(bucket_name=bucket_name, object_name=object_name, offset=0, length=length)
+        return response.read()
+    except S3Error as e:
+        logger.exception(f"MinIO range read error: {e}")
+        return None
+    finally:
+        if response is not None:
+            response.close()
+            response.release_conn()
+
+
 @retry(
     stop=stop_after_attempt(3),
     wait=wait_exponential(multiplier=0.5, min=0.5, max=5),
@@ -0,0 +1,46 @@
+import base64
+import json
+import uuid
+from datetime import datetime
+from typing import Any, List, Optional, Tuple
+
+from fastapi import HTTPException, status
+from sqlalchemy import tuple_
+
+
+def encode_cursor(created_at: datetime, item_id: uuid.UUID) -> str:
+    """Encode a (created_at, id) position as an opaque cursor."""
+    payload = json.dumps([created_at.isoformat(), str(item_id)], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, uuid.UUID]:
+    """Decode a cursor produced by encode_cursor, rejecting malformed input."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, item_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return datetime.fromisoformat(created_at), uuid.UUID(item_id)
+    except Exception:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid pagination cursor")
+
+
+def order_by_position(query: Any, model: Any, descending: bool = True) -> Any:
+    """Order a query by (created_at, id), the key used for keyset pagination."""
+    if descending:
+        return query.order_by(model.created_at.desc(), model.id.desc())
+    return query.order_by(model.created_at.asc(), model.id.asc())
+
+
+def apply_cursor(query: Any, model: Any, cursor: str, descending: bool = True) -> Any:
+    """Restrict a query to rows after the cursor position."""
+    created_at, item_id = decode_cursor(cursor)
+    position = tuple_(model.created_at, model.id)
+    return query.filter(position < (created_at, item_id) if descending else position > (created_at, item_id))
+
+
+def next_cursor(items: List[Any], limit: int) -> Optional[str]:
+    """Cursor for the page after items, or None when this page was the last one."""
+    if not items or len(items) < limit:
+        return None
+    last = items[-1]
+    return encode_cursor(last.created_at, last.id)
@@ -1,9 +1,12 @@
+from typing import Optional
+
 from app.models.project import Project, UserProject
 from app.schemas.project import ProjectResponse, ProjectWithMembers, UserProjectResponse
 
 
-def format_project_response(project: Project) -> ProjectResponse:
-    member_count = len(project.users) if hasattr(project, "users") else None
+def format_project_response(project: Project, member_count: Optional[int] = None) -> ProjectResponse:
+    if member_count is None:
+        member_count = len(project.users) if hasattr(project, "users") else None
     return ProjectResponse(id=project.id, name=project.name, description=project.description, is_archived=project.is_archived, created_by=project.created_by, created_at=project.created_at, updated_at=project.updated_at, member_count=member_count)
 
 
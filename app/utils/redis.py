@@ -1,5 +1,6 @@
 # app/clients/redis_client.py
 import asyncio
+import json
 import logging
 
 import redis
@@ -31,6 +32,9 @@ redis_pool = ConnectionPool(
 
 redis_client = redis.Redis(connection_pool=redis_pool)
 
+# Users per pipeline when fanning out one message to many user channels
+PUBLISH_SHARD_SIZE = 1000
+
 # Async Redis client will be created per event loop
 _async_clients = {}  # Store clients per event loop
 
@@ -119,55 +123,101 @@ async def get_async_redis_client():
         raise
 
 
+def get_user_stream_key(user_id: str) -> str:
+    return f"user_stream:{user_id}"
+
+
 async def publish_to_user_channel(user_id: str, message: dict) -> bool:
     """
     Publish message to user's Redis channel using hierarchical pattern.
     Channel format: user:{user_id}:{message_type}
+
+    The message is first appended to the user's capped stream so reconnecting
+    clients can replay it; the stream id is sent along as ``stream_id``.
     """
     try:
         client = await get_async_redis_client()
         channel = f"user:{user_id}:{message.get('type', 'notification')}"
-        import json
+        stream_key = get_user_stream_key(user_id)
 
         data = json.dumps(message)
-        result = await client.publish(channel, data)
-        logger.debug("Published to %s (subscribers=%s): %s", channel, result, message)
+        async with client.pipeline(transaction=False) as pipe:
+            pipe.xadd(stream_key, {"channel": channel, "data": data}, maxlen=settings.WEBSOCKET_STREAM_MAXLEN, approximate=True)
+            pipe.expire(stream_key, settings.WEBSOCKET_STREAM_TTL_SECONDS)
+            stream_id, _ = await pipe.execute()
+
+        result = await client.publish(channel, json.dumps({**message, "stream_id": stream_id}))
+        logger.debug("Published to %s (subscribers=%s, stream_id=%s): %s", channel, result, stream_id, message)
         return True
     except Exception as e:
         logger.exception("Failed to publish to user channel %s: %s", user_id, e)
         return False
 
 
-async def get_recent_messages_for_user(user_id: str, limit: int = 10) -> list:
+async def publish_to_user_channels(user_ids: list, message: dict, shard_size: int = PUBLISH_SHARD_SIZE) -> int:
+    """
+    Publish the same message to many users' channels with pipelined round trips.
+    Each shard of users costs two round trips (stream append, then publish)
+    instead of two per user; shards are sent concurrently.
+    Returns the number of users the message was published to.
+    """
+    if not user_ids:
+        return 0
+
+    try:
+        client = await get_async_redis_client()
+    except Exception as e:
+        logger.exception("Failed to publish to %s user channels: %s", len(user_ids), e)
+        return 0
+
+    message_type = message.get("type", "notification")
+    data = json.dumps(message)
+
+    async def publish_shard(shard: list) -> int:
+        try:
+            async with client.pipeline(transaction=False) as pipe:
+                for user_id in shard:
+                    stream_key = get_user_stream_key(user_id)
+                    pipe.xadd(stream_key, {"channel": f"user:{user_id}:{message_type}", "data": data}, maxlen=settings.WEBSOCKET_STREAM_MAXLEN, approximate=True)
+                    pipe.expire(stream_key, settings.WEBSOCKET_STREAM_TTL_SECONDS)
+                stream_ids = (await pipe.execute())[::2]
+
+            async with client.pipeline(transaction=False) as pipe:
+                for user_id, stream_id in zip(shard, stream_ids):
+                    pipe.publish(f"user:{user_id}:{message_type}", json.dumps({**message, "stream_id": stream_id}))
+                await pipe.execute()
+            return len(shard)
+        except Exception as e:
+            logger.exception("Failed to publish to shard of %s user channels: %s", len(shard), e)
+            return 0
+
+    user_ids = [str(user_id) for user_id in user_ids]
+    shards = [user_ids[start : start + shard_size] for start in range(0, len(user_ids), shard_size)]
+    published = sum(await asyncio.gather(*(publish_shard(shard) for shard in shards)))
+    logger.debug("Published %s to %s/%s user channels", message_type, published, len(user_ids))
+    return published
+
+
+async def get_messages_since(user_id: str, last_id: str, limit: int = settings.WEBSOCKET_REPLAY_LIMIT) -> list:
     """
-    Get recent messages for a user from Redis for replay functionality.
-    This is used when a WebSocket client reconnects.
+    Get messages published to a user after ``last_id`` from the user's stream.
+    This is used when a WebSocket client reconnects with its last seen stream id.
     """
     try:
         client = await get_async_redis_client()
-        # Get all task progress keys for this user
-        pattern = f"task_progress:*:{user_id}"
-        keys = await client.keys(pattern)
+        entries = await client.xrange(get_user_stream_key(user_id), min=f"({last_id}", max="+", count=limit)
 
         messages = []
-        for key in keys[:limit]:  # Limit to prevent overwhelming
+        for stream_id, fields in entries:
             try:
-                data = await client.hgetall(key)
-                if data:
-                    # Extract task_id from key: task_progress:{task_id}:{user_id}
-                    parts = key.split(":")
-                    task_id = parts[1] if len(parts) >= 3 else None
-                    message = {
-                        "type": "task_progress",
-                        "data": {**data, "task_id": task_id},
-                    }
-                    messages.append(message)
-            except Exception as e:
-                logger.exception("Failed to read message from key %s: %s", key, e)
-
-        # Sort by last_update timestamp (most recent first)
-        messages.sort(key=lambda x: x["data"].get("last_update", ""), reverse=True)
-        return messages[:limit]
+                message = json.loads(fields.get("data", "{}"))
+                message["stream_id"] = stream_id
+                message["channel"] = fields.get("channel")
+                messages.append(message)
+            except json.JSONDecodeError as e:
+                logger.exception("Invalid JSON in stream entry %s: %s", stream_id, e)
+
+        return messages
     except Exception as e:
-        logger.exception("Failed to get recent messages for user %s: %s", user_id, e)
+        logger.exception("Failed to get messages since %s for user %s: %s", last_id, user_id, e)
         return []
@@ -0,0 +1,67 @@
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+from sqlalchemy.orm import Session, make_transient_to_detached
+
+from app.core.config import settings
+from app.models.user import User
+
+
+class UserCache:
+    """
+    Bounded in-process LRU of authenticated users with a short TTL.
+    Stores column snapshots so hits can be re-attached to the request session without a SELECT.
+    """
+
+    def __init__(self, ttl_seconds: int = settings.AUTH_USER_CACHE_TTL_SECONDS, max_size: int = settings.AUTH_USER_CACHE_MAX_SIZE):
+        self.ttl_seconds = ttl_seconds
+        self.max_size = max_size
+        self._entries: "OrderedDict[uuid.UUID, tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, db: Session, user_id: uuid.UUID) -> Optional[User]:
+        """Return the cached user attached to ``db``, or None on a miss or expiry."""
+        if self.ttl_seconds <= 0:
+            return None
+
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is None:
+                return None
+            expires_at, fields = entry
+            if expires_at < time.monotonic():
+                del self._entries[user_id]
+                return None
+            self._entries.move_to_end(user_id)
+
+        user = User(**fields)
+        make_transient_to_detached(user)
+        return db.merge(user, load=False)
+
+    def set(self, user: User) -> None:
+        """Cache a snapshot of the user's column values."""
+        if self.ttl_seconds <= 0:
+            return
+
+        fields = {column.key: getattr(user, column.key) for column in User.__table__.columns}
+        with self._lock:
+            self._entries[user.id] = (time.monotonic() + self.ttl_seconds, fields)
+            self._entries.move_to_end(user.id)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, user_id: uuid.UUID) -> None:
+        """Drop a user from the cache after it was updated or deleted."""
+        with self._lock:
+            self._entries.pop(user_id, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+# Global instance
+user_cache = UserCache()
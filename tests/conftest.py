@@ -0,0 +1,40 @@
+import pytest
+from sqlmodel import Session
+
+from app.db import create_tables, engine
+from app.utils.redis import redis_client
+
+
+@pytest.fixture(scope="session")
+def db_engine():
+    """The configured PostgreSQL database with all tables created; tests using it are skipped without one."""
+    try:
+        with engine.connect():
+            pass
+    except Exception as e:
+        pytest.skip(f"PostgreSQL is not available: {e}")
+    create_tables()
+    return engine
+
+
+@pytest.fixture
+def db(db_engine):
+    """Session whose commits become savepoints of one transaction that is rolled back after the test."""
+    connection = db_engine.connect()
+    transaction = connection.begin()
+    session = Session(bind=connection, join_transaction_mode="create_savepoint")
+    try:
+        yield session
+    finally:
+        session.close()
+        transaction.rollback()
+        connection.close()
+
+
+@pytest.fixture
+def redis():
+    try:
+        redis_client.ping()
+    except Exception as e:
+        pytest.skip(f"Redis is not available: {e}")
+    return redis_client
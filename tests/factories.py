@@ -0,0 +1,34 @@
+import uuid
+
+from sqlmodel import Session
+
+from app.models.meeting import Meeting, ProjectMeeting
+from app.models.project import Project, UserProject
+from app.models.user import User
+
+
+def create_user(db: Session, **fields) -> User:
+    user = User(email=f"{uuid.uuid4().hex}@example.com", **fields)
+    db.add(user)
+    db.commit()
+    return user
+
+
+def create_project(db: Session, owner: User, members=(), **fields) -> Project:
+    project = Project(name=fields.pop("name", "Project"), created_by=owner.id, **fields)
+    db.add(project)
+    db.flush()
+    db.add(UserProject(user_id=owner.id, project_id=project.id, role="owner"))
+    db.add_all([UserProject(user_id=member.id, project_id=project.id, role="member") for member in members])
+    db.commit()
+    return project
+
+
+def create_meeting(db: Session, creator: User, project: Project = None, **fields) -> Meeting:
+    meeting = Meeting(created_by=creator.id, is_personal=fields.pop("is_personal", project is None), **fields)
+    db.add(meeting)
+    db.flush()
+    if project:
+        db.add(ProjectMeeting(project_id=project.id, meeting_id=meeting.id))
+    db.commit()
+    return meeting
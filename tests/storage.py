@@ -0,0 +1,137 @@
+import hashlib
+from types import SimpleNamespace
+
+from minio.error import S3Error
+
+
+def s3_error(code: str, bucket_name: str, object_name: str = None) -> S3Error:
+    return S3Error(None, code, code, f"/{bucket_name}/{object_name or ''}", "request-id", "host-id", bucket_name=bucket_name, object_name=object_name)
+
+
+class RecordingMinio:
+    """Stand-in MinIO client that consumes uploads the way put_object does and records what it read."""
+
+    def __init__(self):
+        self.objects = {}
+        self.reads = []
+
+    def bucket_exists(self, bucket_name):
+        return True
+
+    def put_object(self, bucket_name, object_name, data, length, part_size, content_type=None):
+        size = 0
+        while True:
+            part = data.read(part_size)
+            if not part:
+                break
+            self.reads.append(len(part))
+            size += len(part)
+        self.objects[(bucket_name, object_name)] = size
+
+
+class ObjectResponse:
+    """Body of a get_object call, read or streamed the way a urllib3 response is."""
+
+    def __init__(self, data: bytes):
+        self._data = data
+        self.closed = False
+
+    def read(self):
+        return self._data
+
+    def stream(self, amt):
+        for offset in range(0, len(self._data), amt):
+            yield self._data[offset : offset + amt]
+
+    def close(self):
+        self.closed = True
+
+    def release_conn(self):
+        pass
+
+
+class StoredMinio:
+    """Stand-in MinIO client serving in-memory objects to stat and ranged get calls."""
+
+    def __init__(self):
+        self.objects = {}
+        self.gets = []
+
+    def add(self, bucket_name, object_name, data: bytes, content_type="application/octet-stream"):
+        self.objects[(bucket_name, object_name)] = (data, content_type)
+
+    def _object(self, bucket_name, object_name):
+        if (bucket_name, object_name) not in self.objects:
+            raise s3_error("NoSuchKey", bucket_name, object_name)
+        return self.objects[(bucket_name, object_name)]
+
+    def stat_object(self, bucket_name, object_name):
+        data, content_type = self._object(bucket_name, object_name)
+        return SimpleNamespace(size=len(data), etag=hashlib.md5(data).hexdigest(), content_type=content_type)
+
+    def get_object(self, bucket_name, object_name, offset=0, length=0):
+        data, _ = self._object(bucket_name, object_name)
+        self.gets.append((object_name, offset, length))
+        return ObjectResponse(data[offset : offset + length] if length else data[offset:])
+
+
+class GeneratedResponse:
+    """Body of a large object produced chunk by chunk, so no copy of the whole object is ever held."""
+
+    def __init__(self, size: int, fill: bytes):
+        self._size = size
+        self._fill = fill
+        self.closed = False
+
+    def read(self):
+        return b"".join(self.stream(1024 * 1024))
+
+    def stream(self, amt):
+        remaining = self._size
+        while remaining:
+            chunk = self._fill * (min(amt, remaining) // len(self._fill) + 1)
+            yield chunk[: min(amt, remaining)]
+            remaining -= min(amt, remaining)
+
+    def close(self):
+        self.closed = True
+
+    def release_conn(self):
+        pass
+
+
+class LargeObjectMinio:
+    """Stand-in MinIO client serving a single generated object of the given size."""
+
+    def __init__(self, size: int, fill: bytes = b"0123456789abcdef"):
+        self.size = size
+        self.fill = fill
+        self.responses = []
+
+    def get_object(self, bucket_name, object_name, offset=0, length=0):
+        response = GeneratedResponse(length or self.size - offset, self.fill)
+        self.responses.append(response)
+        return response
+
+
+class CountingMinio:
+    """Stand-in MinIO client that records every round trip and fails writes to missing buckets."""
+
+    def __init__(self, buckets=()):
+        self.buckets = set(buckets)
+        self.calls = []
+
+    def bucket_exists(self, bucket_name):
+        self.calls.append("bucket_exists")
+        return bucket_name in self.buckets
+
+    def make_bucket(self, bucket_name):
+        self.calls.append("make_bucket")
+        self.buckets.add(bucket_name)
+
+    def put_object(self, bucket_name, object_name, data, length, content_type=None, part_size=0):
+        self.calls.append("put_object")
+        if bucket_name not in self.buckets:
+            raise s3_error("NoSuchBucket", bucket_name, object_name)
+        while data.read(part_size or length):
+            pass
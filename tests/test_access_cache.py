@@ -0,0 +1,149 @@
+from types import SimpleNamespace
+
+import pytest
+
+import app.utils.access as access
+from app.crud.file import crud_check_file_access
+from app.crud.project import crud_add_user_to_project, crud_bulk_add_users_to_project, crud_bulk_remove_users_from_project, crud_delete_project_with_cascade, crud_remove_user_from_project
+from app.crud.task import crud_check_meeting_access, crud_check_project_access, crud_check_user_project_access
+from app.models.file import File
+from app.models.meeting import ProjectMeeting
+from app.models.project import Project, UserProject
+from app.models.task import Task, TaskProject
+from app.utils.access import get_user_project_ids
+from app.utils.meeting import check_meeting_access
+from tests.factories import create_meeting, create_project, create_user
+
+pytestmark = pytest.mark.integration
+
+
+def cached_decisions(db, user_id, world):
+    db.expire_all()
+    return {
+        "meeting": check_meeting_access(db, world.meeting, user_id),
+        "task_meeting": crud_check_meeting_access(db, world.meeting.id, user_id),
+        "task_project": crud_check_project_access(db, world.task.id, user_id),
+        "project": crud_check_user_project_access(db, world.project_id, user_id),
+        "file": crud_check_file_access(db, world.file, user_id),
+    }
+
+
+def baseline_decisions(db, user_id, world):
+    """The membership queries the access checks issued before they were cached."""
+    db.expire_all()
+    member_of = db.query(Project.id).join(Project.users).filter(Project.users.any(user_id=user_id)).subquery()
+    linked = db.query(ProjectMeeting.project_id).filter(ProjectMeeting.meeting_id == world.meeting.id).subquery()
+    meeting_member = db.query(UserProject).filter(UserProject.user_id == user_id, UserProject.project_id.in_(linked)).first() is not None
+    file_project = world.file.project_id
+    return {
+        "meeting": meeting_member if db.query(linked).first() else world.meeting.created_by == user_id,
+        "task_meeting": world.meeting.created_by == user_id or meeting_member,
+        "task_project": db.query(TaskProject).filter(TaskProject.task_id == world.task.id, TaskProject.project_id.in_(member_of)).first() is not None,
+        "project": db.query(Project).join(Project.users).filter(Project.id == world.project_id, Project.users.any(user_id=user_id)).first() is not None,
+        "file": world.file.uploaded_by == user_id
+        or (file_project is not None and db.query(Project).join(Project.users).filter(Project.id == file_project, Project.users.any(user_id=user_id)).first() is not None),
+    }
+
+
+def assert_decisions(db, user_id, world, allowed: bool):
+    cached = cached_decisions(db, user_id, world)
+    assert cached == baseline_decisions(db, user_id, world)
+    assert cached == dict.fromkeys(cached, allowed)
+    direct = {project_id for (project_id,) in db.query(UserProject.project_id).filter(UserProject.user_id == user_id)}
+    assert get_user_project_ids(db, user_id) == direct
+
+
+@pytest.fixture
+def people(db, redis):
+    people = SimpleNamespace(owner=create_user(db), member=create_user(db), outsider=create_user(db))
+    user_ids = [people.owner.id, people.member.id, people.outsider.id]
+    yield people
+    for user_id in user_ids:
+        keys = list(redis.scan_iter(match=f"{access.ACCESS_CACHE_PREFIX}:*:{user_id}*"))
+        if keys:
+            redis.delete(*keys)
+
+
+@pytest.fixture
+def world(db, people):
+    project = create_project(db, people.owner, members=[people.member])
+    meeting = create_meeting(db, people.owner, project=project)
+    task = Task(title="Prepare budget", creator_id=people.owner.id, meeting_id=meeting.id)
+    file = File(filename="budget.pdf", storage_url="files/budget.pdf", project_id=project.id, uploaded_by=people.owner.id)
+    db.add_all([task, file])
+    db.flush()
+    db.add(TaskProject(task_id=task.id, project_id=project.id))
+    db.commit()
+    return SimpleNamespace(project_id=project.id, meeting=meeting, task=task, file=file)
+
+
+def test_member_is_allowed(db, people, world):
+    assert_decisions(db, people.member.id, world, allowed=True)
+    # A second check is served from the cache and decides the same way
+    assert_decisions(db, people.member.id, world, allowed=True)
+
+
+def test_non_member_is_denied(db, people, world):
+    assert_decisions(db, people.outsider.id, world, allowed=False)
+    assert_decisions(db, people.outsider.id, world, allowed=False)
+
+
+def test_added_member_is_allowed_despite_cached_denial(db, people, world):
+    assert_decisions(db, people.outsider.id, world, allowed=False)
+
+    crud_add_user_to_project(db, world.project_id, people.outsider.id)
+
+    assert_decisions(db, people.outsider.id, world, allowed=True)
+
+
+def test_removed_member_is_denied_despite_cached_access(db, people, world):
+    assert_decisions(db, people.member.id, world, allowed=True)
+
+    crud_remove_user_from_project(db, world.project_id, people.member.id)
+
+    assert_decisions(db, people.member.id, world, allowed=False)
+
+
+def test_bulk_add_and_remove(db, people, world):
+    newcomers = [create_user(db) for _ in range(3)]
+    for user in newcomers:
+        assert_decisions(db, user.id, world, allowed=False)
+
+    crud_bulk_add_users_to_project(db, world.project_id, {user.id: "member" for user in newcomers})
+    for user in newcomers:
+        assert_decisions(db, user.id, world, allowed=True)
+
+    crud_bulk_remove_users_from_project(db, world.project_id, [user.id for user in newcomers[:2]])
+    for user in newcomers[:2]:
+        assert_decisions(db, user.id, world, allowed=False)
+    assert_decisions(db, newcomers[2].id, world, allowed=True)
+
+
+def test_deleted_project_revokes_cached_access(db, people, world):
+    assert_decisions(db, people.member.id, world, allowed=True)
+    # The project cascade does not remove task links, so the task is unlinked first
+    db.query(TaskProject).filter(TaskProject.task_id == world.task.id).delete()
+    db.commit()
+
+    crud_delete_project_with_cascade(db, world.project_id)
+
+    assert get_user_project_ids(db, people.member.id) == set()
+    decisions = cached_decisions(db, people.member.id, world)
+    assert decisions == baseline_decisions(db, people.member.id, world)
+    assert not any(decisions.values())
+
+
+def test_failed_version_bump_does_not_keep_revoked_access(db, people, world, monkeypatch):
+    assert_decisions(db, people.member.id, world, allowed=True)
+
+    class BrokenPipeline:
+        def incr(self, key):
+            pass
+
+        def execute(self):
+            raise ConnectionError("Redis went away")
+
+    monkeypatch.setattr(access.redis_client, "pipeline", lambda transaction=False: BrokenPipeline())
+    crud_remove_user_from_project(db, world.project_id, people.member.id)
+
+    assert_decisions(db, people.member.id, world, allowed=False)
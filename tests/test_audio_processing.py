@@ -0,0 +1,85 @@
+import math
+import os
+import shutil
+import struct
+import wave
+
+import pytest
+
+from app.models.meeting import AudioFile
+from app.services.transcript import prepare_audio_for_transcription
+from app.utils.audio import NORMALIZED_CHANNELS, NORMALIZED_SAMPLE_RATE, probe_audio, transcode_for_transcription
+from tests.factories import create_meeting, create_user
+
+pytestmark = pytest.mark.skipif(not (shutil.which("ffmpeg") and shutil.which("ffprobe")), reason="ffmpeg and ffprobe are required")
+
+
+def write_sine_wav(path, seconds: float, sample_rate: int, channels: int, frequency: float = 440.0) -> str:
+    """Write a 16-bit PCM sine tone, the same sample in every channel."""
+    frames = bytearray()
+    for index in range(int(seconds * sample_rate)):
+        sample = int(32767 * 0.5 * math.sin(2 * math.pi * frequency * index / sample_rate))
+        frames += struct.pack("<h", sample) * channels
+    with wave.open(str(path), "wb") as wav:
+        wav.setnchannels(channels)
+        wav.setsampwidth(2)
+        wav.setframerate(sample_rate)
+        wav.writeframes(bytes(frames))
+    return str(path)
+
+
+@pytest.fixture
+def stereo_sine(tmp_path):
+    return write_sine_wav(tmp_path / "sine.wav", seconds=2.5, sample_rate=44100, channels=2)
+
+
+@pytest.fixture
+def normalized(stereo_sine):
+    path = transcode_for_transcription(stereo_sine)
+    yield path
+    if path and os.path.exists(path):
+        os.unlink(path)
+
+
+def test_probes_duration_sample_rate_and_channels(stereo_sine):
+    probe = probe_audio(stereo_sine)
+
+    assert probe.duration_seconds == pytest.approx(2.5, abs=0.05)
+    assert probe.sample_rate == 44100
+    assert probe.channels == 2
+    assert probe.codec == "pcm_s16le"
+
+
+def test_transcodes_to_16khz_mono_flac(stereo_sine, normalized):
+    probe = probe_audio(normalized)
+
+    assert normalized.endswith(".flac")
+    assert probe.codec == "flac"
+    assert probe.sample_rate == NORMALIZED_SAMPLE_RATE == 16000
+    assert probe.channels == NORMALIZED_CHANNELS == 1
+    assert probe.duration_seconds == pytest.approx(2.5, abs=0.05)
+    assert os.path.getsize(normalized) < os.path.getsize(stereo_sine) / 4
+
+
+def test_unreadable_input_is_not_probed_or_transcoded(tmp_path):
+    path = tmp_path / "broken.wav"
+    path.write_bytes(b"not audio at all")
+
+    assert probe_audio(str(path)) is None
+    assert transcode_for_transcription(str(path)) is None
+
+
+def test_prepare_stores_metadata_on_the_row(db, tmp_path):
+    owner = create_user(db)
+    audio_file = AudioFile(meeting_id=create_meeting(db, owner).id, uploaded_by=owner.id)
+    db.add(audio_file)
+    db.commit()
+    source = write_sine_wav(tmp_path / "mono.wav", seconds=3.4, sample_rate=22050, channels=1)
+
+    normalized_path = prepare_audio_for_transcription(db, audio_file, source)
+    try:
+        db.refresh(audio_file)
+        assert (audio_file.duration_seconds, audio_file.sample_rate, audio_file.channels) == (3, 22050, 1)
+        assert probe_audio(normalized_path).sample_rate == 16000
+    finally:
+        os.unlink(normalized_path)
@@ -0,0 +1,70 @@
+import pytest
+
+import app.jobs.tasks as tasks
+from app.events.domain_events import BaseDomainEvent, build_diff
+from app.models.task import Task
+from app.schemas.statistics import DashboardPeriod, DashboardScope
+from app.services.event_manager import EventManager
+from app.services.statistics import _dashboard_cache_key, invalidate_dashboard_stats_for_event
+from tests.factories import create_user
+
+pytestmark = pytest.mark.integration
+
+
+@pytest.fixture
+def cached_dashboards(redis):
+    user_ids = []
+
+    def cache(*users):
+        for user in users:
+            user_ids.append(user.id)
+            redis.set(_dashboard_cache_key(user.id, DashboardPeriod.SEVEN_DAYS, DashboardScope.HYBRID), "{}", ex=60)
+
+    yield cache
+    for user_id in user_ids:
+        redis.delete(_dashboard_cache_key(user_id, DashboardPeriod.SEVEN_DAYS, DashboardScope.HYBRID))
+
+
+def is_cached(redis, user):
+    return bool(redis.exists(_dashboard_cache_key(user.id, DashboardPeriod.SEVEN_DAYS, DashboardScope.HYBRID)))
+
+
+def test_reassignment_invalidates_previous_assignee(db, redis, cached_dashboards):
+    creator, previous, current, bystander = (create_user(db) for _ in range(4))
+    task = Task(title="Budget", creator_id=creator.id, assignee_id=previous.id)
+    db.add(task)
+    db.commit()
+    original = {"assignee_id": task.assignee_id}
+    task.assignee_id = current.id
+    db.commit()
+    cached_dashboards(creator, previous, current, bystander)
+
+    event = BaseDomainEvent(event_name="task.updated", actor_user_id=creator.id, target_type="task", target_id=task.id, metadata={"diff": build_diff(original, {"assignee_id": task.assignee_id})})
+    invalidate_dashboard_stats_for_event(db, event.to_dict())
+
+    assert not any(is_cached(redis, user) for user in (creator, previous, current))
+    assert is_cached(redis, bystander)
+
+
+@pytest.fixture
+def queued(monkeypatch):
+    queued = []
+    monkeypatch.setattr(tasks.process_domain_event, "delay", lambda payload: queued.append(("audit", payload["event_name"])))
+    monkeypatch.setattr(tasks.invalidate_dashboard_stats_task, "delay", lambda payload: queued.append(("dashboard", payload["event_name"])))
+    return queued
+
+
+@pytest.mark.parametrize(
+    "event_name, expected",
+    [
+        ("task.updated", [("audit", "task.updated"), ("dashboard", "task.updated")]),
+        ("audio.deleted", [("audit", "audio.deleted"), ("dashboard", "audio.deleted")]),
+        ("task.update_failed", [("audit", "task.update_failed")]),
+        ("user.login", [("audit", "user.login")]),
+    ],
+)
+def test_dashboard_invalidation_runs_in_its_own_task(queued, event_name, expected):
+    target_type = event_name.partition(".")[0]
+    EventManager.emit_domain_event(BaseDomainEvent(event_name=event_name, actor_user_id=None, target_type=target_type))
+
+    assert queued == expected
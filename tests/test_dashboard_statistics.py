@@ -0,0 +1,230 @@
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import and_, case, func, or_
+from sqlmodel import select
+
+import app.services.statistics as statistics
+from app.crud.statistics import crud_refresh_user_daily_stats
+from app.models.meeting import AudioFile, Meeting, MeetingBot, MeetingStatus, ProjectMeeting, Transcript
+from app.models.task import Task, TaskProject
+from app.schemas.statistics import ChartDataPoint, DashboardPeriod, DashboardScope
+from app.services.statistics import _build_meeting_scope_filter, _build_task_scope_filter, get_dashboard_stats, get_date_range
+from tests.factories import create_project, create_user
+
+pytestmark = pytest.mark.integration
+
+
+def _fill(rows, start_date):
+    """The Python gap filling the charts used before they joined onto generate_series."""
+    if not start_date:
+        return [ChartDataPoint(date=day.date(), count=count, value=value) for day, count, value in rows]
+    by_day = {day.date(): (count, value) for day, count, value in rows}
+    points, current, end = [], start_date.date(), datetime.now(timezone.utc).date()
+    while current <= end:
+        count, value = by_day.get(current, (0, 0))
+        points.append(ChartDataPoint(date=current, count=count, value=value))
+        current += timedelta(days=1)
+    return points
+
+
+def _sum_if(condition):
+    return func.coalesce(func.sum(case((condition, 1), else_=0)), 0)
+
+
+def baseline_task_stats(db, user_id, start_date, scope):
+    """Task statistics computed with the separate statements used before they were collapsed."""
+    scope_filter = _build_task_scope_filter(user_id, scope)
+    now = datetime.now(timezone.utc)
+    today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
+    overdue = and_(Task.status != "done", Task.due_date < now, Task.due_date.isnot(None))
+    totals = db.exec(
+        select(
+            func.count(Task.id).label("total"),
+            _sum_if(Task.status == "todo").label("todo"),
+            _sum_if(Task.status == "in_progress").label("in_progress"),
+            _sum_if(Task.status == "done").label("done"),
+            _sum_if(overdue).label("overdue"),
+            _sum_if(and_(Task.due_date >= today_start, Task.due_date < today_start + timedelta(days=1))).label("due_today"),
+            _sum_if(and_(Task.due_date >= today_start, Task.due_date < today_start + timedelta(days=7))).label("due_this_week"),
+            _sum_if(and_(Task.status != "done", or_(and_(Task.due_date < now, Task.due_date.isnot(None)), and_(Task.due_date >= now, Task.due_date < now + timedelta(hours=24))))).label("pending"),
+        ).where(scope_filter)
+    ).one()
+    created, completed = 0, 0
+    if start_date:
+        period = db.exec(select(func.count(Task.id), _sum_if(Task.status == "done")).where(scope_filter, Task.created_at >= start_date)).one()
+        created, completed = period
+    day = func.date_trunc("day", Task.created_at)
+    chart = select(day, func.count(Task.id), _sum_if(Task.status == "done")).where(scope_filter)
+    if start_date:
+        chart = chart.where(Task.created_at >= start_date)
+    chart_rows = db.exec(chart.group_by(day).order_by(day)).all()
+    return SimpleNamespace(
+        total=totals.total,
+        breakdown=(totals.todo, totals.in_progress, totals.done),
+        overdue=totals.overdue,
+        completion_rate=round(totals.done / totals.total * 100, 1) if totals.total else 0.0,
+        due=(totals.due_today, totals.due_this_week),
+        period=(created, completed),
+        pending=totals.pending,
+        chart=_fill(chart_rows, start_date),
+    )
+
+
+def baseline_meeting_stats(db, user_id, start_date, scope):
+    """Meeting statistics computed with the separate statements used before they were collapsed."""
+    scope_filter = _build_meeting_scope_filter(user_id, scope)
+    now = datetime.now(timezone.utc)
+    in_scope = [scope_filter, Meeting.is_deleted == False]
+    in_period = in_scope + ([Meeting.created_at >= start_date] if start_date else [])
+    meeting_ids = select(Meeting.id).where(*in_period).scalar_subquery()
+    count = db.exec(select(func.count(func.distinct(Meeting.id))).where(*in_period)).one()
+    bots = db.exec(select(func.count(func.distinct(MeetingBot.meeting_id))).where(MeetingBot.meeting_id.in_(meeting_ids), MeetingBot.status.in_(["joined", "recording", "complete", "ended"]))).one()
+    transcripts = db.exec(select(func.count(func.distinct(Transcript.meeting_id))).where(Transcript.meeting_id.in_(meeting_ids))).one()
+    upcoming = db.exec(select(func.count(Meeting.id)).where(*in_scope, Meeting.start_time > now, Meeting.status != MeetingStatus.cancelled)).one()
+    seconds = db.exec(select(func.sum(AudioFile.duration_seconds)).where(AudioFile.meeting_id.in_(meeting_ids), AudioFile.is_deleted == False)).one() or 0
+    totals = db.exec(select(func.count(Meeting.id), _sum_if(and_(Meeting.start_time > now, Meeting.start_time < now + timedelta(hours=24)))).where(*in_scope)).one()
+    day = func.date_trunc("day", Meeting.created_at)
+    chart_rows = db.exec(select(day, func.count(func.distinct(Meeting.id))).where(*in_period).group_by(day).order_by(day)).all()
+    minutes = int(seconds / 60)
+    return SimpleNamespace(
+        count=count,
+        minutes=(minutes, round(minutes / count, 1) if count else 0.0),
+        bots=(bots, round(bots / count * 100, 1) if count else 0.0),
+        transcripts=transcripts,
+        upcoming=upcoming,
+        totals=tuple(totals),
+        chart=_fill([(d, c, 0) for d, c in chart_rows], start_date),
+    )
+
+
+@pytest.fixture(autouse=True)
+def raw_queries(monkeypatch):
+    # Dashboards read the raw tables unless a test switches the rollups on
+    monkeypatch.setattr(statistics, "_rollups_ready", lambda: False)
+
+
+@pytest.fixture
+def history(db):
+    """A user with personal and project tasks and meetings spread around every period boundary."""
+    now = datetime.now(timezone.utc)
+    user = create_user(db)
+    teammate = create_user(db)
+    project = create_project(db, teammate, members=[user])
+
+    def ago(**delta):
+        return now - timedelta(**delta)
+
+    tasks = [
+        Task(title="Archived", creator_id=user.id, status="done", created_at=ago(days=200)),
+        Task(title="Just before 90d", creator_id=user.id, status="todo", due_date=ago(days=3), created_at=ago(days=90, seconds=1)),
+        Task(title="Just before 30d", creator_id=teammate.id, assignee_id=user.id, status="done", created_at=ago(days=30, seconds=1)),
+        Task(title="Just before 7d", creator_id=user.id, status="done", created_at=ago(days=7, seconds=1)),
+        Task(title="Just after 7d", creator_id=user.id, status="in_progress", due_date=now + timedelta(hours=2), created_at=ago(days=7) + timedelta(seconds=5)),
+        Task(title="Yesterday", creator_id=user.id, status="done", created_at=ago(days=1)),
+        Task(title="Today", creator_id=user.id, status="todo", due_date=now + timedelta(days=3), created_at=ago(minutes=1)),
+    ]
+    project_tasks = [
+        Task(title="Project, just before 7d", creator_id=teammate.id, status="done", created_at=ago(days=7, seconds=1)),
+        Task(title="Project, recent", creator_id=teammate.id, status="todo", due_date=ago(hours=5), created_at=ago(days=2)),
+    ]
+    db.add_all(tasks + project_tasks)
+
+    meetings = {
+        "ancient": Meeting(title="Ancient", created_by=user.id, is_personal=True, start_time=ago(days=150), created_at=ago(days=150)),
+        "edge_90": Meeting(title="Just before 90d", created_by=user.id, is_personal=True, start_time=ago(days=90), created_at=ago(days=90, seconds=1)),
+        "edge_30": Meeting(title="Just before 30d", created_by=user.id, is_personal=True, start_time=ago(days=30), created_at=ago(days=30, seconds=1)),
+        "edge_7": Meeting(title="Just before 7d", created_by=user.id, is_personal=True, start_time=ago(days=7), created_at=ago(days=7, seconds=1)),
+        "recorded": Meeting(title="Recorded", created_by=user.id, is_personal=True, start_time=ago(days=3), created_at=ago(days=3)),
+        "soon": Meeting(title="Soon", created_by=user.id, is_personal=True, start_time=now + timedelta(hours=2), created_at=ago(hours=1)),
+        "cancelled": Meeting(title="Cancelled", created_by=user.id, is_personal=True, status=MeetingStatus.cancelled, start_time=now + timedelta(days=2), created_at=ago(hours=3)),
+        "deleted": Meeting(title="Deleted", created_by=user.id, is_personal=True, is_deleted=True, created_at=ago(days=2)),
+        "project_edge_7": Meeting(title="Project, just before 7d", created_by=teammate.id, start_time=ago(days=7), created_at=ago(days=7, seconds=1)),
+        "project_next_week": Meeting(title="Project, next week", created_by=teammate.id, start_time=now + timedelta(days=6), created_at=ago(days=4)),
+    }
+    db.add_all(meetings.values())
+    db.flush()
+    db.add_all([TaskProject(task_id=task.id, project_id=project.id) for task in project_tasks])
+    db.add_all([ProjectMeeting(project_id=project.id, meeting_id=meetings[key].id) for key in ("project_edge_7", "project_next_week")])
+    db.add_all(
+        [
+            MeetingBot(meeting_id=meetings["recorded"].id, created_by=user.id, status="complete"),
+            MeetingBot(meeting_id=meetings["edge_7"].id, created_by=user.id, status="complete"),
+            MeetingBot(meeting_id=meetings["project_edge_7"].id, created_by=teammate.id, status="failed"),
+            Transcript(meeting_id=meetings["recorded"].id, content="Notes"),
+            Transcript(meeting_id=meetings["edge_30"].id, content="Notes"),
+            AudioFile(meeting_id=meetings["recorded"].id, uploaded_by=user.id, duration_seconds=1830),
+            AudioFile(meeting_id=meetings["edge_7"].id, uploaded_by=user.id, duration_seconds=600),
+            AudioFile(meeting_id=meetings["project_edge_7"].id, uploaded_by=teammate.id, duration_seconds=900, is_deleted=True),
+        ]
+    )
+    db.commit()
+    return user
+
+
+@pytest.mark.parametrize("scope", list(DashboardScope))
+@pytest.mark.parametrize("period", list(DashboardPeriod))
+def test_dashboard_matches_previous_statements(db, history, period, scope):
+    start_date = get_date_range(period)
+    stats = get_dashboard_stats(db, history.id, period, scope)
+    tasks = baseline_task_stats(db, history.id, start_date, scope)
+    meetings = baseline_meeting_stats(db, history.id, start_date, scope)
+
+    assert stats.tasks.total == tasks.total
+    assert (stats.tasks.status_breakdown.todo, stats.tasks.status_breakdown.in_progress, stats.tasks.status_breakdown.done) == tasks.breakdown
+    assert stats.tasks.overdue_count == tasks.overdue
+    assert stats.tasks.completion_rate == tasks.completion_rate
+    assert (stats.tasks.due_today, stats.tasks.due_this_week) == tasks.due
+    assert (stats.tasks.created_this_period, stats.tasks.completed_this_period) == tasks.period
+    assert stats.tasks.chart_data == tasks.chart
+
+    assert stats.meetings.total_count == meetings.count
+    assert (stats.meetings.total_duration_minutes, stats.meetings.average_duration_minutes) == meetings.minutes
+    assert (stats.meetings.bot_usage_count, stats.meetings.bot_usage_rate) == meetings.bots
+    assert stats.meetings.meetings_with_transcript == meetings.transcripts
+    assert stats.meetings.upcoming_count == meetings.upcoming
+    assert stats.meetings.chart_data == meetings.chart
+
+    assert (stats.summary.total_tasks, stats.summary.pending_tasks) == (tasks.total, tasks.pending)
+    assert (stats.summary.total_meetings, stats.summary.upcoming_meetings_24h) == meetings.totals
+
+
+def test_chart_excludes_rows_before_the_period_start_on_its_first_day(db, history):
+    stats = get_dashboard_stats(db, history.id, DashboardPeriod.SEVEN_DAYS, DashboardScope.PERSONAL)
+
+    # Only the task created just after the start falls into the first bucket, matching created_this_period
+    assert stats.tasks.chart_data[0].count == 1
+    assert sum(point.count for point in stats.tasks.chart_data) == stats.tasks.created_this_period
+    assert sum(point.count for point in stats.meetings.chart_data) == stats.meetings.total_count
+
+
+ROLLUP_CASES = [(period, scope) for period in (DashboardPeriod.NINETY_DAYS, DashboardPeriod.ALL_TIME) for scope in (DashboardScope.PERSONAL, DashboardScope.HYBRID)]
+
+
+def charts(db, user_id, period, scope, monkeypatch, rollups: bool):
+    monkeypatch.setattr(statistics, "_rollups_ready", lambda: rollups)
+    stats = get_dashboard_stats(db, user_id, period, scope)
+    return stats.tasks.chart_data, stats.meetings.chart_data
+
+
+@pytest.mark.parametrize("period, scope", ROLLUP_CASES)
+def test_rollup_charts_match_raw_queries(db, history, period, scope, monkeypatch):
+    crud_refresh_user_daily_stats(db)
+
+    assert charts(db, history.id, period, scope, monkeypatch, rollups=True) == charts(db, history.id, period, scope, monkeypatch, rollups=False)
+
+
+@pytest.mark.parametrize("period, scope", ROLLUP_CASES)
+def test_incremental_refresh_keeps_rollups_in_step(db, history, period, scope, monkeypatch):
+    crud_refresh_user_daily_stats(db)
+    since = datetime.now(timezone.utc) - timedelta(minutes=5)
+    for task in db.exec(select(Task).where(Task.creator_id == history.id, Task.status != "done")).all():
+        task.status = "done"
+    old_meeting = db.exec(select(Meeting).where(Meeting.created_by == history.id, Meeting.title == "Ancient")).one()
+    old_meeting.is_deleted = True
+    db.commit()
+
+    crud_refresh_user_daily_stats(db, since)
+
+    assert charts(db, history.id, period, scope, monkeypatch, rollups=True) == charts(db, history.id, period, scope, monkeypatch, rollups=False)
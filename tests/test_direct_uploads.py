@@ -0,0 +1,143 @@
+import time
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+
+import app.services.upload as upload
+from app.crud.file import crud_check_file_access, crud_create_file, crud_get_file, crud_get_files
+from app.crud.meeting import crud_get_meeting_audio_files
+from app.crud.search import crud_search_dynamic
+from app.schemas.file import FileCreate
+from app.services.event_manager import EventManager
+from tests.factories import create_meeting, create_user
+
+pytestmark = pytest.mark.integration
+
+
+@pytest.fixture
+def storage(monkeypatch):
+    """Objects the client uploaded, keyed by object name."""
+    objects = {}
+    monkeypatch.setattr(upload, "generate_presigned_upload_url", lambda bucket, name, expires: f"http://minio/{name}?upload")
+    monkeypatch.setattr(upload, "generate_presigned_url", lambda bucket, name: f"http://minio/{name}")
+    monkeypatch.setattr(upload, "stat_object_in_minio", lambda bucket, name: SimpleNamespace(size=len(objects[name])) if name in objects else None)
+    monkeypatch.setattr(upload, "read_object_head", lambda bucket, name, length=16: objects[name][:length])
+    monkeypatch.setattr(upload, "delete_file_from_minio", lambda bucket, name: objects.pop(name, None) is not None)
+    monkeypatch.setattr(EventManager, "emit_domain_event", lambda event: None)
+    return objects
+
+
+@pytest.fixture
+def slots(redis):
+    slot_ids = []
+    yield slot_ids
+    for slot_id in slot_ids:
+        upload._close_slot(slot_id)
+
+
+def expire(redis, slot_id):
+    redis.zadd(upload.PENDING_UPLOADS_KEY, {slot_id: time.time() - 1})
+
+
+def test_server_side_file_without_storage_url_stays_visible(db, redis):
+    owner = create_user(db)
+    # Created by crud_create_file directly, as create_file does when storage fails
+    file = crud_create_file(db, filename="minutes-unstored.pdf", uploaded_by=owner.id)
+
+    files, total = crud_get_files(db, user_id=owner.id)
+    results, _ = crud_search_dynamic(db, "minutes-unstored", owner.id)
+
+    assert [f.id for f in files] == [file.id] and total == 1
+    assert [r["id"] for r in results] == [str(file.id)]
+    assert crud_check_file_access(db, file, owner.id)
+
+
+def test_pending_direct_upload_is_hidden_until_completed(db, redis, storage, slots):
+    owner = create_user(db)
+    file, _ = upload.create_file_upload_slot(db, FileCreate(filename="minutes-direct.pdf", mime_type="application/pdf"), owner.id)
+    slots.append(f"file:{file.id}")
+
+    assert crud_get_files(db, user_id=owner.id) == ([], 0)
+    assert crud_search_dynamic(db, "minutes-direct", owner.id) == ([], 0)
+    assert not crud_check_file_access(db, file, owner.id)
+
+    storage[str(file.id)] = b"%PDF-1.7 minutes"
+    completed = upload.complete_file_upload(db, file.id, owner.id)
+
+    assert completed.upload_expires_at is None
+    assert completed.size_bytes == len(storage[str(file.id)])
+    assert [f.id for f in crud_get_files(db, user_id=owner.id)[0]] == [file.id]
+    assert crud_check_file_access(db, completed, owner.id)
+
+
+def test_cleanup_removes_expired_pending_file(db, redis, storage, slots):
+    owner = create_user(db)
+    file, _ = upload.create_file_upload_slot(db, FileCreate(filename="abandoned.pdf", mime_type="application/pdf"), owner.id)
+    file_id = file.id
+    slots.append(f"file:{file_id}")
+    storage[str(file_id)] = b"%PDF-1.7 partial"
+    expire(redis, f"file:{file_id}")
+
+    assert upload.cleanup_expired_upload_slots(db) == 1
+
+    assert crud_get_file(db, file_id) is None
+    assert str(file_id) not in storage
+    # A completion arriving after cleanup finds nothing to complete
+    with pytest.raises(HTTPException) as error:
+        upload.complete_file_upload(db, file_id, owner.id)
+    assert error.value.status_code == 404
+
+
+def test_cleanup_keeps_upload_completed_after_its_scan(db, redis, storage, slots, monkeypatch):
+    owner = create_user(db)
+    file, _ = upload.create_file_upload_slot(db, FileCreate(filename="late.pdf", mime_type="application/pdf"), owner.id)
+    slot_id = f"file:{file.id}"
+    slots.append(slot_id)
+    storage[str(file.id)] = b"%PDF-1.7 late"
+    expire(redis, slot_id)
+
+    # The client completes between cleanup listing the expired slot and acting on it
+    scan = upload.redis_client.zrangebyscore
+
+    def scan_then_complete(*args):
+        expired = scan(*args)
+        upload.complete_file_upload(db, file.id, owner.id)
+        return expired
+
+    monkeypatch.setattr(upload.redis_client, "zrangebyscore", scan_then_complete)
+
+    assert upload.cleanup_expired_upload_slots(db) == 0
+
+    db.expire_all()
+    kept = crud_get_file(db, file.id)
+    assert kept is not None and kept.upload_expires_at is None
+    assert str(file.id) in storage
+
+
+def test_cleanup_keeps_audio_completed_after_its_scan(db, redis, storage, slots, monkeypatch):
+    owner = create_user(db)
+    meeting = create_meeting(db, owner)
+    audio, _ = upload.create_audio_upload_slot(db, meeting.id, owner.id, "recording.wav", "audio/wav", 1024 * 1024)
+    slot_id = f"audio:{audio.id}"
+    slots.append(slot_id)
+    object_name = f"meetings/{meeting.id}/audio/{audio.id}.wav"
+    storage[object_name] = b"RIFF\x00\x00\x00\x00WAVEfmt "
+    assert crud_get_meeting_audio_files(db, meeting.id) == ([], 0)
+    expire(redis, slot_id)
+
+    scan = upload.redis_client.zrangebyscore
+
+    def scan_then_complete(*args):
+        expired = scan(*args)
+        upload.complete_audio_upload(db, meeting.id, audio.id, owner.id)
+        return expired
+
+    monkeypatch.setattr(upload.redis_client, "zrangebyscore", scan_then_complete)
+
+    assert upload.cleanup_expired_upload_slots(db) == 0
+
+    db.expire_all()
+    rows, total = crud_get_meeting_audio_files(db, meeting.id)
+    assert [row.id for row in rows] == [audio.id] and total == 1
+    assert object_name in storage
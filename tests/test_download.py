@@ -0,0 +1,133 @@
+import os
+
+import pytest
+from fastapi import FastAPI, HTTPException
+from fastapi.testclient import TestClient
+
+import app.utils.minio as minio_utils
+from app.core.config import settings
+from app.db import get_db
+from app.main import _parse_byte_range, download_file
+from tests.storage import StoredMinio
+
+pytestmark = pytest.mark.integration
+
+BODY = os.urandom(1000)
+OBJECT_NAME = f"{settings.MINIO_BUCKET_NAME}/report.pdf"
+
+
+@pytest.fixture
+def storage(monkeypatch):
+    client = StoredMinio()
+    client.add(settings.MINIO_BUCKET_NAME, "report.pdf", BODY, "application/pdf")
+    monkeypatch.setattr(minio_utils, "get_minio_client", lambda: client)
+    return client
+
+
+@pytest.fixture
+def client(db, storage):
+    app = FastAPI()
+    app.add_api_route("/download", download_file)
+    app.dependency_overrides[get_db] = lambda: db
+    return TestClient(app)
+
+
+def download(client, **headers):
+    return client.get("/download", params={"object_name": OBJECT_NAME}, headers=headers)
+
+
+@pytest.mark.parametrize(
+    "header, expected",
+    [
+        ("bytes=0-99", (0, 99)),
+        ("bytes=900-", (900, 999)),
+        ("bytes=900-5000", (900, 999)),
+        ("bytes=-100", (900, 999)),
+        ("bytes=-5000", (0, 999)),
+        ("bytes=5-4", None),
+        ("bytes=0-1,5-6", None),
+        ("items=0-1", None),
+        ("bytes=a-b", None),
+    ],
+)
+def test_parse_byte_range(header, expected):
+    assert _parse_byte_range(header, 1000) == expected
+
+
+@pytest.mark.parametrize("header", ["bytes=1000-", "bytes=5000-6000", "bytes=-0"])
+def test_parse_byte_range_outside_object(header):
+    with pytest.raises(HTTPException) as error:
+        _parse_byte_range(header, 1000)
+    assert error.value.status_code == 416
+    assert error.value.headers == {"Content-Range": "bytes */1000"}
+
+
+def test_full_download(client, storage):
+    response = download(client)
+
+    assert response.status_code == 200
+    assert response.content == BODY
+    assert response.headers["accept-ranges"] == "bytes"
+    assert response.headers["content-length"] == "1000"
+    assert response.headers["content-type"] == "application/pdf"
+    assert storage.gets == [("report.pdf", 0, 0)]
+
+
+def test_range_is_served_as_partial_content(client, storage):
+    response = download(client, Range="bytes=100-199")
+
+    assert response.status_code == 206
+    assert response.content == BODY[100:200]
+    assert response.headers["content-range"] == "bytes 100-199/1000"
+    assert response.headers["content-length"] == "100"
+    # Only the requested bytes are fetched from storage
+    assert storage.gets == [("report.pdf", 100, 100)]
+
+
+def test_suffix_range_serves_the_tail(client):
+    response = download(client, Range="bytes=-10")
+
+    assert response.status_code == 206
+    assert response.content == BODY[-10:]
+    assert response.headers["content-range"] == "bytes 990-999/1000"
+
+
+def test_unsatisfiable_range(client, storage):
+    response = download(client, Range="bytes=1000-")
+
+    assert response.status_code == 416
+    assert response.headers["content-range"] == "bytes */1000"
+    assert storage.gets == []
+
+
+def test_matching_etag_is_not_modified(client, storage):
+    etag = download(client).headers["etag"]
+    storage.gets.clear()
+
+    for if_none_match in (etag, f"W/{etag}", f'"other", {etag}', "*"):
+        response = download(client, **{"If-None-Match": if_none_match})
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+    assert storage.gets == []
+
+    assert download(client, **{"If-None-Match": '"other"'}).status_code == 200
+
+
+def test_if_range_mismatch_serves_the_whole_object(client):
+    etag = download(client).headers["etag"]
+
+    stale = download(client, Range="bytes=0-9", **{"If-Range": '"stale"'})
+    current = download(client, Range="bytes=0-9", **{"If-Range": etag})
+
+    assert stale.status_code == 200
+    assert stale.content == BODY
+    assert "content-range" not in stale.headers
+    assert current.status_code == 206
+    assert current.content == BODY[:10]
+
+
+def test_missing_object(client):
+    response = client.get("/download", params={"object_name": f"{settings.MINIO_BUCKET_NAME}/missing.pdf"})
+
+    assert response.status_code == 404
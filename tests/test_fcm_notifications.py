@@ -0,0 +1,83 @@
+import uuid
+from types import SimpleNamespace
+
+import pytest
+from firebase_admin import messaging
+
+from app.db import SessionLocal
+from app.models.user import User, UserDevice
+from app.services.notification import send_fcm_notification
+
+pytestmark = pytest.mark.integration
+
+
+@pytest.fixture
+def device_owner(db_engine):
+    # Committed for real: the deactivation runs in its own session and must be visible from a fresh one
+    db = SessionLocal()
+    user = User(email=f"{uuid.uuid4().hex}@example.com")
+    db.add(user)
+    db.flush()
+    db.add_all(
+        [
+            UserDevice(user_id=user.id, fcm_token=f"live-{user.id}"),
+            UserDevice(user_id=user.id, fcm_token=f"dead-{user.id}"),
+        ]
+    )
+    db.commit()
+    user_id = user.id
+    db.close()
+    yield user_id
+    db = SessionLocal()
+    db.query(UserDevice).filter(UserDevice.user_id == user_id).delete()
+    db.query(User).filter(User.id == user_id).delete()
+    db.commit()
+    db.close()
+
+
+@pytest.fixture
+def fcm(monkeypatch):
+    sent = []
+
+    def send_each_for_multicast(message):
+        sent.append(list(message.tokens))
+        return SimpleNamespace(
+            responses=[
+                SimpleNamespace(success=False, exception=messaging.UnregisteredError("Requested entity was not found."))
+                if token.startswith("dead-")
+                else SimpleNamespace(success=True, exception=None)
+                for token in message.tokens
+            ]
+        )
+
+    monkeypatch.setattr(messaging, "send_each_for_multicast", send_each_for_multicast)
+    return sent
+
+
+def active_tokens(user_id):
+    db = SessionLocal()
+    try:
+        return {device.fcm_token: device.is_active for device in db.query(UserDevice).filter(UserDevice.user_id == user_id)}
+    finally:
+        db.close()
+
+
+def test_unregistered_token_is_deactivated_with_caller_session(device_owner, fcm):
+    caller = SessionLocal()
+    try:
+        send_fcm_notification([device_owner], "Task assigned", "You have a new task", db=caller)
+    finally:
+        # Callers such as the notification listener close their session without committing
+        caller.close()
+
+    assert sorted(fcm[0]) == [f"dead-{device_owner}", f"live-{device_owner}"]
+    assert active_tokens(device_owner) == {f"live-{device_owner}": True, f"dead-{device_owner}": False}
+
+
+def test_unregistered_token_is_deactivated_without_session(device_owner, fcm):
+    send_fcm_notification([device_owner], "Task assigned", "You have a new task")
+
+    assert active_tokens(device_owner) == {f"live-{device_owner}": True, f"dead-{device_owner}": False}
+    # The dead token is no longer looked up on the next send
+    send_fcm_notification([device_owner], "Task assigned", "Another task")
+    assert fcm[-1] == [f"live-{device_owner}"]
@@ -0,0 +1,92 @@
+import io
+import threading
+
+import pytest
+
+import app.utils.minio as minio_utils
+from app.utils.minio import ensure_bucket, upload_bytes_to_minio, upload_stream_to_minio
+from tests.storage import CountingMinio
+
+
+@pytest.fixture(autouse=True)
+def known_buckets(monkeypatch):
+    monkeypatch.setattr(minio_utils, "_known_buckets", set())
+
+
+@pytest.fixture
+def storage(monkeypatch):
+    client = CountingMinio()
+    monkeypatch.setattr(minio_utils, "get_minio_client", lambda: client)
+    return client
+
+
+def test_bucket_is_checked_once_per_process(storage):
+    storage.buckets.add("files")
+
+    for index in range(5):
+        assert upload_bytes_to_minio(b"data", "files", f"object-{index}")
+
+    assert storage.calls == ["bucket_exists"] + ["put_object"] * 5
+
+
+def test_missing_bucket_is_created_once(storage):
+    for index in range(3):
+        assert upload_bytes_to_minio(b"data", "files", f"object-{index}")
+
+    assert storage.calls == ["bucket_exists", "make_bucket"] + ["put_object"] * 3
+
+
+def test_concurrent_first_uploads_check_the_bucket_once(storage):
+    storage.buckets.add("files")
+    start = threading.Barrier(8)
+
+    def check():
+        start.wait()
+        ensure_bucket(storage, "files")
+
+    threads = [threading.Thread(target=check) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert storage.calls == ["bucket_exists"]
+
+
+def test_bucket_deleted_after_it_was_seen_is_recreated(storage):
+    assert upload_bytes_to_minio(b"data", "files", "before")
+    storage.buckets.clear()
+    storage.calls.clear()
+
+    assert upload_bytes_to_minio(b"data", "files", "after")
+    assert upload_bytes_to_minio(b"data", "files", "later")
+
+    assert storage.calls == ["put_object", "bucket_exists", "make_bucket", "put_object", "put_object"]
+
+
+def test_bucket_that_cannot_be_recreated_fails_after_one_retry(storage, monkeypatch):
+    assert upload_bytes_to_minio(b"data", "files", "before")
+    storage.buckets.clear()
+    storage.calls.clear()
+
+    def bucket_exists(bucket_name):
+        # The bucket is reported present but writes still fail, e.g. while it is being deleted
+        storage.calls.append("bucket_exists")
+        return True
+
+    monkeypatch.setattr(storage, "bucket_exists", bucket_exists)
+
+    assert upload_bytes_to_minio(b"data", "files", "after") is False
+    assert storage.calls == ["put_object", "bucket_exists", "put_object"]
+
+
+def test_streamed_upload_to_deleted_bucket_recreates_it_on_the_next_upload(storage):
+    assert upload_bytes_to_minio(b"data", "files", "before")
+    storage.buckets.clear()
+    storage.calls.clear()
+
+    # A partly consumed stream cannot be replayed, so this upload fails and only forgets the bucket
+    assert upload_stream_to_minio(io.BytesIO(b"data"), "files", "streamed") is None
+    assert upload_bytes_to_minio(b"data", "files", "after")
+
+    assert storage.calls == ["put_object", "bucket_exists", "make_bucket", "put_object"]
@@ -0,0 +1,51 @@
+import os
+import tracemalloc
+from types import SimpleNamespace
+
+import pytest
+
+import app.utils.minio as minio_utils
+from app.utils.minio import DOWNLOAD_CHUNK_SIZE, download_file_to_temp_from_minio
+from tests.storage import LargeObjectMinio
+
+pytestmark = pytest.mark.slow
+
+MB = 1024 * 1024
+
+
+@pytest.fixture
+def storage(monkeypatch):
+    client = LargeObjectMinio(64 * MB + 123)
+    monkeypatch.setattr(minio_utils, "get_minio_client", lambda: client)
+    return client
+
+
+def test_download_to_temp_memory_is_bounded_by_chunk_size(storage):
+    tracemalloc.start()
+    try:
+        path = download_file_to_temp_from_minio("audio-files", "recording.wav", suffix=".wav")
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    try:
+        assert path.endswith(".wav")
+        assert os.path.getsize(path) == storage.size
+        with open(path, "rb") as file:
+            assert file.read(len(storage.fill) * 4) == storage.fill * 4
+        # A few chunks at most, rather than the whole 64 MB object
+        assert peak < 4 * DOWNLOAD_CHUNK_SIZE
+        assert [response.closed for response in storage.responses] == [True]
+    finally:
+        os.unlink(path)
+
+
+def test_failed_download_removes_temp_file(monkeypatch, tmp_path):
+    def get_object(**kwargs):
+        raise RuntimeError("connection reset")
+
+    monkeypatch.setattr(minio_utils, "get_minio_client", lambda: SimpleNamespace(get_object=get_object))
+    monkeypatch.setattr(minio_utils.tempfile, "tempdir", str(tmp_path))
+
+    assert download_file_to_temp_from_minio("audio-files", "recording.wav") is None
+    assert os.listdir(tmp_path) == []
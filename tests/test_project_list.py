@@ -0,0 +1,83 @@
+import uuid
+from contextlib import contextmanager
+
+import pytest
+from sqlalchemy import event, insert
+
+from app.api.endpoints.project import get_projects_endpoint
+from app.models.project import UserProject
+from app.models.user import User
+from tests.factories import create_project, create_user
+
+pytestmark = [pytest.mark.integration, pytest.mark.slow]
+
+
+@contextmanager
+def count_statements(db):
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    connection = db.connection()
+    event.listen(connection, "before_cursor_execute", record)
+    try:
+        yield statements
+    finally:
+        event.remove(connection, "before_cursor_execute", record)
+
+
+@contextmanager
+def count_loaded(model):
+    loaded = []
+
+    def record(target, context):
+        loaded.append(target)
+
+    event.listen(model, "load", record)
+    try:
+        yield loaded
+    finally:
+        event.remove(model, "load", record)
+
+
+def add_members(db, project, count: int):
+    user_ids = [uuid.uuid4() for _ in range(count)]
+    db.execute(insert(User), [{"id": user_id, "email": f"{user_id.hex}@example.com"} for user_id in user_ids])
+    db.execute(insert(UserProject), [{"user_id": user_id, "project_id": project.id, "role": "member"} for user_id in user_ids])
+    db.commit()
+
+
+def list_projects(db, user):
+    db.expire_all()
+    with count_statements(db) as statements, count_loaded(UserProject) as memberships:
+        response = get_projects_endpoint(
+            db=db,
+            current_user=user,
+            page=1,
+            limit=20,
+            order_by="created_at",
+            dir="desc",
+            name=None,
+            is_archived=None,
+            created_by=None,
+            created_at_gte=None,
+            created_at_lte=None,
+        )
+    # Members are counted in the database rather than loaded row by row
+    assert memberships == []
+    return {project.id: project.member_count for project in response.data}, len(statements)
+
+
+def test_list_query_count_does_not_grow_with_members(db):
+    owner = create_user(db)
+    projects = [create_project(db, owner, name=f"Project {index}") for index in range(3)]
+
+    small_counts, small_queries = list_projects(db, owner)
+    for project in projects:
+        add_members(db, project, 2000)
+    large_counts, large_queries = list_projects(db, owner)
+
+    assert small_counts == {project.id: 1 for project in projects}
+    assert large_counts == {project.id: 2001 for project in projects}
+    assert large_queries == small_queries
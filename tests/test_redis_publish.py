@@ -0,0 +1,87 @@
+import asyncio
+import json
+import time
+import uuid
+
+import pytest
+from redis.asyncio.client import Pipeline
+
+from app.utils.redis import get_user_stream_key, publish_to_user_channel, publish_to_user_channels
+
+pytestmark = pytest.mark.integration
+
+MESSAGE = {"type": "project_updated", "project_id": "p-1"}
+
+
+@pytest.fixture
+def audience(redis):
+    user_ids = [uuid.uuid4() for _ in range(250)]
+    yield user_ids
+    redis.delete(*(get_user_stream_key(str(user_id)) for user_id in user_ids))
+
+
+@pytest.fixture
+def round_trips(monkeypatch):
+    """Sizes of the pipelines sent to Redis, one entry per round trip."""
+    sizes = []
+    execute = Pipeline.execute
+
+    async def counted_execute(self, *args, **kwargs):
+        sizes.append(len(self.command_stack))
+        return await execute(self, *args, **kwargs)
+
+    monkeypatch.setattr(Pipeline, "execute", counted_execute)
+    return sizes
+
+
+def stream_entries(redis, user_id):
+    return [fields for _, fields in redis.xrange(get_user_stream_key(str(user_id)))]
+
+
+def test_messages_reach_every_channel_and_stream(redis, audience):
+    watched = [audience[0], audience[99], audience[100], audience[-1]]
+    pubsub = redis.pubsub()
+    pubsub.subscribe(*(f"user:{user_id}:project_updated" for user_id in watched))
+    while pubsub.get_message(timeout=1):
+        pass  # subscription confirmations
+
+    assert asyncio.run(publish_to_user_channels(audience, MESSAGE, shard_size=100)) == len(audience)
+
+    received = {}
+    while len(received) < len(watched):
+        message = pubsub.get_message(timeout=5)
+        assert message is not None, f"missing publishes for {set(map(str, watched)) - set(received)}"
+        received[message["channel"].split(":")[1]] = json.loads(message["data"])
+    pubsub.close()
+
+    for user_id in audience:
+        assert stream_entries(redis, user_id) == [{"channel": f"user:{user_id}:project_updated", "data": json.dumps(MESSAGE)}]
+    for user_id in watched:
+        # The published copy carries the id of the stream entry clients replay from
+        [(stream_id, _)] = redis.xrange(get_user_stream_key(str(user_id)))
+        assert received[str(user_id)] == {**MESSAGE, "stream_id": stream_id}
+
+
+def test_round_trips_are_per_shard_not_per_user(redis, audience, round_trips):
+    asyncio.run(publish_to_user_channels(audience, MESSAGE, shard_size=100))
+
+    # Two pipelines per shard: stream appends with their expiries, then publishes
+    assert sorted(round_trips) == sorted([200, 200, 100, 100, 100, 50])
+
+
+@pytest.mark.slow
+def test_batched_publish_is_faster_than_one_round_trip_per_user(redis, audience):
+    async def one_by_one():
+        for user_id in audience:
+            await publish_to_user_channel(str(user_id), MESSAGE)
+
+    started = time.perf_counter()
+    asyncio.run(one_by_one())
+    sequential = time.perf_counter() - started
+
+    started = time.perf_counter()
+    asyncio.run(publish_to_user_channels(audience, MESSAGE))
+    batched = time.perf_counter() - started
+
+    assert all(len(stream_entries(redis, user_id)) == 2 for user_id in audience)
+    assert batched < sequential
@@ -0,0 +1,97 @@
+import os
+import tracemalloc
+from types import SimpleNamespace
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+import app.api.endpoints.file as file_endpoint
+import app.api.endpoints.meeting as meeting_endpoint
+import app.services.file as file_service
+import app.services.meeting as meeting_service
+import app.utils.minio as minio_utils
+from app.core.config import settings
+from app.db import get_db
+from app.services.event_manager import EventManager
+from app.utils.auth import get_current_user
+from tests.factories import create_meeting, create_user
+from tests.storage import RecordingMinio
+
+pytestmark = [pytest.mark.integration, pytest.mark.slow]
+
+MB = 1024 * 1024
+UPLOAD_SIZE = 24 * MB
+
+
+@pytest.fixture
+def storage(monkeypatch):
+    client = RecordingMinio()
+    monkeypatch.setattr(minio_utils, "get_minio_client", lambda: client)
+    monkeypatch.setattr(settings, "MINIO_UPLOAD_PART_SIZE_MB", 1)
+    return client
+
+
+@pytest.fixture
+def streaming_peaks(monkeypatch):
+    """Peak memory allocated while each upload streamed to storage, in bytes."""
+    peaks = []
+
+    def profiled(upload):
+        def upload_stream_to_minio(*args, **kwargs):
+            # The request body is already spooled to disk here; only the copy into storage is measured
+            baseline, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            try:
+                return upload(*args, **kwargs)
+            finally:
+                peaks.append(tracemalloc.get_traced_memory()[1] - baseline)
+
+        return upload_stream_to_minio
+
+    monkeypatch.setattr(file_service, "upload_stream_to_minio", profiled(file_service.upload_stream_to_minio))
+    monkeypatch.setattr(meeting_service, "upload_stream_to_minio", profiled(meeting_service.upload_stream_to_minio))
+    tracemalloc.start()
+    yield peaks
+    tracemalloc.stop()
+
+
+@pytest.fixture
+def client(db, monkeypatch):
+    owner = create_user(db)
+    monkeypatch.setattr(EventManager, "emit_domain_event", lambda event: None)
+    monkeypatch.setattr(file_endpoint.index_file_task, "delay", lambda *args: None)
+    monkeypatch.setattr(meeting_endpoint.process_audio_task, "delay", lambda *args: SimpleNamespace(id="task-id"))
+    app = FastAPI()
+    app.include_router(file_endpoint.router)
+    app.include_router(meeting_endpoint.router)
+    app.dependency_overrides[get_db] = lambda: db
+    app.dependency_overrides[get_current_user] = lambda: owner
+    return SimpleNamespace(http=TestClient(app), owner=owner)
+
+
+def test_file_upload_memory_is_bounded_by_part_size(client, storage, streaming_peaks):
+    body = b"%PDF-1.7\n" + os.urandom(UPLOAD_SIZE - 9)
+
+    response = client.http.post(f"{settings.API_V1_STR}/files/upload", files={"file": ("minutes.pdf", body, "application/pdf")})
+
+    assert response.status_code == 200, response.text
+    file_id = response.json()["data"]["id"]
+    assert response.json()["data"]["size_bytes"] == UPLOAD_SIZE
+    assert storage.objects == {(settings.MINIO_BUCKET_NAME, file_id): UPLOAD_SIZE}
+    assert max(storage.reads) <= MB
+    # A few parts in flight at most, rather than the whole 24 MB body
+    assert streaming_peaks[0] < 4 * MB
+
+
+def test_meeting_audio_upload_memory_is_bounded_by_part_size(db, client, storage, streaming_peaks):
+    meeting = create_meeting(db, client.owner)
+    body = b"RIFF" + os.urandom(UPLOAD_SIZE - 4)
+
+    response = client.http.post(f"{settings.API_V1_STR}/meetings/{meeting.id}/audio-files", files={"file": ("recording.wav", body, "audio/wav")})
+
+    assert response.status_code == 200, response.text
+    audio_id = response.json()["data"]["audio_file_id"]
+    assert storage.objects == {(settings.MINIO_BUCKET_NAME, f"meetings/{meeting.id}/audio/{audio_id}.wav"): UPLOAD_SIZE}
+    assert max(storage.reads) <= MB
+    assert streaming_peaks[0] < 4 * MB
@@ -0,0 +1,111 @@
+import pytest
+
+from app.crud.transcript import crud_get_transcripts
+from app.models.meeting import Transcript
+from tests.factories import create_meeting, create_project, create_user
+
+pytestmark = pytest.mark.integration
+
+
+def create_transcript(db, meeting, content=None, extracted_text=None) -> Transcript:
+    transcript = Transcript(meeting_id=meeting.id, content=content, extracted_text_for_search=extracted_text)
+    db.add(transcript)
+    db.commit()
+    return transcript
+
+
+def search(db, user, term, **kwargs):
+    rows, total = crud_get_transcripts(db, user.id, content_search=term, **kwargs)
+    return [transcript.id for transcript, _ in rows], total
+
+
+@pytest.fixture
+def owner(db):
+    return create_user(db, name="Owner")
+
+
+def test_matches_websearch_syntax(db, owner):
+    review = create_transcript(db, create_meeting(db, owner), "The budget review covered hiring")
+    finance = create_transcript(db, create_meeting(db, owner), "The budget review with the finance team")
+    create_transcript(db, create_meeting(db, owner), "A review of the roadmap")
+
+    assert set(search(db, owner, "budget review")[0]) == {review.id, finance.id}
+    assert search(db, owner, '"budget review" -finance')[0] == [review.id]
+    assert set(search(db, owner, "hiring or finance")[0]) == {review.id, finance.id}
+    assert search(db, owner, "forecast") == ([], 0)
+
+
+def test_matches_extracted_search_text(db, owner):
+    transcript = create_transcript(db, create_meeting(db, owner), content=None, extracted_text="Kickoff notes about onboarding")
+
+    assert search(db, owner, "onboarding") == ([transcript.id], 1)
+
+
+def test_ranks_denser_matches_first(db, owner):
+    sparse = create_transcript(db, create_meeting(db, owner), "We talked about the budget once and then moved on to other topics entirely")
+    dense = create_transcript(db, create_meeting(db, owner), "Budget first: the budget owner presented the budget")
+
+    ids, total = search(db, owner, "budget")
+
+    assert ids == [dense.id, sparse.id]
+    assert total == 2
+
+
+def test_pages_ranked_results(db, owner):
+    transcripts = [create_transcript(db, create_meeting(db, owner), " ".join(["budget"] * count + ["filler"] * 10)) for count in (1, 3, 2)]
+
+    first_page, total = search(db, owner, "budget", page=1, limit=2)
+    second_page, _ = search(db, owner, "budget", page=2, limit=2)
+
+    assert total == 3
+    assert first_page == [transcripts[1].id, transcripts[2].id]
+    assert second_page == [transcripts[0].id]
+
+
+def test_returns_highlighted_snippet(db, owner):
+    create_transcript(db, create_meeting(db, owner), "Opening remarks. " + "Filler sentence without the term. " * 40 + "The budget was approved after a long discussion.")
+
+    rows, _ = crud_get_transcripts(db, owner.id, content_search="budget")
+    snippet = rows[0][1]
+
+    assert "<b>budget</b>" in snippet
+    assert len(snippet) < 400
+
+
+def test_listing_without_search_has_no_snippet(db, owner):
+    create_transcript(db, create_meeting(db, owner), "The budget review")
+
+    rows, total = crud_get_transcripts(db, owner.id)
+
+    assert total == 1
+    assert rows[0][1] is None
+
+
+def test_only_returns_accessible_meetings(db, owner):
+    member = create_user(db)
+    outsider = create_user(db)
+    project = create_project(db, owner, members=[member])
+    personal = create_transcript(db, create_meeting(db, owner), "Personal budget notes")
+    shared = create_transcript(db, create_meeting(db, owner, project=project), "Project budget notes")
+    private = create_transcript(db, create_meeting(db, outsider), "Someone else's personal budget notes")
+
+    assert set(search(db, owner, "budget")[0]) == {personal.id, shared.id}
+    # Another user's personal meetings stay private even though they are personal
+    assert search(db, member, "budget")[0] == [shared.id]
+    assert search(db, outsider, "budget")[0] == [private.id]
+
+
+def test_non_personal_meeting_without_membership_is_hidden(db, owner):
+    other = create_user(db)
+    unlinked = create_meeting(db, other, is_personal=False)
+    create_transcript(db, unlinked, "Budget notes")
+
+    assert search(db, owner, "budget") == ([], 0)
+
+
+def test_filters_by_meeting(db, owner):
+    meeting = create_meeting(db, owner)
+    transcript = create_transcript(db, meeting, "Budget notes")
+    create_transcript(db, create_meeting(db, owner), "More budget notes")
+
+    assert search(db, owner, "budget", meeting_id=meeting.id) == ([transcript.id], 1)
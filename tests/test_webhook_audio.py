@@ -0,0 +1,171 @@
+import os
+import threading
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+import app.api.endpoints.webhook as webhook_endpoint
+import app.jobs.tasks as tasks
+import app.utils.minio as minio_utils
+from app.core.config import settings
+from app.db import get_db
+from app.models.meeting import AudioFile
+from app.utils.auth import get_current_user
+from app.utils.http import open_url_stream
+from app.utils.idempotency import claim_idempotency_key
+from tests.factories import create_meeting, create_user
+from tests.storage import RecordingMinio
+
+pytestmark = pytest.mark.integration
+
+MB = 1024 * 1024
+
+
+class AudioServer:
+    """Local stand-in for a remote recording host, serving fixed bodies by path."""
+
+    def __init__(self):
+        self.files = {}
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                body = server.files.get(self.path)
+                if body is None:
+                    self.send_error(404)
+                    return
+                self.send_response(200)
+                self.send_header("Content-Type", "audio/wav")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+
+    def serve(self, path: str, body: bytes) -> str:
+        self.files[path] = body
+        return f"http://127.0.0.1:{self._httpd.server_port}{path}"
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+
+def wav_body(size: int) -> bytes:
+    return b"RIFF" + os.urandom(size - 4)
+
+
+@pytest.fixture
+def audio_server():
+    with AudioServer() as server:
+        yield server
+
+
+@pytest.fixture
+def storage(monkeypatch):
+    client = RecordingMinio()
+    monkeypatch.setattr(minio_utils, "get_minio_client", lambda: client)
+    monkeypatch.setattr(settings, "MINIO_UPLOAD_PART_SIZE_MB", 1)
+    return client
+
+
+@pytest.fixture
+def owner(db):
+    return create_user(db)
+
+
+@pytest.fixture
+def task_db(db, monkeypatch):
+    # The task opens its own session; hand it the test session so its writes are rolled back too
+    monkeypatch.setattr(tasks, "SessionLocal", lambda: db)
+    return db
+
+
+def run_ingest(meeting_id, user_id, url, key=None):
+    # The task closes its session when done, which detaches the test's objects, so it is given plain ids
+    return tasks.ingest_remote_audio_task.apply(args=[str(meeting_id), str(user_id), url, key]).get()
+
+
+def test_streams_remote_audio_into_storage(task_db, redis, audio_server, storage, owner):
+    meeting_id = create_meeting(task_db, owner).id
+    body = wav_body(3 * MB + 123)
+    url = audio_server.serve("/recording.wav", body)
+
+    result = run_ingest(meeting_id, owner.id, url)
+
+    assert result["success"] is True
+    audio_file = task_db.get(AudioFile, uuid.UUID(result["audio_file_id"]))
+    assert audio_file.meeting_id == meeting_id
+    assert audio_file.file_url.endswith(f"/audio-files/{audio_file.id}.wav")
+    assert storage.objects == {("audio-files", f"{audio_file.id}.wav"): len(body)}
+    # The body reached storage one part at a time rather than in a single read
+    assert len(storage.reads) >= 3
+    assert max(storage.reads) <= MB
+
+
+def test_rejects_content_length_over_limit(task_db, redis, audio_server, storage, owner, monkeypatch):
+    monkeypatch.setattr(settings, "WEBHOOK_AUDIO_MAX_SIZE_MB", 1)
+    meeting_id = create_meeting(task_db, owner).id
+    url = audio_server.serve("/too-large.wav", wav_body(MB + 1))
+    scope, key = f"webhook_audio:{owner.id}", uuid.uuid4().hex
+    assert claim_idempotency_key(scope, key, "first-task") is None
+
+    result = run_ingest(meeting_id, owner.id, url, key)
+
+    assert result["success"] is False
+    assert "too large" in result["error"]
+    assert storage.objects == {}
+    assert task_db.query(AudioFile).filter(AudioFile.meeting_id == meeting_id).count() == 0
+    # The failed delivery released its key so a redelivery is processed again
+    assert claim_idempotency_key(scope, key, "second-task") is None
+
+
+def test_open_url_stream_checks_content_length(audio_server):
+    url = audio_server.serve("/clip.wav", wav_body(2048))
+
+    with pytest.raises(ValueError, match="too large"):
+        with open_url_stream(url, max_size=1024):
+            pass
+    with open_url_stream(url, max_size=2048) as response:
+        assert len(response.raw.read()) == 2048
+
+
+def test_repeated_delivery_returns_original_task(db, redis, owner, monkeypatch):
+    meeting = create_meeting(db, owner)
+    queued = []
+
+    class QueuedTask:
+        @staticmethod
+        def apply_async(args, task_id):
+            queued.append((args, task_id))
+
+    monkeypatch.setattr(webhook_endpoint, "ingest_remote_audio_task", QueuedTask)
+    app = FastAPI()
+    app.include_router(webhook_endpoint.router)
+    app.dependency_overrides[get_db] = lambda: db
+    app.dependency_overrides[get_current_user] = lambda: owner
+    client = TestClient(app)
+    payload = {"meeting_id": str(meeting.id), "file_url": "http://127.0.0.1/recording.wav"}
+    headers = {"Idempotency-Key": uuid.uuid4().hex}
+
+    first = client.post(f"{settings.API_V1_STR}/webhook/audio", json=payload, headers=headers)
+    second = client.post(f"{settings.API_V1_STR}/webhook/audio", json=payload, headers=headers)
+    other = client.post(f"{settings.API_V1_STR}/webhook/audio", json=payload, headers={"Idempotency-Key": uuid.uuid4().hex})
+
+    assert first.status_code == 202
+    assert first.json()["data"]["duplicate"] is False
+    assert second.status_code == 202
+    assert second.json()["data"] == {"task_id": first.json()["data"]["task_id"], "duplicate": True}
+    assert other.json()["data"]["duplicate"] is False
+    assert [task_id for _, task_id in queued] == [first.json()["data"]["task_id"], other.json()["data"]["task_id"]]